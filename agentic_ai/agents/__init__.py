@@ -1,7 +1,9 @@
 """
 Agents module for the Agentic AI Pipeline.
 """
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, BatchPromptMixin
+from .cache import LLMResultCache, bypass_cache, get_llm_cache
+from .llm_registry import LLMClientRegistry, aclose_llm_registry, get_llm_registry
 from .content_analyzer import ContentAnalyzerAgent
 from .summarizer import SummarizerAgent
 from .classifier import ClassifierAgent
@@ -10,6 +12,13 @@ from .quality_checker import QualityCheckerAgent
 
 __all__ = [
     "BaseAgent",
+    "BatchPromptMixin",
+    "LLMResultCache",
+    "bypass_cache",
+    "get_llm_cache",
+    "LLMClientRegistry",
+    "get_llm_registry",
+    "aclose_llm_registry",
     "ContentAnalyzerAgent",
     "SummarizerAgent",
     "ClassifierAgent",
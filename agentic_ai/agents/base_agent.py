@@ -1,86 +1,115 @@
 """
 Base Agent class for all specialized agents in the pipeline.
 """
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.language_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_cohere import ChatCohere
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_json_markdown
 
 from ..config.settings import settings
+from .cache import LLMResultCache, get_llm_cache, make_cache_key
+from .llm_registry import get_llm_registry
 import structlog
 
 logger = structlog.get_logger()
 
+# Response-length fields of the chat models the registry builds (Google calls it max_output_tokens).
+_MAX_TOKEN_FIELDS = ("max_tokens", "max_output_tokens")
+
 
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
 
-    def __init__(self, name: str, llm: Optional[BaseChatModel] = None):
+    def __init__(
+        self,
+        name: str,
+        llm: Optional[BaseChatModel] = None,
+        cache: Optional[LLMResultCache] = None
+    ):
         """
         Initialize the agent.
 
         Args:
             name: Agent name
             llm: Optional language model (will use default if not provided)
+            cache: Optional result cache (will use the shared cache if not provided)
         """
         self.name = name
         self.llm = llm or self._get_default_llm()
+        self.cache = cache or get_llm_cache()
+        self._prompt_fingerprints: Dict[str, str] = {}
         logger.info(f"Initialized {name} agent")
 
     def _get_default_llm(self) -> BaseChatModel:
-        """Get the default language model based on settings."""
-        provider = settings.default_llm_provider.lower()
-
-        if provider == "google":
-            if not settings.google_ai_api_key:
-                raise ValueError("GOOGLE_AI_API_KEY is required when DEFAULT_LLM_PROVIDER=google")
-            return ChatGoogleGenerativeAI(
-                model=settings.default_model,
-                google_api_key=settings.google_ai_api_key,
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens
-            )
-        elif provider == "openai":
-            if not settings.openai_api_key:
-                raise ValueError("OPENAI_API_KEY is required when DEFAULT_LLM_PROVIDER=openai")
-            return ChatOpenAI(
-                model=settings.default_model,
-                api_key=settings.openai_api_key,
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens
-            )
-        elif provider == "anthropic":
-            if not settings.anthropic_api_key:
-                raise ValueError("ANTHROPIC_API_KEY is required when DEFAULT_LLM_PROVIDER=anthropic")
-            return ChatAnthropic(
-                model=settings.default_model,
-                anthropic_api_key=settings.anthropic_api_key,
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens
-            )
-        elif provider == "cohere":
-            if not settings.cohere_api_key:
-                raise ValueError("COHERE_API_KEY is required when DEFAULT_LLM_PROVIDER=cohere")
-            return ChatCohere(
-                model=settings.default_model,
-                cohere_api_key=settings.cohere_api_key,
-                temperature=settings.temperature,
-                max_tokens=settings.max_tokens
-            )
-        else:
-            raise ValueError(
-                f"Unsupported LLM provider: {provider}. "
-                "Supported providers: google, openai, anthropic, cohere"
-            )
+        """Get the shared default language model for the configured provider."""
+        return get_llm_registry().get(
+            settings.default_llm_provider,
+            settings.default_model,
+            settings.temperature,
+            settings.max_tokens
+        )
+
+    def _invoke_chain(self, inputs: Dict[str, Any]) -> Any:
+        """Run ``self.chain`` through the result cache."""
+        key = self._cache_key(inputs)
+        hit, value = self.cache.lookup(self.name, key)
+        if hit:
+            logger.info("LLM cache hit", agent=self.name)
+            return value
+
+        result = self.chain.invoke(inputs)
+        self.cache.store(self.name, key, result)
+        return result
+
+    async def _ainvoke_chain(self, inputs: Dict[str, Any]) -> Any:
+        """Run ``self.chain`` through the result cache without blocking."""
+        key = self._cache_key(inputs)
+        hit, value = await self.cache.alookup(self.name, key)
+        if hit:
+            logger.info("LLM cache hit", agent=self.name)
+            return value
+
+        result = await self.chain.ainvoke(inputs)
+        await self.cache.astore(self.name, key, result)
+        return result
+
+    def _cache_key(
+        self,
+        inputs: Dict[str, Any],
+        prompt_attr: str = "prompt",
+        namespace: Optional[str] = None
+    ) -> str:
+        """Content-addressed key for a call of the prompt in ``prompt_attr`` with these inputs."""
+        fingerprint = self._prompt_fingerprints.get(prompt_attr)
+        if fingerprint is None:
+            fingerprint = self._prompt_fingerprints[prompt_attr] = repr(getattr(self, prompt_attr, None))
+        return make_cache_key(
+            namespace or self.name,
+            fingerprint,
+            getattr(self.llm, "model", None) or getattr(self.llm, "model_name", None),
+            getattr(self.llm, "temperature", None),
+            inputs
+        )
 
     @abstractmethod
     def process(self, *args, **kwargs) -> Any:
         """Process method to be implemented by subclasses."""
         pass
 
+    async def aprocess(self, *args, **kwargs) -> Any:
+        """
+        Async process method.
+
+        Subclasses override this with a native ``chain.ainvoke`` implementation;
+        the default runs :meth:`process` in a worker thread so it never blocks
+        the event loop.
+        """
+        return await asyncio.to_thread(self.process, *args, **kwargs)
+
     def _handle_error(self, error: Exception, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle errors consistently across agents."""
         logger.error(
@@ -93,3 +122,235 @@ class BaseAgent(ABC):
             "agent": self.name,
             "context": context
         }
+
+
+class BatchPromptMixin(ABC):
+    """
+    Packed-prompt support for agents that answer many articles per LLM call.
+
+    Agents using it define ``batch_prompt`` and :meth:`_format_batch_item`,
+    and list the mixin before :class:`BaseAgent`. Packed answers are cached
+    under ``<name>:batch`` and keyed on the batch prompt, never under the
+    single-call key: an item answered inside a packed prompt is not what the
+    single-item prompt would have returned.
+
+    Each packed call may answer ``BATCH_ITEM_TOKENS`` per item, so a full
+    batch is not cut off by the single-call ``max_tokens``; if a reply is cut
+    off anyway, the items it completed are kept.
+    """
+
+    # Response tokens allowed per packed item (agents override).
+    BATCH_ITEM_TOKENS = 300
+
+    @property
+    def _batch_namespace(self) -> str:
+        return f"{self.name}:batch"
+
+    def _batch_cache_key(self, inputs: Dict[str, Any]) -> str:
+        """Cache key for one item of a packed call."""
+        return self._cache_key(inputs, prompt_attr="batch_prompt", namespace=self._batch_namespace)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._batch_chains: Dict[int, Runnable] = {}
+
+    def _batch_chain(self, size: int) -> Runnable:
+        """``batch_prompt`` with the agent's LLM, its response budget raised to fit ``size`` items."""
+        chain = self._batch_chains.get(size)
+        if chain is None:
+            llm = self.llm
+            budget = self.BATCH_ITEM_TOKENS * size
+            field = next((f for f in _MAX_TOKEN_FIELDS if f in getattr(type(llm), "model_fields", {})), None)
+            if field is not None and (getattr(llm, field, None) or 0) < budget:
+                # A shallow copy shares the client (and its connection pool).
+                llm = llm.model_copy(update={field: budget})
+            chain = self.batch_prompt | llm | StrOutputParser()
+            self._batch_chains[size] = chain
+        return chain
+
+    def _invoke_many(self, inputs_list: List[Dict[str, Any]], batch_size: int) -> List[Optional[Any]]:
+        """
+        Answer many prompt inputs with packed ``batch_prompt`` calls.
+
+        Items answered by an earlier packed call are served from the cache; the
+        rest are sent ``batch_size`` at a time. Items the model drops, mangles
+        or cuts off come back as None so the caller can fall back to
+        single-item calls.
+
+        Args:
+            inputs_list: Single-call prompt variables, one per item
+            batch_size: Max items per packed prompt
+
+        Returns:
+            Raw per-item results in input order (None where unanswered)
+        """
+        results, pending = self._split_cached(inputs_list)
+        for chunk in self._chunks(pending, batch_size):
+            try:
+                raw = self._batch_chain(len(chunk)).invoke(self._batch_inputs(chunk))
+            except Exception as e:
+                self._log_batch_failure(e, len(chunk))
+                continue
+            for index, key, value in self._parse_batch(raw, chunk):
+                results[index] = value
+                self.cache.store(self._batch_namespace, key, value)
+        return results
+
+    async def _ainvoke_many(self, inputs_list: List[Dict[str, Any]], batch_size: int) -> List[Optional[Any]]:
+        """Async counterpart of :meth:`_invoke_many`; packed prompts run concurrently."""
+        results, pending = await self._asplit_cached(inputs_list)
+
+        async def _run_chunk(chunk: List[Tuple[int, Dict[str, Any], str]]) -> None:
+            try:
+                raw = await self._batch_chain(len(chunk)).ainvoke(self._batch_inputs(chunk))
+            except Exception as e:
+                self._log_batch_failure(e, len(chunk))
+                return
+            for index, key, value in self._parse_batch(raw, chunk):
+                results[index] = value
+                await self.cache.astore(self._batch_namespace, key, value)
+
+        await asyncio.gather(*(_run_chunk(chunk) for chunk in self._chunks(pending, batch_size)))
+        return results
+
+    def _build_many_inputs(
+        self,
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """Single-call prompt variables for each article (uses the agent's ``_build_inputs``)."""
+        return [self._build_inputs(*args) for args in self._many_args(contents, summaries)]
+
+    @staticmethod
+    def _many_args(
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]]
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Pair each content with its summary (None when no summaries were given)."""
+        return list(zip(contents, summaries or [None] * len(contents)))
+
+    def _split_cached(
+        self,
+        inputs_list: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[Any]], List[Tuple[int, Dict[str, Any], str]]]:
+        """Serve cached items; return the rest as ``(index, inputs, cache_key)``."""
+        keys = [self._batch_cache_key(inputs) for inputs in inputs_list]
+        lookups = [self.cache.lookup(self._batch_namespace, key) for key in keys]
+        return self._partition(inputs_list, keys, lookups)
+
+    async def _asplit_cached(
+        self,
+        inputs_list: List[Dict[str, Any]]
+    ) -> Tuple[List[Optional[Any]], List[Tuple[int, Dict[str, Any], str]]]:
+        """Async counterpart of :meth:`_split_cached`."""
+        keys = [self._batch_cache_key(inputs) for inputs in inputs_list]
+        lookups = [await self.cache.alookup(self._batch_namespace, key) for key in keys]
+        return self._partition(inputs_list, keys, lookups)
+
+    @staticmethod
+    def _partition(
+        inputs_list: List[Dict[str, Any]],
+        keys: List[str],
+        lookups: List[Tuple[bool, Any]]
+    ) -> Tuple[List[Optional[Any]], List[Tuple[int, Dict[str, Any], str]]]:
+        results: List[Optional[Any]] = [None] * len(inputs_list)
+        pending: List[Tuple[int, Dict[str, Any], str]] = []
+        for index, (inputs, key, (hit, value)) in enumerate(zip(inputs_list, keys, lookups)):
+            if hit:
+                results[index] = value
+            else:
+                pending.append((index, inputs, key))
+        return results, pending
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+        size = max(1, size)
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    def _batch_inputs(self, chunk: List[Tuple[int, Dict[str, Any], str]]) -> Dict[str, Any]:
+        """Prompt variables for one packed call; items are tagged with their index."""
+        return {
+            "count": len(chunk),
+            "items": "\n\n".join(
+                self._format_batch_item(str(index), inputs) for index, inputs, _ in chunk
+            )
+        }
+
+    @abstractmethod
+    def _format_batch_item(self, item_id: str, inputs: Dict[str, Any]) -> str:
+        """Render one item of a packed prompt."""
+
+    def _is_valid_batch_item(self, entry: Dict[str, Any]) -> bool:
+        """Whether a parsed batch entry has the fields a single call would return."""
+        return True
+
+    def _parse_batch(
+        self,
+        raw: Any,
+        chunk: List[Tuple[int, Dict[str, Any], str]]
+    ) -> List[Tuple[int, str, Any]]:
+        """Match a packed response back to its items as ``(index, cache_key, result)``."""
+        raw = self._load_batch_reply(raw)
+        entries = raw.get("items") or raw.get("results") if isinstance(raw, dict) else raw
+        if not isinstance(entries, list):
+            logger.warning("Batched response is not a list", agent=self.name)
+            return []
+
+        expected = {str(index): (index, key) for index, _, key in chunk}
+        parsed: Dict[int, Tuple[int, str, Any]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict) or not self._is_valid_batch_item(entry):
+                continue
+            match = expected.get(str(entry.get("id", "")).strip())
+            if match is None or match[0] in parsed:
+                continue
+            value = {k: v for k, v in entry.items() if k != "id"}
+            parsed[match[0]] = (match[0], match[1], value)
+
+        if len(parsed) < len(chunk):
+            logger.warning(
+                "Batched response missing items",
+                agent=self.name,
+                expected=len(chunk),
+                received=len(parsed)
+            )
+        return list(parsed.values())
+
+    def _load_batch_reply(self, text: Any) -> Any:
+        """Parse a packed reply; a reply cut off mid-array keeps the items it completed."""
+        if not isinstance(text, str):
+            return text
+        try:
+            # Strict json.loads: the default partial parser would "repair" the cut-off item
+            return parse_json_markdown(text, parser=json.loads)
+        except ValueError:
+            items = _complete_array_items(text)
+            logger.warning("Batched response truncated", agent=self.name, complete_items=len(items))
+            return items
+
+    def _log_batch_failure(self, error: Exception, size: int) -> None:
+        logger.warning(
+            "Batched call failed, falling back to single calls",
+            agent=self.name,
+            items=size,
+            error=str(error)
+        )
+
+
+def _complete_array_items(text: str) -> List[Any]:
+    """Every complete element of the first JSON array in ``text``, stopping where it was cut off."""
+    decoder = json.JSONDecoder()
+    items: List[Any] = []
+    pos = text.find("[") + 1
+    if pos == 0:
+        return items
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return items
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            return items
+        items.append(item)
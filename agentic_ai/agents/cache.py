@@ -0,0 +1,406 @@
+"""
+Content-addressed result cache for agent LLM calls.
+
+Results are keyed by a hash of the agent name, prompt template, model,
+temperature and the (already truncated) prompt inputs, so the same article
+text flowing through the pipeline again - re-crawls, DLQ replays, batch
+retries - is answered without another LLM round-trip.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..config.settings import settings
+import structlog
+
+logger = structlog.get_logger()
+
+# Set while a ProcessingMode.REPROCESS run is in flight: reads are skipped,
+# fresh results are still written back.
+_bypass_reads: ContextVar[bool] = ContextVar("llm_cache_bypass_reads", default=False)
+
+
+@contextmanager
+def bypass_cache() -> Iterator[None]:
+    """
+    Skip cache reads for agent calls made inside this block.
+
+    The flag lives in a context variable, so it follows asyncio tasks and
+    ``asyncio.to_thread`` calls started within the block. New results are
+    still stored, refreshing the cache for later runs.
+    """
+    token = _bypass_reads.set(True)
+    try:
+        yield
+    finally:
+        _bypass_reads.reset(token)
+
+
+def make_cache_key(
+    agent_name: str,
+    prompt_fingerprint: str,
+    model: Optional[str],
+    temperature: Optional[float],
+    inputs: Dict[str, Any]
+) -> str:
+    """
+    Build the content-addressed key for an agent call.
+
+    Args:
+        agent_name: Name of the calling agent
+        prompt_fingerprint: Stable representation of the prompt template
+        model: Model identifier of the agent's LLM
+        temperature: Sampling temperature of the agent's LLM
+        inputs: Prompt variables passed to the chain
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(
+        [agent_name, prompt_fingerprint, model, temperature, inputs],
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """Storage backend for serialized cache entries."""
+
+    name: str = "abstract"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a value with a time-to-live."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+    def size(self) -> Optional[int]:
+        """Number of stored entries, if cheap to compute."""
+        return None
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Async get; runs the blocking lookup in a worker thread by default."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Async set; runs the blocking write in a worker thread by default."""
+        await asyncio.to_thread(self.set, key, value, ttl_seconds)
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with per-entry TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> Optional[int]:
+        with self._lock:
+            return len(self._entries)
+
+    # Lookups never block, so skip the worker-thread hop.
+    async def aget(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: str, ttl_seconds: int) -> None:
+        self.set(key, value, ttl_seconds)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk cache shared by every process pointing at the same file."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= time.time():
+                self._conn.execute("DELETE FROM llm_results WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_results (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_seconds)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_results")
+            self._conn.commit()
+
+    def size(self) -> Optional[int]:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_results").fetchone()[0]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis-backed cache shared across workers and hosts."""
+
+    name = "redis"
+
+    def __init__(self, client: Any, key_prefix: str):
+        self._client = client
+        self.key_prefix = key_prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self._key(key))
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._client.set(self._key(key), value, ex=ttl_seconds)
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=f"{self.key_prefix}:*"):
+            self._client.delete(key)
+
+
+class LLMResultCache:
+    """
+    Result cache shared by all agents.
+
+    Backend failures are logged and counted but never fail the agent call:
+    a broken cache behaves like a miss.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int = 86400, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend
+            ttl_seconds: Time-to-live for new entries
+            enabled: When False every lookup is a miss and nothing is stored
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def lookup(self, agent_name: str, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for a key."""
+        if not self.enabled:
+            return False, None
+        if _bypass_reads.get():
+            self._record(agent_name, "bypassed")
+            return False, None
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            self._record_error(agent_name, "get", e)
+            return False, None
+        return self._decode(agent_name, raw)
+
+    async def alookup(self, agent_name: str, key: str) -> Tuple[bool, Any]:
+        """Async counterpart of :meth:`lookup`."""
+        if not self.enabled:
+            return False, None
+        if _bypass_reads.get():
+            self._record(agent_name, "bypassed")
+            return False, None
+        try:
+            raw = await self.backend.aget(key)
+        except Exception as e:
+            self._record_error(agent_name, "get", e)
+            return False, None
+        return self._decode(agent_name, raw)
+
+    def store(self, agent_name: str, key: str, value: Any) -> None:
+        """Store a chain result."""
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, json.dumps(value, ensure_ascii=False), self.ttl_seconds)
+            self._record(agent_name, "writes")
+        except Exception as e:
+            self._record_error(agent_name, "set", e)
+
+    async def astore(self, agent_name: str, key: str, value: Any) -> None:
+        """Async counterpart of :meth:`store`."""
+        if not self.enabled:
+            return
+        try:
+            await self.backend.aset(key, json.dumps(value, ensure_ascii=False), self.ttl_seconds)
+            self._record(agent_name, "writes")
+        except Exception as e:
+            self._record_error(agent_name, "set", e)
+
+    def clear(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters, overall and per agent."""
+        with self._lock:
+            by_agent = {name: dict(counts) for name, counts in self._stats.items()}
+
+        totals: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "bypassed": 0, "errors": 0}
+        for counts in by_agent.values():
+            for field, value in counts.items():
+                totals[field] = totals.get(field, 0) + value
+
+        lookups = totals["hits"] + totals["misses"]
+        try:
+            entries = self.backend.size()
+        except Exception:
+            entries = None
+
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend.name,
+            "ttl_seconds": self.ttl_seconds,
+            "entries": entries,
+            **totals,
+            "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+            "by_agent": by_agent,
+        }
+
+    def _decode(self, agent_name: str, raw: Optional[str]) -> Tuple[bool, Any]:
+        if raw is None:
+            self._record(agent_name, "misses")
+            return False, None
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            self._record_error(agent_name, "decode", e)
+            return False, None
+        self._record(agent_name, "hits")
+        return True, value
+
+    def _record(self, agent_name: str, field: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(
+                agent_name, {"hits": 0, "misses": 0, "writes": 0, "bypassed": 0, "errors": 0}
+            )
+            counts[field] += 1
+
+    def _record_error(self, agent_name: str, operation: str, error: Exception) -> None:
+        self._record(agent_name, "errors")
+        logger.warning(
+            "LLM cache operation failed",
+            agent=agent_name,
+            operation=operation,
+            backend=self.backend.name,
+            error=str(error)
+        )
+
+
+def _build_backend() -> CacheBackend:
+    """Create the backend selected by ``settings.llm_cache_backend``."""
+    backend = settings.llm_cache_backend.strip().lower()
+
+    if backend == "redis":
+        try:
+            from redis import Redis
+
+            client = Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                password=settings.redis_password,
+                decode_responses=True
+            )
+            return RedisCacheBackend(client, key_prefix=settings.llm_cache_redis_key_prefix)
+        except Exception as e:
+            logger.warning("LLM cache redis backend unavailable, using memory", error=str(e))
+
+    elif backend == "sqlite":
+        try:
+            return SQLiteCacheBackend(settings.llm_cache_sqlite_path)
+        except Exception as e:
+            logger.warning("LLM cache sqlite backend unavailable, using memory", error=str(e))
+
+    elif backend != "memory":
+        logger.warning("Unknown LLM cache backend, using memory", backend=backend)
+
+    return MemoryCacheBackend(max_entries=settings.llm_cache_max_entries)
+
+
+_default_cache: Optional[LLMResultCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResultCache:
+    """Return the process-wide cache configured from settings."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMResultCache(
+                backend=_build_backend(),
+                ttl_seconds=settings.llm_cache_ttl_seconds,
+                enabled=settings.llm_cache_enabled
+            )
+        return _default_cache
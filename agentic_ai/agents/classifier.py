@@ -1,19 +1,24 @@
 """
 Classifier Agent - Categorizes articles into topics.
 """
-from typing import List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from .base_agent import BaseAgent
+from ..config.settings import settings
+from .base_agent import BaseAgent, BatchPromptMixin
 import structlog
 
 logger = structlog.get_logger()
 
 
-class ClassifierAgent(BaseAgent):
+class ClassifierAgent(BatchPromptMixin, BaseAgent):
     """Agent responsible for classifying articles into topics."""
 
+    # Topics, confidences and a one-line reasoning per packed article
+    BATCH_ITEM_TOKENS = 200
+
     # Predefined topic categories
     TOPIC_CATEGORIES = [
         "Politics & Governance",
@@ -66,6 +71,33 @@ class ClassifierAgent(BaseAgent):
 
         self.chain = self.prompt | self.llm | JsonOutputParser()
 
+        # Packed prompt classifying several articles in one call
+        self.batch_prompt = ChatPromptTemplate.from_messages([
+            ("system", f"""You are an expert content classifier for government and news articles.
+            You will receive several articles, each introduced by a line "### ARTICLE <id>".
+            Classify each article independently into topic categories from this list:
+
+            {', '.join(self.TOPIC_CATEGORIES)}
+
+            Guidelines:
+            1. Select 1-5 most relevant topics per article
+            2. Order them by relevance (most relevant first)
+            3. Be specific but not overly narrow
+            4. Consider both primary and secondary topics
+
+            Return a JSON array with exactly one object per article, each with:
+            - id: the article id, copied exactly from its header
+            - topics: list of selected topics (strings)
+            - confidence: list of confidence scores (0-1) for each topic
+            - reasoning: brief explanation of classification
+            """),
+            ("user", """Classify these {count} articles:
+
+            {items}
+
+            Return the classifications:""")
+        ])
+
     def classify(self, content: str, summary: Optional[str] = None) -> List[str]:
         """
         Classify article into topic categories.
@@ -80,12 +112,35 @@ class ClassifierAgent(BaseAgent):
         try:
             logger.info("Classifying content", content_length=len(content))
 
-            summary_info = f"Summary: {summary}" if summary else ""
+            result = self._invoke_chain(self._build_inputs(content, summary))
+
+            topics = result.get("topics", [])
+            logger.info("Classification completed", topics=topics)
+
+            return topics
+
+        except Exception as e:
+            logger.error("Classification failed", error=str(e))
+            # Return default topic on error
+            return ["General"]
+
+    async def aclassify(self, content: str, summary: Optional[str] = None) -> List[str]:
+        """
+        Classify article into topic categories without blocking the event loop.
+
+        Async counterpart of :meth:`classify` built on ``chain.ainvoke``.
+
+        Args:
+            content: Article content to classify
+            summary: Optional summary to help with classification
+
+        Returns:
+            List of topic strings
+        """
+        try:
+            logger.info("Classifying content", content_length=len(content))
 
-            result = self.chain.invoke({
-                "content": content[:3000],  # Limit for classification
-                "summary_info": summary_info
-            })
+            result = await self._ainvoke_chain(self._build_inputs(content, summary))
 
             topics = result.get("topics", [])
             logger.info("Classification completed", topics=topics)
@@ -97,6 +152,93 @@ class ClassifierAgent(BaseAgent):
             # Return default topic on error
             return ["General"]
 
+    def classify_many(
+        self,
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Classify many articles, packing several into each LLM call.
+
+        Items missing from (or mangled in) a batched response are retried
+        with :meth:`classify`.
+
+        Args:
+            contents: Article contents to classify
+            summaries: Optional summaries, aligned with ``contents``
+            batch_size: Articles per prompt (defaults to settings.classifier_batch_size)
+
+        Returns:
+            List of topic lists, in input order
+        """
+        inputs_list = self._build_many_inputs(contents, summaries)
+        results = self._invoke_many(inputs_list, batch_size or settings.classifier_batch_size)
+
+        topics = [
+            result["topics"] if result is not None else self.classify(*args)
+            for result, args in zip(results, self._many_args(contents, summaries))
+        ]
+        self._log_many(results)
+        return topics
+
+    async def aclassify_many(
+        self,
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Async counterpart of :meth:`classify_many`; batches and fallbacks run concurrently.
+
+        Args:
+            contents: Article contents to classify
+            summaries: Optional summaries, aligned with ``contents``
+            batch_size: Articles per prompt (defaults to settings.classifier_batch_size)
+
+        Returns:
+            List of topic lists, in input order
+        """
+        inputs_list = self._build_many_inputs(contents, summaries)
+        results = await self._ainvoke_many(inputs_list, batch_size or settings.classifier_batch_size)
+
+        args_list = self._many_args(contents, summaries)
+        missing = [index for index, result in enumerate(results) if result is None]
+        fallbacks = await asyncio.gather(*(self.aclassify(*args_list[index]) for index in missing))
+        fallback_by_index = dict(zip(missing, fallbacks))
+
+        self._log_many(results)
+        return [
+            fallback_by_index[index] if result is None else result["topics"]
+            for index, result in enumerate(results)
+        ]
+
+    def _log_many(self, results: List[Optional[Any]]) -> None:
+        logger.info(
+            "Batch classification completed",
+            items=len(results),
+            fallbacks=sum(1 for result in results if result is None)
+        )
+
+    def _format_batch_item(self, item_id: str, inputs: Dict[str, Any]) -> str:
+        """Render one article of the batched classification prompt."""
+        return f"### ARTICLE {item_id}\nContent: {inputs['content']}\n{inputs['summary_info']}".rstrip()
+
+    def _is_valid_batch_item(self, entry: Dict[str, Any]) -> bool:
+        return isinstance(entry.get("topics"), list)
+
+    @staticmethod
+    def _build_inputs(content: str, summary: Optional[str]) -> Dict[str, Any]:
+        """Build the prompt variables for a classification call."""
+        return {
+            "content": content[:3000],  # Limit for classification
+            "summary_info": f"Summary: {summary}" if summary else ""
+        }
+
     def process(self, content: str, **kwargs) -> List[str]:
         """Process method implementation."""
         return self.classify(content, kwargs.get("summary"))
+
+    async def aprocess(self, content: str, **kwargs) -> List[str]:
+        """Async process method implementation."""
+        return await self.aclassify(content, kwargs.get("summary"))
@@ -58,10 +58,7 @@ class ContentAnalyzerAgent(BaseAgent):
         try:
             logger.info("Analyzing content", content_length=len(content))
 
-            result = self.chain.invoke({
-                "content": content[:5000],  # Limit to first 5000 chars for analysis
-                "metadata": metadata or {}
-            })
+            result = self._invoke_chain(self._build_inputs(content, metadata))
 
             logger.info("Content analysis completed", main_topic=result.get("main_topic"))
             return result
@@ -70,6 +67,43 @@ class ContentAnalyzerAgent(BaseAgent):
             logger.error("Content analysis failed", error=str(e))
             return self._handle_error(e, {"content_length": len(content)})
 
+    async def aanalyze(self, content: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Analyze article content without blocking the event loop.
+
+        Async counterpart of :meth:`analyze` built on ``chain.ainvoke``.
+
+        Args:
+            content: Article content to analyze
+            metadata: Optional metadata about the article
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        try:
+            logger.info("Analyzing content", content_length=len(content))
+
+            result = await self._ainvoke_chain(self._build_inputs(content, metadata))
+
+            logger.info("Content analysis completed", main_topic=result.get("main_topic"))
+            return result
+
+        except Exception as e:
+            logger.error("Content analysis failed", error=str(e))
+            return self._handle_error(e, {"content_length": len(content)})
+
+    @staticmethod
+    def _build_inputs(content: str, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the prompt variables for an analysis call."""
+        return {
+            "content": content[:5000],  # Limit to first 5000 chars for analysis
+            "metadata": metadata or {}
+        }
+
     def process(self, content: str, **kwargs) -> Dict[str, Any]:
         """Process method implementation."""
         return self.analyze(content, kwargs.get("metadata"))
+
+    async def aprocess(self, content: str, **kwargs) -> Dict[str, Any]:
+        """Async process method implementation."""
+        return await self.aanalyze(content, kwargs.get("metadata"))
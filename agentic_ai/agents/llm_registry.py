@@ -0,0 +1,253 @@
+"""
+Process-wide registry of chat-model clients.
+
+Every agent (and every ``AgenticPipeline``) used to build its own client, and
+with it its own HTTP connection pool. The registry hands out one client per
+``(provider, model, temperature, max_tokens)`` so agents with the same
+configuration share warm, keep-alive connections.
+
+Pool limits reach the SDKs that accept an HTTP client or its arguments:
+OpenAI and Cohere (sync and async) and Google (sync; its async calls use
+per-loop aiohttp sessions when aiohttp is installed). langchain-anthropic
+takes no HTTP client, so Anthropic keeps the SDK's own shared pool.
+"""
+import asyncio
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cohere
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_openai import ChatOpenAI
+from langchain_anthropic import ChatAnthropic
+from langchain_cohere import ChatCohere
+
+from ..config.settings import settings
+import structlog
+
+logger = structlog.get_logger()
+
+LLMKey = Tuple[str, str, float, int]
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport with one connection pool per event loop.
+
+    An httpx pool belongs to the loop that opened its connections. The Lambda
+    and Azure handlers call ``asyncio.run`` per invocation, so a warm container
+    would otherwise reuse sockets of a closed loop; here each loop gets a
+    fresh pool and pools of closed loops are dropped.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self._limits = limits
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed in [other for other in self._pools if other.is_closed()]:
+                del self._pools[closed]
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self._limits)
+            return pool
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the running loop's pool; pools of other loops are dropped with their loop."""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+
+class LLMClientRegistry:
+    """Shared chat-model clients keyed by ``(provider, model, temperature, max_tokens)``."""
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections: Max open connections per client (where the SDK accepts an HTTP client)
+            max_keepalive_connections: Idle connections kept open per client
+            keepalive_expiry: Seconds an idle connection is kept before closing
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._clients: Dict[LLMKey, BaseChatModel] = {}
+        self._http_clients: List[httpx.Client] = []
+        self._async_http_clients: List[httpx.AsyncClient] = []
+        self._lock = threading.Lock()
+        self._builders: Dict[str, Callable[[str, float, int], BaseChatModel]] = {
+            "google": self._build_google,
+            "openai": self._build_openai,
+            "anthropic": self._build_anthropic,
+            "cohere": self._build_cohere,
+        }
+
+    def get(self, provider: str, model: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        """
+        Return the shared client for this configuration, creating it on first use.
+
+        Args:
+            provider: google, openai, anthropic or cohere
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Max tokens per response
+
+        Returns:
+            Chat model shared by every caller with the same key
+        """
+        provider = provider.lower()
+        key = (provider, model, float(temperature), int(max_tokens))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                builder = self._builders.get(provider)
+                if builder is None:
+                    raise ValueError(
+                        f"Unsupported LLM provider: {provider}. "
+                        "Supported providers: google, openai, anthropic, cohere"
+                    )
+                client = builder(model, temperature, max_tokens)
+                self._clients[key] = client
+                logger.info("Created shared LLM client", provider=provider, model=model)
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def close(self) -> None:
+        """
+        Drop all clients and close the sync HTTP pools the registry created.
+
+        Async pools can only be closed from their event loop; call
+        :meth:`aclose` there instead where one is running.
+        """
+        with self._lock:
+            self._clients.clear()
+            http_clients, self._http_clients = self._http_clients, []
+            self._async_http_clients = []
+        for http_client in http_clients:
+            http_client.close()
+
+    async def aclose(self) -> None:
+        """Drop all clients and close every HTTP pool the registry created, async ones included."""
+        with self._lock:
+            async_clients, self._async_http_clients = self._async_http_clients, []
+        self.close()
+        for http_client in async_clients:
+            await http_client.aclose()
+
+    def _pooled_clients(self) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        """A sync client and a per-loop async client, both limited to ``self.limits``."""
+        http_client = httpx.Client(limits=self.limits)
+        http_async_client = httpx.AsyncClient(transport=_PerLoopTransport(self.limits))
+        self._http_clients.append(http_client)
+        self._async_http_clients.append(http_async_client)
+        return http_client, http_async_client
+
+    def _build_google(self, model: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        if not settings.google_ai_api_key:
+            raise ValueError("GOOGLE_AI_API_KEY is required when DEFAULT_LLM_PROVIDER=google")
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=settings.google_ai_api_key,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            # Passed to the SDK's httpx clients; a transport here would also
+            # be shared by the sync client, so only the limits are set.
+            client_args={"limits": self.limits}
+        )
+
+    def _build_openai(self, model: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        if not settings.openai_api_key:
+            raise ValueError("OPENAI_API_KEY is required when DEFAULT_LLM_PROVIDER=openai")
+        http_client, http_async_client = self._pooled_clients()
+        return ChatOpenAI(
+            model=model,
+            api_key=settings.openai_api_key,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            http_client=http_client,
+            http_async_client=http_async_client
+        )
+
+    def _build_anthropic(self, model: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        if not settings.anthropic_api_key:
+            raise ValueError("ANTHROPIC_API_KEY is required when DEFAULT_LLM_PROVIDER=anthropic")
+        # No http_client parameter: langchain-anthropic shares its own default pool.
+        return ChatAnthropic(
+            model=model,
+            anthropic_api_key=settings.anthropic_api_key,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    def _build_cohere(self, model: str, temperature: float, max_tokens: int) -> BaseChatModel:
+        if not settings.cohere_api_key:
+            raise ValueError("COHERE_API_KEY is required when DEFAULT_LLM_PROVIDER=cohere")
+        llm = ChatCohere(
+            model=model,
+            cohere_api_key=settings.cohere_api_key,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        # ChatCohere builds its SDK clients in a validator; swap in pooled ones.
+        http_client, http_async_client = self._pooled_clients()
+        client_args = {
+            "api_key": settings.cohere_api_key,
+            "base_url": llm.base_url,
+            "client_name": llm.user_agent,
+            "timeout": llm.timeout_seconds,
+        }
+        llm.client = cohere.Client(**client_args, httpx_client=http_client)
+        llm.async_client = cohere.AsyncClient(**client_args, httpx_client=http_async_client)
+        return llm
+
+
+_default_registry: Optional[LLMClientRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_llm_registry() -> LLMClientRegistry:
+    """Return the process-wide client registry configured from settings."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = LLMClientRegistry(
+                max_connections=settings.llm_pool_max_connections,
+                max_keepalive_connections=settings.llm_pool_max_keepalive,
+                keepalive_expiry=settings.llm_pool_keepalive_seconds
+            )
+        return _default_registry
+
+
+async def aclose_llm_registry() -> None:
+    """Close the process-wide registry's clients and pools (API / MCP shutdown)."""
+    global _default_registry
+    with _default_registry_lock:
+        registry, _default_registry = _default_registry, None
+    if registry is not None:
+        await registry.aclose()
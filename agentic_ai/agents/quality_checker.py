@@ -87,56 +87,110 @@ class QualityCheckerAgent(BaseAgent):
         try:
             logger.info("Checking quality")
 
-            # Prepare inputs for quality check
-            content_sample = original_content[:500]
-            summary_text = summary or "No summary generated"
-            topics_text = ", ".join(topics) if topics else "No topics classified"
-            sentiment_text = (
-                f"{sentiment.get('overall_sentiment', 'unknown')} "
-                f"(score: {sentiment.get('sentiment_score', 0)})"
-                if sentiment else "No sentiment analysis"
+            result = self._invoke_chain(
+                self._build_inputs(original_content, summary, topics, sentiment)
             )
+            return self._finalize_result(result)
 
-            result = self.chain.invoke({
-                "content_sample": content_sample,
-                "summary": summary_text,
-                "topics": topics_text,
-                "sentiment": sentiment_text
-            })
-
-            # Add overall score if not present
-            if "overall_score" not in result:
-                # Calculate average of component scores
-                scores = [
-                    result.get("summary_quality", 0),
-                    result.get("classification_quality", 0),
-                    result.get("sentiment_quality", 0)
-                ]
-                result["overall_score"] = sum(scores) / len(scores)
-
-            # Determine pass/fail if not present
-            if "pass" not in result:
-                result["pass"] = result["overall_score"] >= 0.7
-
-            logger.info(
-                "Quality check completed",
-                score=result["overall_score"],
-                passed=result["pass"]
-            )
+        except Exception as e:
+            logger.error("Quality check failed", error=str(e))
+            return self._fallback_result(e)
+
+    async def acheck_quality(
+        self,
+        original_content: str,
+        summary: Optional[str],
+        topics: Optional[List[str]],
+        sentiment: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Check the quality of processed outputs without blocking the event loop.
+
+        Async counterpart of :meth:`check_quality` built on ``chain.ainvoke``.
 
-            return {
-                "score": result["overall_score"],
-                "details": result,
-                "passed": result["pass"]
-            }
+        Args:
+            original_content: Original article content
+            summary: Generated summary
+            topics: Classified topics
+            sentiment: Sentiment analysis results
+
+        Returns:
+            Dictionary containing quality assessment
+        """
+        try:
+            logger.info("Checking quality")
+
+            result = await self._ainvoke_chain(
+                self._build_inputs(original_content, summary, topics, sentiment)
+            )
+            return self._finalize_result(result)
 
         except Exception as e:
             logger.error("Quality check failed", error=str(e))
-            return {
-                "score": 0.5,  # Neutral score on error
-                "details": {"error": str(e)},
-                "passed": True  # Pass through on error to avoid infinite loops
-            }
+            return self._fallback_result(e)
+
+    @staticmethod
+    def _build_inputs(
+        original_content: str,
+        summary: Optional[str],
+        topics: Optional[List[str]],
+        sentiment: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the prompt variables for a quality check call."""
+        # Prepare inputs for quality check
+        content_sample = original_content[:500]
+        summary_text = summary or "No summary generated"
+        topics_text = ", ".join(topics) if topics else "No topics classified"
+        sentiment_text = (
+            f"{sentiment.get('overall_sentiment', 'unknown')} "
+            f"(score: {sentiment.get('sentiment_score', 0)})"
+            if sentiment else "No sentiment analysis"
+        )
+
+        return {
+            "content_sample": content_sample,
+            "summary": summary_text,
+            "topics": topics_text,
+            "sentiment": sentiment_text
+        }
+
+    @staticmethod
+    def _finalize_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in missing scores and wrap the raw LLM assessment."""
+        # Add overall score if not present
+        if "overall_score" not in result:
+            # Calculate average of component scores
+            scores = [
+                result.get("summary_quality", 0),
+                result.get("classification_quality", 0),
+                result.get("sentiment_quality", 0)
+            ]
+            result["overall_score"] = sum(scores) / len(scores)
+
+        # Determine pass/fail if not present
+        if "pass" not in result:
+            result["pass"] = result["overall_score"] >= 0.7
+
+        logger.info(
+            "Quality check completed",
+            score=result["overall_score"],
+            passed=result["pass"]
+        )
+
+        return {
+            "score": result["overall_score"],
+            "details": result,
+            "passed": result["pass"]
+        }
+
+    @staticmethod
+    def _fallback_result(error: Exception) -> Dict[str, Any]:
+        """Neutral assessment returned when the quality check fails."""
+        return {
+            "score": 0.5,  # Neutral score on error
+            "details": {"error": str(error)},
+            "passed": True  # Pass through on error to avoid infinite loops
+        }
 
     def process(
         self,
@@ -148,3 +202,14 @@ class QualityCheckerAgent(BaseAgent):
     ) -> Dict[str, Any]:
         """Process method implementation."""
         return self.check_quality(original_content, summary, topics, sentiment)
+
+    async def aprocess(
+        self,
+        original_content: str,
+        summary: str = None,
+        topics: List[str] = None,
+        sentiment: Dict[str, Any] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Async process method implementation."""
+        return await self.acheck_quality(original_content, summary, topics, sentiment)
@@ -1,19 +1,24 @@
 """
 Sentiment Analyzer Agent - Analyzes emotional tone and sentiment.
 """
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from .base_agent import BaseAgent
+from ..config.settings import settings
+from .base_agent import BaseAgent, BatchPromptMixin
 import structlog
 
 logger = structlog.get_logger()
 
 
-class SentimentAnalyzerAgent(BaseAgent):
+class SentimentAnalyzerAgent(BatchPromptMixin, BaseAgent):
     """Agent responsible for analyzing sentiment and emotional tone."""
 
+    # Nine fields, key phrases included, per packed article
+    BATCH_ITEM_TOKENS = 300
+
     def __init__(self):
         """Initialize the Sentiment Analyzer Agent."""
         super().__init__(name="SentimentAnalyzer")
@@ -51,6 +56,37 @@ class SentimentAnalyzerAgent(BaseAgent):
 
         self.chain = self.prompt | self.llm | JsonOutputParser()
 
+        # Packed prompt analyzing several articles in one call
+        self.batch_prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are an expert sentiment analyzer for government and news articles.
+            You will receive several articles, each introduced by a line "### ARTICLE <id>".
+            Analyze the emotional tone and sentiment of each article independently.
+
+            Provide analysis on multiple dimensions:
+            1. Overall sentiment: positive, negative, or neutral
+            2. Emotional tone: analytical, passionate, concerned, optimistic, etc.
+            3. Objectivity: how objective vs. subjective the content is
+            4. Urgency: how urgent or time-sensitive the topic is presented
+            5. Controversy level: how controversial the topic is
+
+            Return a JSON array with exactly one object per article, each with:
+            - id: the article id, copied exactly from its header
+            - overall_sentiment: string (positive/negative/neutral)
+            - sentiment_score: float (-1 to 1, where -1 is most negative, 1 is most positive)
+            - emotional_tone: string
+            - objectivity_score: float (0 to 1, where 1 is most objective)
+            - urgency_level: string (low/medium/high)
+            - controversy_level: string (low/medium/high)
+            - key_phrases: list of strings that indicate sentiment
+            - confidence: float (0 to 1)
+            """),
+            ("user", """Analyze the sentiment of these {count} articles:
+
+            {items}
+
+            Provide sentiment analyses:""")
+        ])
+
     def analyze_sentiment(
         self,
         content: str,
@@ -69,12 +105,41 @@ class SentimentAnalyzerAgent(BaseAgent):
         try:
             logger.info("Analyzing sentiment", content_length=len(content))
 
-            summary_info = f"Summary: {summary}" if summary else ""
+            result = self._invoke_chain(self._build_inputs(content, summary))
+
+            logger.info(
+                "Sentiment analysis completed",
+                sentiment=result.get("overall_sentiment"),
+                score=result.get("sentiment_score")
+            )
 
-            result = self.chain.invoke({
-                "content": content[:4000],  # Limit for sentiment analysis
-                "summary_info": summary_info
-            })
+            return result
+
+        except Exception as e:
+            logger.error("Sentiment analysis failed", error=str(e))
+            return self._fallback_result(e)
+
+    async def aanalyze_sentiment(
+        self,
+        content: str,
+        summary: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze sentiment of the article without blocking the event loop.
+
+        Async counterpart of :meth:`analyze_sentiment` built on ``chain.ainvoke``.
+
+        Args:
+            content: Article content to analyze
+            summary: Optional summary to help with analysis
+
+        Returns:
+            Dictionary containing sentiment analysis
+        """
+        try:
+            logger.info("Analyzing sentiment", content_length=len(content))
+
+            result = await self._ainvoke_chain(self._build_inputs(content, summary))
 
             logger.info(
                 "Sentiment analysis completed",
@@ -86,18 +151,110 @@ class SentimentAnalyzerAgent(BaseAgent):
 
         except Exception as e:
             logger.error("Sentiment analysis failed", error=str(e))
-            return {
-                "overall_sentiment": "neutral",
-                "sentiment_score": 0.0,
-                "emotional_tone": "unknown",
-                "objectivity_score": 0.5,
-                "urgency_level": "medium",
-                "controversy_level": "low",
-                "key_phrases": [],
-                "confidence": 0.0,
-                "error": str(e)
-            }
+            return self._fallback_result(e)
+
+    def analyze_sentiment_many(
+        self,
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of many articles, packing several into each LLM call.
+
+        Items missing from (or mangled in) a batched response are retried
+        with :meth:`analyze_sentiment`.
+
+        Args:
+            contents: Article contents to analyze
+            summaries: Optional summaries, aligned with ``contents``
+            batch_size: Articles per prompt (defaults to settings.sentiment_batch_size)
+
+        Returns:
+            List of sentiment dictionaries, in input order
+        """
+        inputs_list = self._build_many_inputs(contents, summaries)
+        results = self._invoke_many(inputs_list, batch_size or settings.sentiment_batch_size)
+
+        analyses = [
+            result if result is not None else self.analyze_sentiment(*args)
+            for result, args in zip(results, self._many_args(contents, summaries))
+        ]
+        self._log_many(results)
+        return analyses
+
+    async def aanalyze_sentiment_many(
+        self,
+        contents: List[str],
+        summaries: Optional[List[Optional[str]]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of :meth:`analyze_sentiment_many`; batches and fallbacks run concurrently.
+
+        Args:
+            contents: Article contents to analyze
+            summaries: Optional summaries, aligned with ``contents``
+            batch_size: Articles per prompt (defaults to settings.sentiment_batch_size)
+
+        Returns:
+            List of sentiment dictionaries, in input order
+        """
+        inputs_list = self._build_many_inputs(contents, summaries)
+        results = await self._ainvoke_many(inputs_list, batch_size or settings.sentiment_batch_size)
+
+        args_list = self._many_args(contents, summaries)
+        missing = [index for index, result in enumerate(results) if result is None]
+        fallbacks = await asyncio.gather(*(self.aanalyze_sentiment(*args_list[index]) for index in missing))
+        fallback_by_index = dict(zip(missing, fallbacks))
+
+        self._log_many(results)
+        return [
+            fallback_by_index[index] if result is None else result
+            for index, result in enumerate(results)
+        ]
+
+    def _log_many(self, results: List[Optional[Any]]) -> None:
+        logger.info(
+            "Batch sentiment analysis completed",
+            items=len(results),
+            fallbacks=sum(1 for result in results if result is None)
+        )
+
+    def _format_batch_item(self, item_id: str, inputs: Dict[str, Any]) -> str:
+        """Render one article of the batched sentiment prompt."""
+        return f"### ARTICLE {item_id}\n{inputs['content']}\n{inputs['summary_info']}".rstrip()
+
+    def _is_valid_batch_item(self, entry: Dict[str, Any]) -> bool:
+        return entry.get("overall_sentiment") in ("positive", "negative", "neutral")
+
+    @staticmethod
+    def _build_inputs(content: str, summary: Optional[str]) -> Dict[str, Any]:
+        """Build the prompt variables for a sentiment call."""
+        return {
+            "content": content[:4000],  # Limit for sentiment analysis
+            "summary_info": f"Summary: {summary}" if summary else ""
+        }
+
+    @staticmethod
+    def _fallback_result(error: Exception) -> Dict[str, Any]:
+        """Neutral sentiment returned when analysis fails."""
+        return {
+            "overall_sentiment": "neutral",
+            "sentiment_score": 0.0,
+            "emotional_tone": "unknown",
+            "objectivity_score": 0.5,
+            "urgency_level": "medium",
+            "controversy_level": "low",
+            "key_phrases": [],
+            "confidence": 0.0,
+            "error": str(error)
+        }
 
     def process(self, content: str, **kwargs) -> Dict[str, Any]:
         """Process method implementation."""
         return self.analyze_sentiment(content, kwargs.get("summary"))
+
+    async def aprocess(self, content: str, **kwargs) -> Dict[str, Any]:
+        """Async process method implementation."""
+        return await self.aanalyze_sentiment(content, kwargs.get("summary"))
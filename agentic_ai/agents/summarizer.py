@@ -60,19 +60,7 @@ class SummarizerAgent(BaseAgent):
         try:
             logger.info("Generating summary", content_length=len(content))
 
-            # Build context information from analysis
-            context_info = ""
-            if analyzed_content:
-                context_info = f"""
-                Context from analysis:
-                - Main topic: {analyzed_content.get('main_topic', 'N/A')}
-                - Key entities: {', '.join(analyzed_content.get('entities', {}).get('people', [])[:3])}
-                """
-
-            summary = self.chain.invoke({
-                "content": content,
-                "context_info": context_info
-            })
+            summary = self._invoke_chain(self._build_inputs(content, analyzed_content))
 
             logger.info("Summary generated", summary_length=len(summary))
             return summary.strip()
@@ -82,6 +70,57 @@ class SummarizerAgent(BaseAgent):
             error_result = self._handle_error(e, {"content_length": len(content)})
             return f"Error generating summary: {error_result['error']}"
 
+    async def asummarize(
+        self,
+        content: str,
+        analyzed_content: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate a summary of the article without blocking the event loop.
+
+        Async counterpart of :meth:`summarize` built on ``chain.ainvoke``.
+
+        Args:
+            content: Article content to summarize
+            analyzed_content: Optional pre-analyzed content structure
+
+        Returns:
+            Summary string
+        """
+        try:
+            logger.info("Generating summary", content_length=len(content))
+
+            summary = await self._ainvoke_chain(self._build_inputs(content, analyzed_content))
+
+            logger.info("Summary generated", summary_length=len(summary))
+            return summary.strip()
+
+        except Exception as e:
+            logger.error("Summarization failed", error=str(e))
+            error_result = self._handle_error(e, {"content_length": len(content)})
+            return f"Error generating summary: {error_result['error']}"
+
+    @staticmethod
+    def _build_inputs(content: str, analyzed_content: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the prompt variables for a summarization call."""
+        # Build context information from analysis
+        context_info = ""
+        if analyzed_content:
+            context_info = f"""
+            Context from analysis:
+            - Main topic: {analyzed_content.get('main_topic', 'N/A')}
+            - Key entities: {', '.join(analyzed_content.get('entities', {}).get('people', [])[:3])}
+            """
+
+        return {
+            "content": content,
+            "context_info": context_info
+        }
+
     def process(self, content: str, **kwargs) -> str:
         """Process method implementation."""
         return self.summarize(content, kwargs.get("analyzed_content"))
+
+    async def aprocess(self, content: str, **kwargs) -> str:
+        """Async process method implementation."""
+        return await self.asummarize(content, kwargs.get("analyzed_content"))
@@ -17,6 +17,7 @@ import asyncio
 import logging
 import time
 import traceback
+from contextlib import asynccontextmanager, nullcontext
 from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -113,14 +114,34 @@ def _require_pipeline():
     return p
 
 
+def _cache_scope(mode: str):
+    """Reprocess requests skip cached agent results and write fresh ones."""
+    if mode == "reprocess":
+        from agentic_ai.agents.cache import bypass_cache
+
+        return bypass_cache()
+    return nullcontext()
+
+
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    yield
+    if _pipeline is not None:
+        # Close the shared LLM connection pools on this (the serving) event loop.
+        from agentic_ai.agents.llm_registry import aclose_llm_registry
+
+        await aclose_llm_registry()
+
+
 app = FastAPI(
     title="SynthoraAI Agentic Pipeline API",
     version="1.0.0",
     description="HTTP bridge for the Python LangGraph article-processing pipeline",
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -163,7 +184,8 @@ async def process_article(req: ProcessRequest):
             "title": req.article.title or "",
             **(req.article.metadata or {}),
         }
-        result = await pipeline.process_article(article_data)
+        with _cache_scope(req.mode):
+            result = await pipeline.process_article(article_data)
         duration = (time.monotonic() - start) * 1000
         return ProcessResult(
             article_id=req.article.article_id,
@@ -189,27 +211,29 @@ async def analyze_content(req: AnalyzeRequest):
     results: Dict[str, Any] = {}
 
     try:
+        # The individual analyses are independent, so run them concurrently
+        pending: Dict[str, Any] = {}
         if req.analysis_type in ("content", "full"):
-            results["content_analysis"] = await pipeline.content_analyzer.analyze(
-                req.content, {}
-            )
+            pending["content_analysis"] = pipeline.content_analyzer.aanalyze(req.content, {})
 
         if req.analysis_type in ("sentiment", "full"):
-            results["sentiment"] = await pipeline.sentiment_analyzer.analyze_sentiment(
-                req.content
-            )
+            pending["sentiment"] = pipeline.sentiment_analyzer.aanalyze_sentiment(req.content)
 
         if req.analysis_type in ("classification", "full"):
-            results["classification"] = await pipeline.classifier.classify(req.content)
+            pending["classification"] = pipeline.classifier.aclassify(req.content)
 
         if req.analysis_type in ("summary", "full"):
-            results["summary"] = await pipeline.summarizer.summarize(req.content)
+            pending["summary"] = pipeline.summarizer.asummarize(req.content)
+
+        if pending:
+            values = await asyncio.gather(*pending.values())
+            results.update(zip(pending.keys(), values))
 
         if req.analysis_type in ("quality", "full"):
             summary = results.get("summary", "")
             topics = results.get("classification", [])
             sentiment = results.get("sentiment", {})
-            results["quality"] = await pipeline.quality_checker.check_quality(
+            results["quality"] = await pipeline.quality_checker.acheck_quality(
                 req.content, summary, topics, sentiment
             )
 
@@ -225,7 +249,17 @@ async def process_batch(req: BatchRequest):
     pipeline = _require_pipeline()
     start = time.monotonic()
 
-    async def _process_one(article: ArticlePayload) -> ProcessResult:
+    # Classify and sentiment-score the whole batch with packed prompts up front;
+    # on failure every article falls back to its own agent calls.
+    precomputed: list = [None] * len(req.articles)
+    if len(req.articles) > 1:
+        try:
+            with _cache_scope(req.mode):
+                precomputed = await pipeline.precompute_batch([a.content for a in req.articles])
+        except Exception as exc:
+            logger.warning("batch precompute failed, processing articles individually: %s", exc)
+
+    async def _process_one(article: ArticlePayload, batch_outputs: Optional[dict]) -> ProcessResult:
         t0 = time.monotonic()
         try:
             article_data = {
@@ -235,7 +269,8 @@ async def process_batch(req: BatchRequest):
                 "source": article.source or "",
                 "title": article.title or "",
             }
-            result = await pipeline.process_article(article_data)
+            with _cache_scope(req.mode):
+                result = await pipeline.process_article(article_data, precomputed=batch_outputs)
             return ProcessResult(
                 article_id=article.article_id,
                 status="completed",
@@ -255,11 +290,11 @@ async def process_batch(req: BatchRequest):
     # Process with bounded concurrency (max 5 at a time)
     semaphore = asyncio.Semaphore(5)
 
-    async def _guarded(article: ArticlePayload) -> ProcessResult:
+    async def _guarded(article: ArticlePayload, batch_outputs: Optional[dict]) -> ProcessResult:
         async with semaphore:
-            return await _process_one(article)
+            return await _process_one(article, batch_outputs)
 
-    results = await asyncio.gather(*[_guarded(a) for a in req.articles])
+    results = await asyncio.gather(*[_guarded(a, p) for a, p in zip(req.articles, precomputed)])
     total_ms = round((time.monotonic() - start) * 1000, 2)
 
     succeeded = sum(1 for r in results if r.status == "completed")
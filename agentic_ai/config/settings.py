@@ -61,6 +61,9 @@ class Settings(BaseSettings):
     default_model: str = Field(default="gemini-1.5-flash", description="Default model name")
     temperature: float = Field(default=0.7, description="LLM temperature")
     max_tokens: int = Field(default=2000, description="Max tokens for LLM responses")
+    llm_pool_max_connections: int = Field(default=20, description="Max HTTP connections per shared LLM client")
+    llm_pool_max_keepalive: int = Field(default=10, description="Idle keep-alive connections per shared LLM client")
+    llm_pool_keepalive_seconds: float = Field(default=30.0, description="Keep-alive expiry for LLM client connections")
 
     # Vector Store Configuration
     pinecone_api_key: Optional[str] = Field(default=None, description="Pinecone API key")
@@ -77,6 +80,14 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, description="Redis database number")
     redis_password: Optional[str] = Field(default=None, description="Redis password")
 
+    # LLM Result Cache
+    llm_cache_enabled: bool = Field(default=True, description="Cache agent LLM results by content hash")
+    llm_cache_backend: str = Field(default="memory", description="LLM cache backend: memory, sqlite or redis")
+    llm_cache_ttl_seconds: int = Field(default=86400, description="LLM cache entry TTL in seconds")
+    llm_cache_max_entries: int = Field(default=2048, description="Max entries for the in-memory LLM cache")
+    llm_cache_sqlite_path: str = Field(default=".cache/llm_results.sqlite3", description="SQLite LLM cache file")
+    llm_cache_redis_key_prefix: str = Field(default="synthora:llm-cache", description="Redis key prefix for LLM cache entries")
+
     # AWS Configuration
     aws_region: str = Field(default="us-east-1", description="AWS region")
     aws_access_key_id: Optional[str] = Field(default=None, description="AWS access key")
@@ -93,6 +104,8 @@ class Settings(BaseSettings):
     max_iterations: int = Field(default=10, description="Max agent iterations")
     agent_timeout: int = Field(default=300, description="Agent timeout in seconds")
     enable_human_in_loop: bool = Field(default=False, description="Enable human-in-the-loop")
+    classifier_batch_size: int = Field(default=10, description="Articles packed into one batched classification prompt")
+    sentiment_batch_size: int = Field(default=8, description="Articles packed into one batched sentiment prompt")
 
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, description="Rate limit requests per minute")
@@ -2,9 +2,11 @@
 Assembly Line Architecture for Agentic AI Pipeline using LangGraph.
 This implements a sophisticated multi-agent system with state management.
 """
+import asyncio
 from typing import Dict, Any, List, Optional, TypedDict, Annotated
 from enum import Enum
 import operator
+from contextlib import nullcontext
 from datetime import datetime
 
 from langgraph.graph import StateGraph, END
@@ -16,10 +18,29 @@ from ..agents.summarizer import SummarizerAgent
 from ..agents.classifier import ClassifierAgent
 from ..agents.sentiment_analyzer import SentimentAnalyzerAgent
 from ..agents.quality_checker import QualityCheckerAgent
+from ..agents.cache import bypass_cache
 import structlog
 
 logger = structlog.get_logger()
 
+# Overall and per-component quality score needed to skip a retry
+QUALITY_THRESHOLD = 0.7
+
+# Quality checker component score -> pipeline stage that produced the output
+_COMPONENT_STAGES = {
+    "summary_quality": "summarization",
+    "classification_quality": "classification",
+    "sentiment_quality": "sentiment_analysis",
+}
+
+# Result fields that batch pre-computation can fill, and the stage each replaces
+_PRECOMPUTABLE_STAGES = {
+    "topics": "classification",
+    "sentiment": "sentiment_analysis",
+}
+
+_GENERATING_STAGES = ["content_analysis", "summarization", "classification", "sentiment_analysis"]
+
 
 class PipelineStage(str, Enum):
     """Pipeline stages in the assembly line."""
@@ -61,6 +82,11 @@ class AgentState(TypedDict):
     should_continue: bool
     next_stage: Optional[str]
 
+    # Incremental re-execution: stages to run on this pass (None means all);
+    # outputs of the other stages are kept from the previous pass
+    stages_to_run: Optional[List[str]]
+    stage_scores: Optional[Dict[str, float]]
+
 
 class AgenticPipeline:
     """
@@ -121,6 +147,9 @@ class AgenticPipeline:
             {
                 "output": "output",
                 "content_analysis": "content_analysis",
+                "summarization": "summarization",
+                "classification": "classification",
+                "sentiment_analysis": "sentiment_analysis",
                 END: END
             }
         )
@@ -150,17 +179,21 @@ class AgenticPipeline:
 
         return state
 
-    def _content_analysis_node(self, state: AgentState) -> AgentState:
+    async def _content_analysis_node(self, state: AgentState) -> AgentState:
         """Content analysis stage."""
         logger.info("Pipeline stage: CONTENT_ANALYSIS", article_id=state.get("article_id"))
 
         state["current_stage"] = PipelineStage.CONTENT_ANALYSIS
 
+        if not self._should_run(state, PipelineStage.CONTENT_ANALYSIS):
+            return state
+
         try:
-            result = self.content_analyzer.analyze(
-                content=state["raw_content"],
-                metadata={"url": state.get("url"), "source": state.get("source")}
-            )
+            with self._cache_scope(state):
+                result = await self.content_analyzer.aanalyze(
+                    content=state["raw_content"],
+                    metadata={"url": state.get("url"), "source": state.get("source")}
+                )
             state["analyzed_content"] = result
             state["messages"].append(
                 AIMessage(content="Content analysis completed")
@@ -171,17 +204,21 @@ class AgenticPipeline:
 
         return state
 
-    def _summarization_node(self, state: AgentState) -> AgentState:
+    async def _summarization_node(self, state: AgentState) -> AgentState:
         """Summarization stage."""
         logger.info("Pipeline stage: SUMMARIZATION", article_id=state.get("article_id"))
 
         state["current_stage"] = PipelineStage.SUMMARIZATION
 
+        if not self._should_run(state, PipelineStage.SUMMARIZATION):
+            return state
+
         try:
-            summary = self.summarizer.summarize(
-                content=state["raw_content"],
-                analyzed_content=state.get("analyzed_content")
-            )
+            with self._cache_scope(state):
+                summary = await self.summarizer.asummarize(
+                    content=state["raw_content"],
+                    analyzed_content=state.get("analyzed_content")
+                )
             state["summary"] = summary
             state["messages"].append(
                 AIMessage(content="Summarization completed")
@@ -192,17 +229,21 @@ class AgenticPipeline:
 
         return state
 
-    def _classification_node(self, state: AgentState) -> AgentState:
+    async def _classification_node(self, state: AgentState) -> AgentState:
         """Classification stage."""
         logger.info("Pipeline stage: CLASSIFICATION", article_id=state.get("article_id"))
 
         state["current_stage"] = PipelineStage.CLASSIFICATION
 
+        if not self._should_run(state, PipelineStage.CLASSIFICATION):
+            return state
+
         try:
-            topics = self.classifier.classify(
-                content=state["raw_content"],
-                summary=state.get("summary")
-            )
+            with self._cache_scope(state):
+                topics = await self.classifier.aclassify(
+                    content=state["raw_content"],
+                    summary=state.get("summary")
+                )
             state["topics"] = topics
             state["messages"].append(
                 AIMessage(content=f"Classification completed: {', '.join(topics)}")
@@ -213,17 +254,21 @@ class AgenticPipeline:
 
         return state
 
-    def _sentiment_analysis_node(self, state: AgentState) -> AgentState:
+    async def _sentiment_analysis_node(self, state: AgentState) -> AgentState:
         """Sentiment analysis stage."""
         logger.info("Pipeline stage: SENTIMENT_ANALYSIS", article_id=state.get("article_id"))
 
         state["current_stage"] = PipelineStage.SENTIMENT_ANALYSIS
 
+        if not self._should_run(state, PipelineStage.SENTIMENT_ANALYSIS):
+            return state
+
         try:
-            sentiment = self.sentiment_analyzer.analyze_sentiment(
-                content=state["raw_content"],
-                summary=state.get("summary")
-            )
+            with self._cache_scope(state):
+                sentiment = await self.sentiment_analyzer.aanalyze_sentiment(
+                    content=state["raw_content"],
+                    summary=state.get("summary")
+                )
             state["sentiment"] = sentiment
             state["messages"].append(
                 AIMessage(content="Sentiment analysis completed")
@@ -234,14 +279,14 @@ class AgenticPipeline:
 
         return state
 
-    def _quality_check_node(self, state: AgentState) -> AgentState:
+    async def _quality_check_node(self, state: AgentState) -> AgentState:
         """Quality check stage."""
         logger.info("Pipeline stage: QUALITY_CHECK", article_id=state.get("article_id"))
 
         state["current_stage"] = PipelineStage.QUALITY_CHECK
 
         try:
-            quality_result = self.quality_checker.check_quality(
+            quality_result = await self.quality_checker.acheck_quality(
                 original_content=state["raw_content"],
                 summary=state.get("summary"),
                 topics=state.get("topics"),
@@ -249,14 +294,25 @@ class AgenticPipeline:
             )
 
             state["quality_score"] = quality_result["score"]
+            state["stage_scores"] = {
+                stage: quality_result["details"][component]
+                for component, stage in _COMPONENT_STAGES.items()
+                if isinstance(quality_result.get("details", {}).get(component), (int, float))
+            }
 
             # Determine if we should continue or retry
-            if quality_result["score"] < 0.7 and state["iteration"] < settings.max_iterations:
+            if quality_result["score"] < QUALITY_THRESHOLD and state["iteration"] < settings.max_iterations:
+                rerun = self._stages_to_rerun(state["stage_scores"])
                 state["iteration"] = state.get("iteration", 0) + 1
                 state["should_continue"] = True
-                state["next_stage"] = "content_analysis"  # Retry from content analysis
+                state["stages_to_run"] = rerun
+                # Retry only the failing stages, or everything from content analysis
+                state["next_stage"] = rerun[0] if rerun else "content_analysis"
                 state["messages"].append(
-                    AIMessage(content=f"Quality check failed (score: {quality_result['score']}), retrying...")
+                    AIMessage(
+                        content=f"Quality check failed (score: {quality_result['score']}), "
+                        f"retrying {', '.join(rerun) if rerun else 'all stages'}..."
+                    )
                 )
             else:
                 state["should_continue"] = True
@@ -272,6 +328,48 @@ class AgenticPipeline:
 
         return state
 
+    @staticmethod
+    def _should_run(state: AgentState, stage: PipelineStage) -> bool:
+        """Whether a stage runs on this pass or keeps its memoized output."""
+        stages = state.get("stages_to_run")
+        if stages is None or stage.value in stages:
+            return True
+        logger.info(
+            "Stage output memoized, skipping",
+            stage=stage.value,
+            article_id=state.get("article_id")
+        )
+        return False
+
+    @staticmethod
+    def _stages_to_rerun(stage_scores: Dict[str, float]) -> Optional[List[str]]:
+        """
+        Pick the stages to re-run after a failed quality check.
+
+        Only stages whose component score is below the threshold are re-run.
+        Returns None (re-run everything) when no component score explains the
+        failure or when every scored component failed.
+        """
+        failing = [
+            stage for stage in _COMPONENT_STAGES.values()
+            if stage in stage_scores and stage_scores[stage] < QUALITY_THRESHOLD
+        ]
+        if not failing or len(failing) == len(_COMPONENT_STAGES):
+            return None
+        return failing
+
+    @staticmethod
+    def _cache_scope(state: AgentState):
+        """
+        Cache policy for an agent call.
+
+        Quality-loop retries exist to get different outputs, so they skip
+        cached results (fresh results are still written back).
+        """
+        if state.get("iteration", 0) > 1:
+            return bypass_cache()
+        return nullcontext()
+
     def _output_node(self, state: AgentState) -> AgentState:
         """Final output node."""
         logger.info("Pipeline stage: OUTPUT", article_id=state.get("article_id"))
@@ -289,12 +387,56 @@ class AgenticPipeline:
         next_stage = state.get("next_stage", "output")
         return next_stage
 
-    async def process_article(self, article_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def precompute_batch(
+        self,
+        contents: List[str],
+        include_sentiment: bool = True,
+        summaries: Optional[List[Optional[str]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify (and sentiment-score) many articles with packed prompts.
+
+        The results are meant to be handed back to :meth:`process_article`
+        as ``precomputed`` so those stages skip their per-article LLM call.
+
+        Batching runs before the per-article summarizer, so an article
+        without a given summary is classified and scored from its content
+        alone, where the per-article nodes would also see the summary.
+        Summarizing first would cost the per-article calls batching saves;
+        callers that need identical results pass ``summaries`` or skip
+        pre-computation.
+
+        Args:
+            contents: Article contents
+            include_sentiment: Also run batched sentiment analysis
+            summaries: Existing summaries aligned with ``contents`` (None entries allowed)
+
+        Returns:
+            One ``{"topics": ..., "sentiment": ...}`` dict per article, in input order
+        """
+        tasks = [self.classifier.aclassify_many(contents, summaries)]
+        if include_sentiment:
+            tasks.append(self.sentiment_analyzer.aanalyze_sentiment_many(contents, summaries))
+        results = await asyncio.gather(*tasks)
+
+        precomputed: List[Dict[str, Any]] = [{"topics": topics} for topics in results[0]]
+        if include_sentiment:
+            for entry, sentiment in zip(precomputed, results[1]):
+                entry["sentiment"] = sentiment
+        return precomputed
+
+    async def process_article(
+        self,
+        article_data: Dict[str, Any],
+        precomputed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Process an article through the entire pipeline.
 
         Args:
             article_data: Dictionary containing article information
+            precomputed: Optional ``topics``/``sentiment`` from :meth:`precompute_batch`;
+                their stages are skipped on the first pass
 
         Returns:
             Dictionary with processed results
@@ -318,9 +460,22 @@ class AgenticPipeline:
             "messages": [],
             "errors": [],
             "should_continue": True,
-            "next_stage": None
+            "next_stage": None,
+            "stages_to_run": None,
+            "stage_scores": None
         }
 
+        if precomputed:
+            skipped = set()
+            for field, stage in _PRECOMPUTABLE_STAGES.items():
+                if precomputed.get(field) is not None:
+                    initial_state[field] = precomputed[field]
+                    skipped.add(stage)
+            if skipped:
+                initial_state["stages_to_run"] = [
+                    stage for stage in _GENERATING_STAGES if stage not in skipped
+                ]
+
         try:
             # Run the pipeline
             final_state = await self.app.ainvoke(initial_state)
@@ -63,7 +63,9 @@ class ArticleBatchProcessor:
     Articles are sorted by priority before processing.  A semaphore
     limits the number of concurrent pipeline invocations.  Failed
     articles are retried up to ``max_retries`` times using a fresh
-    supervisor call.
+    supervisor call.  Classification and sentiment for the whole batch
+    are computed up front with packed multi-article prompts, so each
+    supervisor call skips those steps.
 
     Example::
 
@@ -75,6 +77,8 @@ class ArticleBatchProcessor:
             article processing to.
         concurrency: Maximum number of articles processed simultaneously.
         max_retries: Maximum per-article retry attempts on failure.
+        batch_prompts: Pre-compute classification/sentiment with batched
+            prompts.  Disable to run every agent per article.
     """
 
     def __init__(
@@ -82,10 +86,12 @@ class ArticleBatchProcessor:
         supervisor: ContentSupervisor,
         concurrency: int = _DEFAULT_CONCURRENCY,
         max_retries: int = _DEFAULT_MAX_RETRIES,
+        batch_prompts: bool = True,
     ) -> None:
         self._supervisor = supervisor
         self._concurrency = concurrency
         self._max_retries = max_retries
+        self._batch_prompts = batch_prompts
 
     # ------------------------------------------------------------------
     # Primary entry points
@@ -126,11 +132,12 @@ class ArticleBatchProcessor:
                 return 0
 
         sorted_articles = sorted(articles, key=_safe_priority, reverse=True)
+        precomputed = await self._precompute(sorted_articles, mode, batch_id)
 
         semaphore = asyncio.Semaphore(self._concurrency)
         tasks = [
-            self._process_one(article, mode, semaphore, batch_id)
-            for article in sorted_articles
+            self._process_one(article, mode, semaphore, batch_id, precomputed.get(index))
+            for index, article in enumerate(sorted_articles)
         ]
         item_results: list[dict[str, Any]] = await asyncio.gather(*tasks, return_exceptions=False)
 
@@ -205,12 +212,40 @@ class ArticleBatchProcessor:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _precompute(
+        self,
+        articles: list[dict[str, Any]],
+        mode: str,
+        batch_id: str,
+    ) -> dict[int, dict[str, Any]]:
+        """Run batched classification/sentiment for articles with content.
+
+        A failure here only costs the optimisation: the affected articles
+        fall back to per-article agent calls inside the supervisor.
+
+        Returns:
+            Pre-computed outputs keyed by position in ``articles``.
+        """
+        indexed = [(i, a) for i, a in enumerate(articles) if a.get("content")]
+        if not self._batch_prompts or len(indexed) < 2:
+            return {}
+
+        try:
+            outputs = await self._supervisor.precompute_batch([a for _, a in indexed], mode=mode)
+        except Exception as exc:
+            logger.warning("batch_processor.precompute_failed", batch_id=batch_id, error=str(exc))
+            return {}
+
+        logger.info("batch_processor.precomputed", batch_id=batch_id, articles=len(outputs))
+        return {i: output for (i, _), output in zip(indexed, outputs)}
+
     async def _process_one(
         self,
         article: dict[str, Any],
         mode: str,
         semaphore: asyncio.Semaphore,
         batch_id: str,
+        precomputed: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Process a single article, retrying on failure.
 
@@ -219,6 +254,7 @@ class ArticleBatchProcessor:
             mode: Processing mode.
             semaphore: Concurrency limiter.
             batch_id: Parent batch identifier for log correlation.
+            precomputed: Batched classifier/sentiment outputs for this article.
 
         Returns:
             Per-article result dictionary with keys: ``article_id``, ``status``,
@@ -249,7 +285,9 @@ class ArticleBatchProcessor:
         async with semaphore:
             while retries <= self._max_retries:
                 try:
-                    result = await self._supervisor.process_article(article, mode=mode)
+                    result = await self._supervisor.process_article(
+                        article, mode=mode, precomputed=precomputed
+                    )
                     if result.get("error"):
                         raise RuntimeError(str(result["error"]))
 
@@ -1,19 +1,22 @@
 """
 Content supervisor for the SynthoraAI orchestration layer.
 
-Wraps the existing :class:`~agentic_ai.core.pipeline.AgenticPipeline`
-and adds routing, cost budgeting, parallel execution planning, and
-quality gate logic on top of the LangGraph assembly line.
+Drives the agents of an :class:`~agentic_ai.core.pipeline.AgenticPipeline`
+and adds routing, cost budgeting, dependency-aware parallel execution,
+and quality gate logic on top of the LangGraph assembly line.
 """
 from __future__ import annotations
 
 import asyncio
 import uuid
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import structlog
 
+from ..agents.cache import bypass_cache
+from ..config.settings import settings
 from ..core.pipeline import AgenticPipeline
 from .cost_budget import CostBudgetManager
 from .types import (
@@ -32,6 +35,19 @@ _QUALITY_THRESHOLD: float = 0.7
 _ESTIMATED_INPUT_TOKENS: int = 1500
 _ESTIMATED_OUTPUT_TOKENS: int = 500
 
+# Batch pre-computed result field -> agent whose plan step it replaces
+_PRECOMPUTED_AGENTS: dict[str, str] = {
+    "topics": "classifier",
+    "sentiment": "sentiment-analyzer",
+}
+
+# Quality-check component score -> agent re-run when that component fails
+_COMPONENT_AGENTS: dict[str, str] = {
+    "summary_quality": "summarizer",
+    "classification_quality": "classifier",
+    "sentiment_quality": "sentiment-analyzer",
+}
+
 
 def _utc_now() -> str:
     """Return the current UTC timestamp as an ISO-8601 string."""
@@ -39,14 +55,14 @@ def _utc_now() -> str:
 
 
 class ContentSupervisor:
-    """Orchestrates article processing via the underlying LangGraph pipeline.
+    """Orchestrates article processing using the pipeline's agents.
 
     The supervisor adds the following concerns on top of
     :class:`~agentic_ai.core.pipeline.AgenticPipeline`:
 
     - Article routing based on content heuristics.
     - Execution plan construction with topological dependency resolution.
-    - Parallel step execution via :func:`asyncio.gather`.
+    - Step execution that starts each agent once its ``depends_on`` steps finish.
     - Cost estimation and budget enforcement.
     - Quality gate with configurable threshold.
 
@@ -84,6 +100,7 @@ class ContentSupervisor:
         self,
         article: dict[str, Any],
         mode: str = "full",
+        precomputed: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Process a single article through the supervised pipeline.
 
@@ -92,7 +109,7 @@ class ContentSupervisor:
         1. **Classify** — determine routing and agents.
         2. **Build plan** — topological ordering of execution steps.
         3. **Budget check** — abort early if the cost estimate is unaffordable.
-        4. **Execute** — run parallel step groups via ``asyncio.gather``.
+        4. **Execute** — run plan steps concurrently as their dependencies finish.
         5. **Quality gate** — flag low-scoring results.
 
         Args:
@@ -100,6 +117,8 @@ class ContentSupervisor:
                 and ``"content"``.  Optional keys: ``"url"``, ``"source"``.
             mode: Processing mode string matching :class:`~agentic_ai.orchestration.types.ProcessingMode`
                 (``"full"``, ``"fast"``, ``"enrich"``, ``"reprocess"``).
+            precomputed: Optional ``topics``/``sentiment`` from
+                :meth:`precompute_batch`; the matching plan steps are skipped.
 
         Returns:
             Merged result dictionary containing pipeline outputs plus
@@ -138,8 +157,10 @@ class ContentSupervisor:
                 "plan_id": plan.plan_id,
             }
 
-        # 4. Execute plan
-        pipeline_result = await self.execute_plan(plan, article)
+        # 4. Execute plan (reprocess runs ignore cached agent results)
+        cache_scope = bypass_cache() if processing_mode == ProcessingMode.REPROCESS else nullcontext()
+        with cache_scope:
+            pipeline_result = await self.execute_plan(plan, article, precomputed)
 
         # 5. Quality gate — missing score is treated as failed (not assumed passing)
         quality_score: Optional[float] = pipeline_result.get("quality_score")
@@ -258,11 +279,15 @@ class ContentSupervisor:
         dependency chains.  For the current pipeline topology:
 
         - ``content-analyzer`` runs first (no dependencies).
-        - ``summarizer`` and ``classifier`` depend on ``content-analyzer``
-          and can run in parallel with each other.
-        - ``sentiment-analyzer`` depends on ``summarizer``.
+        - ``summarizer``, ``classifier`` and ``sentiment-analyzer`` depend
+          on ``content-analyzer`` and run in parallel.  The classifier and
+          sentiment analyzer read the article content only, as batch
+          pre-computation does, so they need not wait for the summary.
         - ``quality-checker`` depends on all prior steps.
 
+        A full plan is therefore three LLM round-trips deep; a fast plan
+        (summarizer and classifier) is one.
+
         Args:
             routing: The :class:`~agentic_ai.orchestration.types.ArticleRouting`
                 produced by :meth:`classify_article`.
@@ -281,16 +306,16 @@ class ContentSupervisor:
                     step_id="step-summarizer",
                     agent_id="summarizer",
                     depends_on=[],
-                    can_run_parallel=False,
+                    can_run_parallel=True,
                 ),
                 ExecutionStep(
                     step_id="step-classifier",
                     agent_id="classifier",
-                    depends_on=["step-summarizer"],
-                    can_run_parallel=False,
+                    depends_on=[],
+                    can_run_parallel=True,
                 ),
             ]
-            parallel_groups = [["step-summarizer"], ["step-classifier"]]
+            parallel_groups = [["step-summarizer", "step-classifier"]]
         else:
             # Full / enrich / reprocess share the same topology
             steps = [
@@ -315,8 +340,8 @@ class ContentSupervisor:
                 ExecutionStep(
                     step_id="step-sentiment-analyzer",
                     agent_id="sentiment-analyzer",
-                    depends_on=["step-summarizer"],
-                    can_run_parallel=False,
+                    depends_on=["step-content-analyzer"],
+                    can_run_parallel=True,
                 ),
                 ExecutionStep(
                     step_id="step-quality-checker",
@@ -332,8 +357,7 @@ class ContentSupervisor:
             ]
             parallel_groups = [
                 ["step-content-analyzer"],
-                ["step-summarizer", "step-classifier"],
-                ["step-sentiment-analyzer"],
+                ["step-summarizer", "step-classifier", "step-sentiment-analyzer"],
                 ["step-quality-checker"],
             ]
 
@@ -346,6 +370,35 @@ class ContentSupervisor:
             parallel_groups=parallel_groups,
         )
 
+    async def precompute_batch(
+        self,
+        articles: list[dict[str, Any]],
+        mode: str = "full",
+    ) -> list[dict[str, Any]]:
+        """Classify (and sentiment-score) a batch of articles with packed prompts.
+
+        Sentiment is only computed for modes whose plan runs the
+        sentiment analyzer. The returned dicts are meant to be passed back
+        to :meth:`process_article` as ``precomputed``. Articles carrying a
+        ``summary`` are classified with it; the rest from content alone (see
+        :meth:`~agentic_ai.core.pipeline.AgenticPipeline.precompute_batch`).
+
+        Args:
+            articles: Article payload dicts.
+            mode: Processing mode the articles will be processed with.
+
+        Returns:
+            One dict per article, in input order.
+        """
+        processing_mode = self._coerce_mode(mode)
+        cache_scope = bypass_cache() if processing_mode == ProcessingMode.REPROCESS else nullcontext()
+        with cache_scope:
+            return await self._pipeline.precompute_batch(
+                [article.get("content", "") for article in articles],
+                include_sentiment=processing_mode != ProcessingMode.FAST,
+                summaries=[article.get("summary") for article in articles],
+            )
+
     # ------------------------------------------------------------------
     # Plan execution
     # ------------------------------------------------------------------
@@ -354,44 +407,50 @@ class ContentSupervisor:
         self,
         plan: ExecutionPlan,
         article: dict[str, Any],
+        precomputed: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
         """Execute an :class:`~agentic_ai.orchestration.types.ExecutionPlan`.
 
-        Parallel groups (as specified in ``plan.parallel_groups``) are executed
-        using :func:`asyncio.gather`.  Sequential groups are awaited in order.
+        Every step is dispatched to the pipeline agent matching its
+        ``agent_id`` as soon as all of the steps listed in its
+        ``depends_on`` have finished, so independent steps (e.g. the
+        summarizer, classifier and sentiment analyzer after content
+        analysis) run concurrently. A runner only reads the outputs of steps
+        it depends on. A step that raises is recorded in ``errors`` and its
+        dependents still run with whatever upstream outputs are available,
+        mirroring the error handling of the LangGraph nodes.
 
-        The final output is produced by delegating to the underlying
-        :class:`~agentic_ai.core.pipeline.AgenticPipeline`.
+        Like the LangGraph quality loop, a quality score below the threshold
+        re-runs the steps whose component scored low (all of them when no
+        component explains the failure), bypassing cached results, and then
+        the quality check, up to ``settings.max_iterations`` passes.
 
         Args:
             plan: The execution plan to run.
             article: The article payload dictionary.
+            precomputed: Optional ``topics``/``sentiment`` outputs; steps of
+                the agents that produce them are skipped.
 
         Returns:
-            Pipeline result dictionary from
-            :meth:`~agentic_ai.core.pipeline.AgenticPipeline.process_article`.
+            Result dictionary with the same keys as
+            :meth:`~agentic_ai.core.pipeline.AgenticPipeline.process_article`
+            plus ``step_durations_ms`` (summed over passes). ``iterations``
+            counts the passes, as in the LangGraph pipeline.
+
+        Raises:
+            ValueError: If a step depends on an unknown step or the
+                dependencies contain a cycle.
         """
+        ordered_steps = _topological_order(plan.steps)
+
         logger.info(
             "supervisor.execute_plan.start",
             plan_id=plan.plan_id,
             article_id=plan.article_id,
+            steps=len(ordered_steps),
             groups=len(plan.parallel_groups),
         )
 
-        # Log the parallel groups for observability without actually dispatching
-        # individual step coroutines — the real execution is handled by the
-        # existing AgenticPipeline which orchestrates the LangGraph graph.
-        for group in plan.parallel_groups:
-            if len(group) > 1:
-                logger.debug(
-                    "supervisor.execute_plan.parallel_group",
-                    plan_id=plan.plan_id,
-                    group=group,
-                )
-                # Simulate concurrent scheduling awareness (real work is in pipeline)
-                await asyncio.gather(*[asyncio.sleep(0) for _ in group])
-
-        # Normalise the article dict to match what AgenticPipeline.process_article expects
         normalised = {
             "id": article.get("id") or article.get("article_id") or plan.article_id,
             "content": article.get("content", ""),
@@ -399,19 +458,202 @@ class ContentSupervisor:
             "source": article.get("source", ""),
         }
 
-        result = await self._pipeline.process_article(normalised)
+        outputs: dict[str, Any] = {
+            agent_id: precomputed[field]
+            for field, agent_id in _PRECOMPUTED_AGENTS.items()
+            if precomputed and precomputed.get(field) is not None
+        }
+        seeded = set(outputs)
+        errors: list[str] = []
+        durations: dict[str, float] = {}
+        tasks: dict[str, asyncio.Task[None]] = {}
+        runners = self._step_runners()
+        loop = asyncio.get_running_loop()
+
+        async def _run_step(step: ExecutionStep) -> None:
+            # On a retry pass, steps that are not re-run keep their outputs
+            await asyncio.gather(*(tasks[dep] for dep in step.depends_on if dep in tasks))
+
+            if step.agent_id in seeded:
+                logger.debug(
+                    "supervisor.execute_plan.step_precomputed",
+                    plan_id=plan.plan_id,
+                    step_id=step.step_id,
+                )
+                durations[step.step_id] = 0.0
+                return
+
+            runner = runners.get(step.agent_id)
+            if runner is None:
+                logger.warning(
+                    "supervisor.execute_plan.unknown_agent",
+                    plan_id=plan.plan_id,
+                    step_id=step.step_id,
+                    agent_id=step.agent_id,
+                )
+                errors.append(f"{step.agent_id} error: no runner for agent")
+                return
+
+            t0 = loop.time()
+            try:
+                outputs[step.agent_id] = await runner(normalised, outputs)
+            except Exception as exc:
+                logger.error(
+                    "supervisor.execute_plan.step_failed",
+                    plan_id=plan.plan_id,
+                    step_id=step.step_id,
+                    error=str(exc),
+                )
+                errors.append(f"{step.agent_id} error: {exc}")
+            finally:
+                elapsed_ms = (loop.time() - t0) * 1000
+                durations[step.step_id] = round(durations.get(step.step_id, 0.0) + elapsed_ms, 2)
+
+            logger.debug(
+                "supervisor.execute_plan.step_complete",
+                plan_id=plan.plan_id,
+                step_id=step.step_id,
+                duration_ms=durations[step.step_id],
+            )
+
+        async def _run_pass(steps: list[ExecutionStep]) -> None:
+            tasks.clear()
+            for step in steps:
+                tasks[step.step_id] = asyncio.create_task(_run_step(step))
+            await asyncio.gather(*tasks.values())
+
+        await _run_pass(ordered_steps)
+
+        iterations = 1
+        quality_step = next((s for s in ordered_steps if s.agent_id == "quality-checker"), None)
+        while quality_step is not None and iterations < settings.max_iterations:
+            retry = self._steps_to_retry(ordered_steps, outputs.get("quality-checker"))
+            if not retry:
+                break
+            iterations += 1
+            logger.info(
+                "supervisor.execute_plan.quality_retry",
+                plan_id=plan.plan_id,
+                iteration=iterations,
+                steps=[step.step_id for step in retry],
+            )
+            seeded.difference_update(step.agent_id for step in retry)
+            outputs.pop("quality-checker", None)
+            with bypass_cache():
+                await _run_pass(retry + [quality_step])
+
+        quality: Optional[dict[str, Any]] = outputs.get("quality-checker")
+        result: dict[str, Any] = {
+            "article_id": normalised["id"],
+            "summary": outputs.get("summarizer"),
+            "topics": outputs.get("classifier") or [],
+            "sentiment": outputs.get("sentiment-analyzer"),
+            "quality_score": quality.get("score") if quality else None,
+            "analyzed_content": outputs.get("content-analyzer"),
+            "iterations": iterations,
+            "errors": errors,
+            "timestamp": _utc_now(),
+            "step_durations_ms": durations,
+        }
 
         logger.info(
             "supervisor.execute_plan.complete",
             plan_id=plan.plan_id,
             article_id=plan.article_id,
+            errors=len(errors),
         )
         return result
 
+    # ------------------------------------------------------------------
+    # Step runners
+    # ------------------------------------------------------------------
+
+    def _step_runners(
+        self,
+    ) -> dict[str, Callable[[dict[str, Any], dict[str, Any]], Awaitable[Any]]]:
+        """Return the coroutine that executes each known ``agent_id``.
+
+        Each runner receives the normalised article and the outputs of the
+        steps completed so far (keyed by ``agent_id``) and awaits the
+        agent's native async method so independent steps overlap.
+        """
+        pipeline = self._pipeline
+
+        async def content_analyzer(article: dict[str, Any], outputs: dict[str, Any]) -> Any:
+            return await pipeline.content_analyzer.aanalyze(
+                article["content"],
+                {"url": article.get("url"), "source": article.get("source")},
+            )
+
+        async def summarizer(article: dict[str, Any], outputs: dict[str, Any]) -> Any:
+            return await pipeline.summarizer.asummarize(
+                article["content"],
+                outputs.get("content-analyzer"),
+            )
+
+        # The classifier and sentiment analyzer run beside the summarizer,
+        # so they read the article content only
+        async def classifier(article: dict[str, Any], outputs: dict[str, Any]) -> Any:
+            return await pipeline.classifier.aclassify(article["content"], None)
+
+        async def sentiment_analyzer(article: dict[str, Any], outputs: dict[str, Any]) -> Any:
+            return await pipeline.sentiment_analyzer.aanalyze_sentiment(article["content"], None)
+
+        async def quality_checker(article: dict[str, Any], outputs: dict[str, Any]) -> Any:
+            return await pipeline.quality_checker.acheck_quality(
+                article["content"],
+                outputs.get("summarizer"),
+                outputs.get("classifier"),
+                outputs.get("sentiment-analyzer"),
+            )
+
+        return {
+            "content-analyzer": content_analyzer,
+            "summarizer": summarizer,
+            "classifier": classifier,
+            "sentiment-analyzer": sentiment_analyzer,
+            "quality-checker": quality_checker,
+        }
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _steps_to_retry(
+        steps: list[ExecutionStep],
+        quality: Optional[dict[str, Any]],
+    ) -> list[ExecutionStep]:
+        """Return the plan steps to re-run after a failed quality check.
+
+        Mirrors :meth:`~agentic_ai.core.pipeline.AgenticPipeline._stages_to_rerun`:
+        only steps whose component score is below the threshold are re-run,
+        or every step before the quality check when no component score
+        explains the failure or every scored component failed.
+
+        Args:
+            steps: Plan steps in topological order.
+            quality: Output of the quality-checker step, if it ran.
+
+        Returns:
+            Steps to re-run, in topological order; empty when the check passed
+            or produced no score.
+        """
+        score = quality.get("score") if quality else None
+        if score is None or score >= _QUALITY_THRESHOLD:
+            return []
+        details = quality.get("details") or {}
+        failing = {
+            agent_id
+            for component, agent_id in _COMPONENT_AGENTS.items()
+            if isinstance(details.get(component), (int, float)) and details[component] < _QUALITY_THRESHOLD
+        }
+        candidates = [step for step in steps if step.agent_id != "quality-checker"]
+        retry = [step for step in candidates if step.agent_id in failing]
+        if not retry or len(failing) == len(_COMPONENT_AGENTS):
+            return candidates
+        return retry
+
     @staticmethod
     def _coerce_mode(mode: str) -> ProcessingMode:
         """Convert a string mode into a :class:`~agentic_ai.orchestration.types.ProcessingMode`.
@@ -451,10 +693,42 @@ class ContentSupervisor:
 
 
 # ---------------------------------------------------------------------------
-# Serialisation helper (module-level to avoid circular import)
+# Module-level helpers
 # ---------------------------------------------------------------------------
 
 
+def _topological_order(steps: list[ExecutionStep]) -> list[ExecutionStep]:
+    """Order plan steps so every step follows its dependencies (Kahn's algorithm).
+
+    Args:
+        steps: Steps of an :class:`ExecutionPlan`.
+
+    Returns:
+        The same steps in dependency order; ties keep the plan order.
+
+    Raises:
+        ValueError: On unknown dependencies or dependency cycles.
+    """
+    by_id = {step.step_id: step for step in steps}
+    for step in steps:
+        unknown = [dep for dep in step.depends_on if dep not in by_id]
+        if unknown:
+            raise ValueError(f"Step {step.step_id!r} depends on unknown steps: {unknown}")
+
+    remaining = {step.step_id: set(step.depends_on) for step in steps}
+    ordered: list[ExecutionStep] = []
+    while remaining:
+        ready = [step_id for step_id, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Execution plan has a dependency cycle: {sorted(remaining)}")
+        for step_id in ready:
+            ordered.append(by_id[step_id])
+            del remaining[step_id]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return ordered
+
+
 def _routing_to_dict(routing: ArticleRouting) -> dict[str, Any]:
     """Convert an :class:`ArticleRouting` to a plain dictionary."""
     return {
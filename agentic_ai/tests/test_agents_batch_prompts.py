@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_openai import ChatOpenAI
+
+from agentic_ai.agents.base_agent import BaseAgent, BatchPromptMixin
+from agentic_ai.agents.cache import LLMResultCache, MemoryCacheBackend
+from agentic_ai.agents.classifier import ClassifierAgent
+from agentic_ai.agents.sentiment_analyzer import SentimentAnalyzerAgent
+from agentic_ai.agents.summarizer import SummarizerAgent
+from agentic_ai.core.pipeline import AgenticPipeline
+
+
+def _agent(monkeypatch, agent_cls, responses: list[str]):
+    llm = FakeListChatModel(responses=responses)
+    monkeypatch.setattr(BaseAgent, "_get_default_llm", lambda self: llm)
+    agent = agent_cls()
+    agent.cache = LLMResultCache(MemoryCacheBackend(), ttl_seconds=60)
+    return agent, llm
+
+
+@pytest.mark.asyncio
+async def test_classify_many_packs_articles_and_falls_back_for_dropped_items(monkeypatch) -> None:
+    batch_response = json.dumps([
+        {"id": "0", "topics": ["Energy"], "confidence": [0.9], "reasoning": "grid"},
+        {"id": "2", "topics": "Healthcare"},  # mangled: topics must be a list
+        {"id": "9", "topics": ["Education"]},  # unknown id
+    ])
+    single_response = '{"topics": ["Healthcare"]}'
+    agent, llm = _agent(monkeypatch, ClassifierAgent, [batch_response, single_response, single_response])
+
+    topics = await agent.aclassify_many(
+        ["power grid upgrade", "hospital funding", "clinic staffing"], batch_size=3
+    )
+
+    # one packed call plus one single-item fallback each for items 1 and 2
+    assert topics == [["Energy"], ["Healthcare"], ["Healthcare"]]
+    assert llm.i == 0  # all three responses consumed (the fake model wraps around)
+
+
+@pytest.mark.asyncio
+async def test_truncated_batch_reply_falls_back_only_for_cut_off_items(monkeypatch) -> None:
+    # The reply ran out of tokens inside the third item
+    truncated = '[{"id": "0", "topics": ["Energy"]}, {"id": "1", "topics": ["Transport"]}, {"id": "2", "topics": ["Hea'
+    single_response = '{"topics": ["Healthcare"]}'
+    agent, llm = _agent(monkeypatch, ClassifierAgent, [truncated, single_response])
+
+    topics = await agent.aclassify_many(["power grid upgrade", "new rail line", "hospital funding"], batch_size=3)
+
+    assert topics == [["Energy"], ["Transport"], ["Healthcare"]]
+    assert llm.i == 0  # one packed call and a single fallback
+
+
+def test_batch_reply_budget_scales_with_batch_size(monkeypatch) -> None:
+    agent, _ = _agent(monkeypatch, SentimentAnalyzerAgent, [])
+    agent.llm = ChatOpenAI(model="gpt-4o-mini", api_key="test", max_tokens=2000)
+
+    assert agent._batch_chain(4).middle[0] is agent.llm  # 4 x 300 fits the configured budget
+    assert agent._batch_chain(10).middle[0].max_tokens == 10 * SentimentAnalyzerAgent.BATCH_ITEM_TOKENS
+    assert agent._batch_chain(10) is agent._batch_chain(10)
+    assert agent.llm.max_tokens == 2000
+
+
+@pytest.mark.asyncio
+async def test_precompute_batch_passes_summaries_through(monkeypatch) -> None:
+    pipeline = AgenticPipeline.__new__(AgenticPipeline)
+    pipeline.classifier = SimpleNamespace(aclassify_many=AsyncMock(return_value=[["Energy"], ["Health"]]))
+    pipeline.sentiment_analyzer = SimpleNamespace(aanalyze_sentiment_many=AsyncMock(return_value=[{}, {}]))
+
+    await pipeline.precompute_batch(["a", "b"], summaries=["summary a", None])
+    pipeline.classifier.aclassify_many.assert_awaited_once_with(["a", "b"], ["summary a", None])
+    pipeline.sentiment_analyzer.aanalyze_sentiment_many.assert_awaited_once_with(["a", "b"], ["summary a", None])
+
+    # Without summaries the batch works from the content alone
+    await pipeline.precompute_batch(["a", "b"], include_sentiment=False)
+    assert pipeline.classifier.aclassify_many.await_args.args == (["a", "b"], None)
+
+
+@pytest.mark.asyncio
+async def test_batched_results_are_cached_apart_from_single_calls(monkeypatch) -> None:
+    batch_response = json.dumps([
+        {"id": "0", "overall_sentiment": "positive", "sentiment_score": 0.6},
+        {"id": "1", "overall_sentiment": "negative", "sentiment_score": -0.4},
+    ])
+    single_response = '{"overall_sentiment": "neutral", "sentiment_score": 0.0}'
+    agent, llm = _agent(monkeypatch, SentimentAnalyzerAgent, [batch_response, single_response])
+
+    analyses = agent.analyze_sentiment_many(["new park opens", "bridge closed"])
+    assert [a["overall_sentiment"] for a in analyses] == ["positive", "negative"]
+
+    # A single-article call never reads what a packed prompt answered
+    single = await agent.aanalyze_sentiment("bridge closed")
+    assert single == {"overall_sentiment": "neutral", "sentiment_score": 0.0}
+    assert agent.cache.stats()["hits"] == 0
+
+    # but the same batch again is answered from the batch entries
+    again = await agent.aanalyze_sentiment_many(["new park opens", "bridge closed"])
+    assert again == analyses
+    assert agent.cache.stats()["hits"] == 2
+    assert llm.i == 0  # only the two responses above were used
+
+
+def test_batching_is_a_capability_of_the_mixin() -> None:
+    assert issubclass(ClassifierAgent, BatchPromptMixin)
+    assert not issubclass(SummarizerAgent, BatchPromptMixin)
+
+    class Incomplete(BatchPromptMixin, BaseAgent):
+        def process(self, *args, **kwargs):
+            return None
+
+    with pytest.raises(TypeError, match="_format_batch_item"):
+        Incomplete("incomplete")
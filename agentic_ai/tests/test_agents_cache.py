@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+from agentic_ai.agents.cache import (
+    LLMResultCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    bypass_cache,
+    make_cache_key,
+)
+
+
+def test_cache_key_depends_on_every_component() -> None:
+    base = make_cache_key("Summarizer", "prompt-v1", "gemini-1.5-flash", 0.7, {"content": "text"})
+
+    assert base == make_cache_key("Summarizer", "prompt-v1", "gemini-1.5-flash", 0.7, {"content": "text"})
+    assert base != make_cache_key("Classifier", "prompt-v1", "gemini-1.5-flash", 0.7, {"content": "text"})
+    assert base != make_cache_key("Summarizer", "prompt-v2", "gemini-1.5-flash", 0.7, {"content": "text"})
+    assert base != make_cache_key("Summarizer", "prompt-v1", "gpt-4o-mini", 0.7, {"content": "text"})
+    assert base != make_cache_key("Summarizer", "prompt-v1", "gemini-1.5-flash", 0.2, {"content": "text"})
+    assert base != make_cache_key("Summarizer", "prompt-v1", "gemini-1.5-flash", 0.7, {"content": "other"})
+
+
+def test_memory_backend_evicts_least_recently_used_and_expired() -> None:
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", "1", ttl_seconds=60)
+    backend.set("b", "2", ttl_seconds=60)
+    assert backend.get("a") == "1"  # refresh "a"
+    backend.set("c", "3", ttl_seconds=60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+
+    backend.set("d", "4", ttl_seconds=0)
+    assert backend.get("d") is None
+
+
+def test_sqlite_backend_persists_across_instances(tmp_path) -> None:
+    path = str(tmp_path / "cache" / "llm.sqlite3")
+    SQLiteCacheBackend(path).set("k", '{"topics": ["Energy"]}', ttl_seconds=60)
+
+    reopened = SQLiteCacheBackend(path)
+    assert reopened.get("k") == '{"topics": ["Energy"]}'
+    assert reopened.size() == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_misses_and_reprocess_bypass() -> None:
+    cache = LLMResultCache(MemoryCacheBackend(), ttl_seconds=60)
+
+    assert await cache.alookup("Classifier", "k") == (False, None)
+    await cache.astore("Classifier", "k", {"topics": ["Energy"]})
+    assert await cache.alookup("Classifier", "k") == (True, {"topics": ["Energy"]})
+
+    with bypass_cache():
+        assert await cache.alookup("Classifier", "k") == (False, None)
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bypassed"] == 1
+    assert stats["writes"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["by_agent"]["Classifier"]["hits"] == 1
+
+
+def test_backend_failures_behave_like_misses() -> None:
+    class _BrokenBackend(MemoryCacheBackend):
+        def get(self, key: str):
+            raise ConnectionError("redis down")
+
+    cache = LLMResultCache(_BrokenBackend(), ttl_seconds=60)
+
+    assert cache.lookup("Summarizer", "k") == (False, None)
+    assert cache.stats()["errors"] == 1
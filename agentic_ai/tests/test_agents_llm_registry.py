@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from agentic_ai.agents import llm_registry
+from agentic_ai.agents.classifier import ClassifierAgent
+from agentic_ai.agents.llm_registry import LLMClientRegistry, _PerLoopTransport
+from agentic_ai.agents.summarizer import SummarizerAgent
+from agentic_ai.config.settings import settings
+
+
+@pytest.fixture
+def openai_settings(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "default_llm_provider", "openai")
+    monkeypatch.setattr(settings, "default_model", "gpt-4o-mini")
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+
+
+def test_registry_shares_clients_per_configuration(openai_settings) -> None:
+    registry = LLMClientRegistry(max_connections=5, max_keepalive_connections=2, keepalive_expiry=10)
+
+    first = registry.get("openai", "gpt-4o-mini", 0.7, 2000)
+
+    assert registry.get("OpenAI", "gpt-4o-mini", 0.7, 2000) is first
+    assert registry.get("openai", "gpt-4o-mini", 0.2, 2000) is not first
+    assert registry.get("openai", "gpt-4o-mini", 0.7, 500) is not first
+    assert len(registry) == 3
+    assert first.http_client is not None
+    assert registry.limits.max_connections == 5
+
+    registry.close()
+    assert len(registry) == 0
+
+
+def test_registry_rejects_unknown_provider_and_missing_key(monkeypatch) -> None:
+    registry = LLMClientRegistry()
+    monkeypatch.setattr(settings, "anthropic_api_key", None)
+
+    with pytest.raises(ValueError, match="Unsupported LLM provider"):
+        registry.get("mystery", "model", 0.7, 100)
+    with pytest.raises(ValueError, match="ANTHROPIC_API_KEY"):
+        registry.get("anthropic", "claude", 0.7, 100)
+    assert len(registry) == 0
+
+
+def test_agents_with_identical_settings_share_one_client(monkeypatch, openai_settings) -> None:
+    registry = LLMClientRegistry()
+    monkeypatch.setattr(llm_registry, "_default_registry", registry)
+
+    summarizer = SummarizerAgent()
+    classifier = ClassifierAgent()
+
+    assert summarizer.llm is classifier.llm
+    assert len(registry) == 1
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_survives_a_new_event_loop_per_invocation(local_server) -> None:
+    # Lambda / Azure handlers call asyncio.run per invocation with the same warm clients.
+    transport = _PerLoopTransport(httpx.Limits(max_connections=2))
+    client = httpx.AsyncClient(transport=transport)
+
+    async def invoke() -> str:
+        return (await client.get(local_server)).text
+
+    assert asyncio.run(invoke()) == "ok"
+    assert asyncio.run(invoke()) == "ok"
+    # The first loop is closed, so its pool was dropped rather than reused.
+    assert len(transport) == 1
+    asyncio.run(client.aclose())
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_async_pools(openai_settings, monkeypatch) -> None:
+    registry = LLMClientRegistry()
+    monkeypatch.setattr(settings, "cohere_api_key", "test-key")
+    registry.get("openai", "gpt-4o-mini", 0.7, 2000)
+    registry.get("cohere", "command-r", 0.7, 2000)
+    async_clients = list(registry._async_http_clients)
+    assert len(async_clients) == 2
+
+    await registry.aclose()
+
+    assert len(registry) == 0
+    assert all(client.is_closed for client in async_clients)
+
+
+
+def test_google_client_gets_the_pool_limits(monkeypatch) -> None:
+    registry = LLMClientRegistry(max_connections=7)
+    monkeypatch.setattr(settings, "google_ai_api_key", "test-key")
+
+    llm = registry.get("google", "gemini-2.0-flash", 0.7, 2000)
+
+    assert llm.client_args == {"limits": registry.limits}
+    registry.close()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from agentic_ai.agents.base_agent import BaseAgent
+from agentic_ai.core.pipeline import AgenticPipeline
+
+
+def _counting(calls: Counter, name: str, result):
+    async def _call(*args, **kwargs):
+        calls[name] += 1
+        return result
+
+    return _call
+
+
+def _quality_sequence(calls: Counter, results: list[dict]):
+    async def _check(*args, **kwargs):
+        calls["quality"] += 1
+        details = results.pop(0)
+        return {"score": details["overall_score"], "details": details, "passed": details["overall_score"] >= 0.7}
+
+    return _check
+
+
+@pytest.fixture
+def pipeline(monkeypatch) -> AgenticPipeline:
+    monkeypatch.setattr(BaseAgent, "_get_default_llm", lambda self: FakeListChatModel(responses=["{}"]))
+    return AgenticPipeline()
+
+
+def _install_fakes(pipeline: AgenticPipeline, calls: Counter, quality_results: list[dict]) -> None:
+    pipeline.content_analyzer = SimpleNamespace(aanalyze=_counting(calls, "analyze", {"main_topic": "x"}))
+    pipeline.summarizer = SimpleNamespace(asummarize=_counting(calls, "summarize", "summary"))
+    pipeline.classifier = SimpleNamespace(aclassify=_counting(calls, "classify", ["Energy"]))
+    pipeline.sentiment_analyzer = SimpleNamespace(
+        aanalyze_sentiment=_counting(calls, "sentiment", {"overall_sentiment": "neutral"})
+    )
+    pipeline.quality_checker = SimpleNamespace(acheck_quality=_quality_sequence(calls, quality_results))
+
+
+@pytest.mark.asyncio
+async def test_quality_retry_reruns_only_failing_stages(pipeline) -> None:
+    calls: Counter = Counter()
+    _install_fakes(
+        pipeline,
+        calls,
+        [
+            {"overall_score": 0.6, "summary_quality": 0.4, "classification_quality": 0.9, "sentiment_quality": 0.8},
+            {"overall_score": 0.85, "summary_quality": 0.8, "classification_quality": 0.9, "sentiment_quality": 0.8},
+        ],
+    )
+
+    result = await pipeline.process_article({"id": "art-1", "content": "text " * 200})
+
+    assert result["quality_score"] == 0.85
+    assert calls == Counter(analyze=1, summarize=2, classify=1, sentiment=1, quality=2)
+
+
+@pytest.mark.asyncio
+async def test_quality_retry_without_component_scores_reruns_everything(pipeline) -> None:
+    calls: Counter = Counter()
+    _install_fakes(
+        pipeline,
+        calls,
+        [
+            {"overall_score": 0.5},
+            {"overall_score": 0.9},
+        ],
+    )
+
+    await pipeline.process_article({"id": "art-2", "content": "text " * 200})
+
+    assert calls == Counter(analyze=2, summarize=2, classify=2, sentiment=2, quality=2)
+
+
+@pytest.mark.asyncio
+async def test_precomputed_outputs_skip_their_stages(pipeline) -> None:
+    calls: Counter = Counter()
+    _install_fakes(pipeline, calls, [{"overall_score": 0.9}])
+
+    result = await pipeline.process_article(
+        {"id": "art-3", "content": "text " * 200},
+        precomputed={"topics": ["Transportation"], "sentiment": {"overall_sentiment": "positive"}},
+    )
+
+    assert result["topics"] == ["Transportation"]
+    assert result["sentiment"] == {"overall_sentiment": "positive"}
+    assert calls == Counter(analyze=1, summarize=1, quality=1)
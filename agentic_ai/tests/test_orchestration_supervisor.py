@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_ai.orchestration.supervisor import ContentSupervisor
+from agentic_ai.orchestration.types import ArticleRouting, ExecutionPlan, ExecutionStep, ProcessingMode
+
+
+class _RecordingAgent:
+    def __init__(self, name: str, calls: list, result, delay: float = 0.05) -> None:
+        self._name = name
+        self._calls = calls
+        self._result = result
+        self._delay = delay
+
+    async def __call__(self, *args, **kwargs):
+        started = time.monotonic()
+        await asyncio.sleep(self._delay)
+        self._calls.append((self._name, started, time.monotonic(), args))
+        return self._result
+
+
+def _fake_pipeline(calls: list) -> SimpleNamespace:
+    return SimpleNamespace(
+        content_analyzer=SimpleNamespace(aanalyze=_RecordingAgent("analyze", calls, {"main_topic": "budget"})),
+        summarizer=SimpleNamespace(asummarize=_RecordingAgent("summarize", calls, "short summary")),
+        classifier=SimpleNamespace(aclassify=_RecordingAgent("classify", calls, ["Economy & Finance"])),
+        sentiment_analyzer=SimpleNamespace(
+            aanalyze_sentiment=_RecordingAgent("sentiment", calls, {"overall_sentiment": "neutral"})
+        ),
+        quality_checker=SimpleNamespace(
+            acheck_quality=_RecordingAgent("quality", calls, {"score": 0.9, "passed": True})
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_runs_independent_steps_concurrently() -> None:
+    calls: list = []
+    supervisor = ContentSupervisor(pipeline=_fake_pipeline(calls))
+    routing = ArticleRouting(article_id="art-1", primary_agent="content-analyzer")
+    plan = supervisor.build_execution_plan(routing, "full")
+
+    result = await supervisor.execute_plan(plan, {"id": "art-1", "content": "x" * 800})
+
+    # analysis, then summary / topics / sentiment together, then quality
+    assert len(plan.parallel_groups) == 3
+    by_name = {name: (start, end, args) for name, start, end, args in calls}
+    assert set(by_name) == {"analyze", "summarize", "classify", "sentiment", "quality"}
+
+    for name in ("summarize", "classify", "sentiment"):
+        assert by_name[name][0] >= by_name["analyze"][1]
+    assert by_name["classify"][0] < by_name["summarize"][1]
+    assert by_name["sentiment"][0] < by_name["summarize"][1]
+    assert by_name["summarize"][2][1] == {"main_topic": "budget"}
+    assert by_name["classify"][2][1] is None
+    assert by_name["sentiment"][2][1] is None
+
+    # quality check sees every upstream output
+    assert by_name["quality"][0] >= max(by_name[n][1] for n in ("summarize", "classify", "sentiment"))
+    assert by_name["quality"][2][1:] == (
+        "short summary",
+        ["Economy & Finance"],
+        {"overall_sentiment": "neutral"},
+    )
+
+    assert result["summary"] == "short summary"
+    assert result["topics"] == ["Economy & Finance"]
+    assert result["quality_score"] == 0.9
+    assert result["errors"] == []
+    assert set(result["step_durations_ms"]) == {step.step_id for step in plan.steps}
+    assert result["iterations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_retries_only_the_steps_that_failed_quality() -> None:
+    calls: list = []
+    pipeline = _fake_pipeline(calls)
+    checks = iter([
+        {"score": 0.5, "details": {"summary_quality": 0.3, "classification_quality": 0.9}},
+        {"score": 0.85, "details": {"summary_quality": 0.8, "classification_quality": 0.9}},
+    ])
+
+    async def _quality(*args, **kwargs):
+        calls.append(("quality", 0.0, 0.0, args))
+        return next(checks)
+
+    pipeline.quality_checker.acheck_quality = _quality
+    supervisor = ContentSupervisor(pipeline=pipeline)
+    plan = supervisor.build_execution_plan(ArticleRouting(article_id="art-4", primary_agent="content-analyzer"))
+
+    result = await supervisor.execute_plan(plan, {"id": "art-4", "content": "x" * 800})
+
+    assert [name for name, *_ in calls].count("summarize") == 2
+    assert [name for name, *_ in calls].count("classify") == 1
+    assert [name for name, *_ in calls].count("analyze") == 1
+    assert result["iterations"] == 2
+    assert result["quality_score"] == 0.85
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_records_step_failures_and_continues() -> None:
+    calls: list = []
+    pipeline = _fake_pipeline(calls)
+
+    async def _boom(*args, **kwargs):
+        raise RuntimeError("provider down")
+
+    pipeline.summarizer.asummarize = _boom
+    supervisor = ContentSupervisor(pipeline=pipeline)
+    plan = supervisor.build_execution_plan(
+        ArticleRouting(article_id="art-2", primary_agent="summarizer"), "fast"
+    )
+    assert plan.parallel_groups == [["step-summarizer", "step-classifier"]]
+
+    result = await supervisor.execute_plan(plan, {"id": "art-2", "content": "short"})
+
+    assert result["summary"] is None
+    assert result["topics"] == ["Economy & Finance"]
+    assert result["errors"] == ["summarizer error: provider down"]
+
+
+@pytest.mark.asyncio
+async def test_execute_plan_rejects_dependency_cycles() -> None:
+    supervisor = ContentSupervisor(pipeline=_fake_pipeline([]))
+    plan = ExecutionPlan(
+        plan_id="p-1",
+        article_id="art-3",
+        mode=ProcessingMode.FULL,
+        steps=[
+            ExecutionStep(step_id="a", agent_id="summarizer", depends_on=["b"]),
+            ExecutionStep(step_id="b", agent_id="classifier", depends_on=["a"]),
+        ],
+    )
+
+    with pytest.raises(ValueError):
+        await supervisor.execute_plan(plan, {"id": "art-3", "content": "text"})
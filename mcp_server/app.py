@@ -3,6 +3,9 @@ MCP server application composition root.
 """
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import structlog
 from mcp.server.fastmcp import FastMCP
 
@@ -35,13 +38,21 @@ class AgenticMCPServer:
                 "runtime.degraded",
                 startup_error=self.runtime.startup_error,
             )
-        self.mcp = FastMCP(settings.mcp_server_name)
+        self.mcp = FastMCP(settings.mcp_server_name, lifespan=self._lifespan)
 
         register_tools(self.mcp, self.runtime, self.logger)
         register_resources(self.mcp, self.runtime)
         register_prompts(self.mcp)
         self.logger.info("initialized")
 
+    @asynccontextmanager
+    async def _lifespan(self, _server: FastMCP) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            await self.runtime.aclose()
+            self.logger.info("stopped")
+
     def run(self) -> None:
         """Run the MCP server using stdio transport."""
         self.logger.info("starting", transport="stdio")
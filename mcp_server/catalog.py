@@ -40,6 +40,7 @@ RESOURCE_CATALOG: list[str] = [
     "runtime://health",
     "runtime://readiness",
     "runtime://capabilities",
+    "runtime://cache",
     "runtime://pipeline/graph",
     "jobs://stats",
     "jobs://recent",
@@ -72,6 +72,15 @@ def get_server_capabilities() -> dict[str, Any]:
     }
 
 
+def get_llm_cache_stats() -> dict[str, Any]:
+    try:
+        from agentic_ai.agents.cache import get_llm_cache
+
+        return get_llm_cache().stats()
+    except Exception as exc:  # pragma: no cover - optional dependency safety net
+        return {"enabled": False, "error": str(exc)}
+
+
 def get_pipeline_component_status(runtime: ServerRuntime) -> dict[str, bool]:
     pipeline = runtime.pipeline
     if pipeline is None:
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ..diagnostics import build_health_report, get_server_capabilities
+from ..diagnostics import build_health_report, get_llm_cache_stats, get_server_capabilities
 
 
 def register_runtime_resources(mcp, runtime) -> None:
@@ -22,6 +22,11 @@ def register_runtime_resources(mcp, runtime) -> None:
         """Get MCP capability inventory (tools/resources/prompts)."""
         return get_server_capabilities()
 
+    @mcp.resource("runtime://cache")
+    async def runtime_cache() -> dict[str, Any]:
+        """Get LLM result cache hit/miss counters."""
+        return get_llm_cache_stats()
+
     @mcp.resource("runtime://pipeline/graph")
     async def pipeline_graph() -> dict[str, Any]:
         """Get pipeline graph representation for diagnostics."""
@@ -55,6 +55,14 @@ class ServerRuntime:
             "acp_backend": self.acp_backend,
         }
 
+    async def aclose(self) -> None:
+        """Release the shared LLM connection pools; call on server shutdown."""
+        if self.pipeline is None:
+            return
+        from agentic_ai.agents.llm_registry import aclose_llm_registry
+
+        await aclose_llm_registry()
+
     async def acp_preflight(self) -> dict[str, Any]:
         if not settings.acp_enabled:
             return {"enabled": False, "ready": True, "checks": {"acp_enabled": False}}
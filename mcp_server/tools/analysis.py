@@ -1,6 +1,7 @@
 """Analysis-focused MCP tools."""
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from ..runtime import ServerRuntime
@@ -45,22 +46,24 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
             return validation_error("content", size_error)
 
         if mode == "content":
-            return pipeline.content_analyzer.analyze(content)
+            return await pipeline.content_analyzer.aanalyze(content)
 
         if mode == "sentiment":
-            return pipeline.sentiment_analyzer.analyze_sentiment(content)
+            return await pipeline.sentiment_analyzer.aanalyze_sentiment(content)
 
         if mode == "classification":
-            return {"topics": pipeline.classifier.classify(content)}
+            return {"topics": await pipeline.classifier.aclassify(content)}
 
         if mode == "summary":
-            return {"summary": pipeline.summarizer.summarize(content)}
+            return {"summary": await pipeline.summarizer.asummarize(content)}
 
         if mode == "quality":
-            summary = pipeline.summarizer.summarize(content)
-            topics = pipeline.classifier.classify(content, summary=summary)
-            sentiment = pipeline.sentiment_analyzer.analyze_sentiment(content, summary=summary)
-            quality = pipeline.quality_checker.check_quality(content, summary, topics, sentiment)
+            summary = await pipeline.summarizer.asummarize(content)
+            topics, sentiment = await asyncio.gather(
+                pipeline.classifier.aclassify(content, summary=summary),
+                pipeline.sentiment_analyzer.aanalyze_sentiment(content, summary=summary),
+            )
+            quality = await pipeline.quality_checker.acheck_quality(content, summary, topics, sentiment)
             return {
                 "summary": summary,
                 "topics": topics,
@@ -69,11 +72,13 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
             }
 
         if mode == "full":
-            content_analysis = pipeline.content_analyzer.analyze(content)
-            summary = pipeline.summarizer.summarize(content, analyzed_content=content_analysis)
-            topics = pipeline.classifier.classify(content, summary=summary)
-            sentiment = pipeline.sentiment_analyzer.analyze_sentiment(content, summary=summary)
-            quality = pipeline.quality_checker.check_quality(content, summary, topics, sentiment)
+            content_analysis = await pipeline.content_analyzer.aanalyze(content)
+            summary = await pipeline.summarizer.asummarize(content, analyzed_content=content_analysis)
+            topics, sentiment = await asyncio.gather(
+                pipeline.classifier.aclassify(content, summary=summary),
+                pipeline.sentiment_analyzer.aanalyze_sentiment(content, summary=summary),
+            )
+            quality = await pipeline.quality_checker.acheck_quality(content, summary, topics, sentiment)
             return {
                 "content_analysis": content_analysis,
                 "summary": summary,
@@ -102,7 +107,7 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
         if size_error:
             return validation_error("content", size_error)
 
-        return pipeline.sentiment_analyzer.analyze_sentiment(content, summary=summary or None)
+        return await pipeline.sentiment_analyzer.aanalyze_sentiment(content, summary=summary or None)
 
     @mcp.tool()
     async def extract_topics(content: str, summary: str = "") -> dict[str, Any]:
@@ -118,7 +123,7 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
         if size_error:
             return validation_error("content", size_error)
 
-        topics = pipeline.classifier.classify(content, summary=summary or None)
+        topics = await pipeline.classifier.aclassify(content, summary=summary or None)
         return {
             "topics": topics,
             "topic_count": len(topics),
@@ -143,14 +148,14 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
         if size_error:
             return validation_error("content", size_error)
 
-        generated_summary = summary.strip() or pipeline.summarizer.summarize(content)
-        generated_topics = topics or pipeline.classifier.classify(content, summary=generated_summary)
-        generated_sentiment = sentiment or pipeline.sentiment_analyzer.analyze_sentiment(
+        generated_summary = summary.strip() or await pipeline.summarizer.asummarize(content)
+        generated_topics = topics or await pipeline.classifier.aclassify(content, summary=generated_summary)
+        generated_sentiment = sentiment or await pipeline.sentiment_analyzer.aanalyze_sentiment(
             content,
             summary=generated_summary,
         )
 
-        quality = pipeline.quality_checker.check_quality(
+        quality = await pipeline.quality_checker.acheck_quality(
             original_content=content,
             summary=generated_summary,
             topics=generated_topics,
@@ -204,5 +209,5 @@ def register_analysis_tools(mcp, runtime: ServerRuntime, logger) -> None:
         if size_error:
             return f"Error: {size_error}"
 
-        summary = pipeline.summarizer.summarize(content)
+        summary = await pipeline.summarizer.asummarize(content)
         return _render_summary_by_style(summary, style)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Offline crawler benchmark.
+
+Serves a synthetic site from this process and runs each workload at each
+concurrency level in a fresh subprocess, so CPU time and peak RSS belong to
+that run alone:
+
+    python -m python_crawler.benchmarks.run --pages 500 --concurrency 1,4,16
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Sequence
+
+from .site import SiteSpec, SyntheticSite, start_site
+
+WORKLOADS = ("crawl", "fetch", "extract")
+
+
+def _rusage() -> Dict[str, float]:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "cpu": own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+        "rss": max(own.ru_maxrss, children.ru_maxrss) * scale,
+    }
+
+
+async def _run_workload(
+    workload: str, base_url: str, concurrency: int, options: Dict[str, Any], pages: Sequence[str] = ()
+) -> int:
+    """Run one workload in this (child) process; returns the number of items processed."""
+    import aiohttp
+
+    from ..src.config import CrawlerConfig
+    from ..src.crawler import crawl_homepage, fetch_article
+    from ..src.extractor import close_extraction_pool, extract_text_and_title, get_extraction_pool
+
+    config = CrawlerConfig(
+        max_links=options["pages"],
+        max_depth=options["depth"],
+        concurrency=concurrency,
+        per_host_concurrency=concurrency,
+        request_delay=0.0,
+        backoff_base=options["backoff_base"],
+        js_fallback=False,
+        parser_backend=options["parser_backend"],
+        discovery=options["discovery"],
+    )
+
+    if workload == "crawl":
+        return len(await crawl_homepage(base_url, config))
+
+    if workload == "fetch":
+        urls = [f"{base_url}page/{i}" for i in range(options["pages"])]
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+        sem = asyncio.Semaphore(concurrency)
+        async with aiohttp.ClientSession(connector=connector, headers={"User-Agent": config.user_agent}) as session:
+
+            async def fetch(url: str) -> bool:
+                async with sem:
+                    return await fetch_article(session, url, config) is not None
+
+            return sum(await asyncio.gather(*(fetch(url) for url in urls)))
+
+    # extract: on the event loop at concurrency 1, in that many worker processes above it.
+    if concurrency <= 1:
+        return sum(bool(extract_text_and_title(html, config.parser_backend)[0]) for html in pages)
+    pool = get_extraction_pool(concurrency, "process")
+    try:
+        results = await asyncio.gather(*(pool.parse(html, "", config.parser_backend) for html in pages))
+    finally:
+        close_extraction_pool()
+    return sum(bool(page.text) for page in results)
+
+
+def _child(payload: str) -> None:
+    job = json.loads(payload)
+    logging.basicConfig(level=logging.ERROR)
+    pages: List[str] = []
+    if job["workload"] == "extract":
+        # Rendered up front so only parsing is measured.
+        site = SyntheticSite(SiteSpec(**job["options"]["spec"]))
+        pages = [site.page_html(i) for i in range(job["options"]["pages"])]
+
+    before = _rusage()
+    started = time.perf_counter()
+    items = asyncio.run(
+        _run_workload(job["workload"], job["base_url"], job["concurrency"], job["options"], pages)
+    )
+    elapsed = time.perf_counter() - started
+    after = _rusage()
+    print(
+        json.dumps(
+            {
+                "workload": job["workload"],
+                "concurrency": job["concurrency"],
+                "items": items,
+                "elapsed": round(elapsed, 4),
+                "items_per_sec": round(items / elapsed, 2) if elapsed else 0.0,
+                "cpu_seconds": round(after["cpu"] - before["cpu"], 3),
+                "peak_rss_mb": round(after["rss"] / 2**20, 1),
+            }
+        )
+    )
+
+
+async def _spawn(job: Dict[str, Any]) -> Dict[str, Any]:
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "python_crawler.benchmarks.run",
+        "--child",
+        json.dumps(job),
+        cwd=root,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(f"{job['workload']} @ {job['concurrency']} failed:\n{stderr.decode()[-2000:]}")
+    return json.loads(stdout.decode().strip().splitlines()[-1])
+
+
+def _table(results: List[Dict[str, Any]]) -> str:
+    header = f"{'workload':<9}{'conc':>5}{'items':>7}{'secs':>9}{'items/s':>10}{'cpu s':>8}{'cpu %':>7}{'rss MB':>8}"
+    lines = [header, "-" * len(header)]
+    for row in results:
+        cpu_pct = 100 * row["cpu_seconds"] / row["elapsed"] if row["elapsed"] else 0.0
+        lines.append(
+            f"{row['workload']:<9}{row['concurrency']:>5}{row['items']:>7}{row['elapsed']:>9.2f}"
+            f"{row['items_per_sec']:>10.1f}{row['cpu_seconds']:>8.2f}{cpu_pct:>7.0f}{row['peak_rss_mb']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    spec = SiteSpec(
+        pages=args.pages,
+        fanout=args.fanout,
+        page_bytes=args.page_bytes,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    site, runner, base_url = await start_site(spec)
+    options = {
+        "pages": args.pages,
+        "depth": args.depth,
+        "backoff_base": args.backoff_base,
+        "parser_backend": args.parser_backend,
+        "discovery": args.discovery,
+        "spec": asdict(spec),
+    }
+    results: List[Dict[str, Any]] = []
+    try:
+        for workload in args.workload:
+            for concurrency in args.concurrency:
+                job = {"workload": workload, "base_url": base_url, "concurrency": concurrency, "options": options}
+                for _ in range(args.repeat):
+                    results.append(await _spawn(job))
+    finally:
+        await runner.cleanup()
+
+    print(_table(results))
+    print(f"\nserver: {site.requests} requests, {site.errors} injected errors")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"spec": asdict(spec), "options": options, "results": results}, fh, indent=2)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main() -> None:
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        _child(sys.argv[2])
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark the crawler against a local synthetic site")
+    parser.add_argument("--workload", action="append", choices=WORKLOADS, help="Repeatable; default: all")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16], help="Comma-separated levels")
+    parser.add_argument("--pages", type=int, default=300, help="Pages on the synthetic site")
+    parser.add_argument("--fanout", type=int, default=10, help="Links per page")
+    parser.add_argument("--page-bytes", type=int, default=20_000, help="Approximate article size")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Server latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of pages whose first request is a 503")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--depth", type=int, default=4, help="Crawl depth for the crawl workload")
+    parser.add_argument("--discovery", choices=["links", "sitemap", "auto"], default="links")
+    parser.add_argument("--parser-backend", default="auto")
+    parser.add_argument("--backoff-base", type=float, default=0.05, help="Retry backoff base (seconds)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per workload/concurrency pair")
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+    args.workload = args.workload or list(WORKLOADS)
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
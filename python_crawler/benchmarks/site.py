@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import hashlib
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+WORDS = (
+    "agency budget council federal grant policy program public report review rule safety "
+    "service state statement department committee funding health infrastructure notice "
+    "office order press regional release research security transport update water"
+).split()
+
+
+@dataclass
+class SiteSpec:
+    pages: int = 500
+    fanout: int = 10
+    page_bytes: int = 20_000
+    latency_ms: float = 20.0
+    # Share of pages whose first request fails with a 503 (the retry succeeds).
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+class SyntheticSite:
+    """
+    Deterministic news-like site: ``/`` and each ``/page/<i>`` link to
+    ``fanout`` further pages (a tree reaching every page), each page carries
+    an article of roughly ``page_bytes``, plus ``robots.txt`` and a sitemap.
+    """
+
+    def __init__(self, spec: SiteSpec):
+        self.spec = spec
+        self.requests = 0
+        self.errors = 0
+        self._hits: Dict[str, int] = {}
+        self._html: Dict[Optional[int], str] = {}
+
+    def children(self, index: Optional[int]) -> List[int]:
+        first = 0 if index is None else index * self.spec.fanout + 1
+        return [i for i in range(first, first + self.spec.fanout) if i < self.spec.pages]
+
+    def _fails_once(self, path: str) -> bool:
+        if self.spec.error_rate <= 0:
+            return False
+        digest = hashlib.blake2b(f"{self.spec.seed}:{path}".encode(), digest_size=4).digest()
+        return int.from_bytes(digest, "big") / 2**32 < self.spec.error_rate
+
+    def page_html(self, index: Optional[int]) -> str:
+        if index not in self._html:
+            self._html[index] = self._render(index)
+        return self._html[index]
+
+    def _render(self, index: Optional[int]) -> str:
+        rng = random.Random(f"{self.spec.seed}:{index}")
+        title = "Home" if index is None else f"Release {index}: " + " ".join(rng.choices(WORDS, k=5)).title()
+        links = "".join(f'<li><a href="/page/{child}">Release {child}</a></li>' for child in self.children(index))
+        paragraphs: List[str] = []
+        size = 0
+        while index is not None and size < self.spec.page_bytes:
+            sentences = [" ".join(rng.choices(WORDS, k=rng.randint(8, 18))).capitalize() + "." for _ in range(5)]
+            paragraph = "<p>" + " ".join(sentences) + "</p>"
+            paragraphs.append(paragraph)
+            size += len(paragraph)
+        return (
+            f"<!doctype html><html><head><title>{title}</title></head><body>"
+            f'<nav><a href="/">Home</a><a href="/private/admin">Admin</a></nav>'
+            f"<main><article><h1>{title}</h1>{''.join(paragraphs)}</article></main>"
+            f"<aside><ul>{links}</ul></aside><footer>Synthetic benchmark site</footer></body></html>"
+        )
+
+    async def _delay(self) -> None:
+        self.requests += 1
+        if self.spec.latency_ms > 0:
+            await asyncio.sleep(self.spec.latency_ms / 1000)
+
+    async def home(self, request: web.Request) -> web.Response:
+        await self._delay()
+        return web.Response(text=self.page_html(None), content_type="text/html")
+
+    async def page(self, request: web.Request) -> web.Response:
+        await self._delay()
+        index = int(request.match_info["index"])
+        if index >= self.spec.pages:
+            raise web.HTTPNotFound()
+        path = request.path
+        self._hits[path] = self._hits.get(path, 0) + 1
+        if self._hits[path] == 1 and self._fails_once(path):
+            self.errors += 1
+            return web.Response(status=503, text="Service Unavailable")
+        return web.Response(text=self.page_html(index), content_type="text/html")
+
+    async def robots(self, request: web.Request) -> web.Response:
+        await self._delay()
+        base = f"{request.scheme}://{request.host}"
+        return web.Response(text=f"User-agent: *\nDisallow: /private\nSitemap: {base}/sitemap.xml\n")
+
+    async def sitemap(self, request: web.Request) -> web.Response:
+        await self._delay()
+        base = f"{request.scheme}://{request.host}"
+        urls = "".join(
+            f"<url><loc>{base}/page/{i}</loc><lastmod>2026-01-01</lastmod></url>" for i in range(self.spec.pages)
+        )
+        return web.Response(
+            text=f'<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>',
+            content_type="application/xml",
+        )
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/", self.home)
+        app.router.add_get("/page/{index}", self.page)
+        app.router.add_get("/robots.txt", self.robots)
+        app.router.add_get("/sitemap.xml", self.sitemap)
+        return app
+
+
+async def start_site(
+    spec: SiteSpec, host: str = "127.0.0.1", port: int = 0
+) -> Tuple[SyntheticSite, web.AppRunner, str]:
+    """Serve ``spec`` on ``host:port`` (0 = any free port); returns the site, runner and base URL."""
+    site = SyntheticSite(spec)
+    runner = web.AppRunner(site.app(), access_log=None)
+    await runner.setup()
+    tcp = web.TCPSite(runner, host, port)
+    await tcp.start()
+    bound = runner.addresses[0][1]
+    return site, runner, f"http://{host}:{bound}/"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the synthetic benchmark site")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--pages", type=int, default=SiteSpec.pages)
+    parser.add_argument("--fanout", type=int, default=SiteSpec.fanout)
+    parser.add_argument("--page-bytes", type=int, default=SiteSpec.page_bytes)
+    parser.add_argument("--latency-ms", type=float, default=SiteSpec.latency_ms)
+    parser.add_argument("--error-rate", type=float, default=SiteSpec.error_rate)
+    args = parser.parse_args()
+    spec = SiteSpec(args.pages, args.fanout, args.page_bytes, args.latency_ms, args.error_rate)
+    web.run_app(SyntheticSite(spec).app(), port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
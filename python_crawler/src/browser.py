@@ -0,0 +1,171 @@
+import asyncio
+import logging
+from typing import Any, List, Optional
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+except Exception:  # pragma: no cover
+    async_playwright = None
+    PlaywrightTimeoutError = Exception
+
+LOG = logging.getLogger("python_crawler")
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+class BrowserPool:
+    """
+    One long-lived headless Chromium shared by the whole crawl.
+
+    At most ``max_pages`` pages are open at once, each in a reusable browser
+    context that aborts image/font/media requests. Contexts are recycled
+    after ``max_uses_per_context`` pages to cap memory growth.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        max_pages: int = 2,
+        nav_timeout_ms: int = 20000,
+        settle_timeout_ms: int = 3000,
+        max_uses_per_context: int = 50,
+        block_resources: bool = True,
+    ):
+        self.user_agent = user_agent
+        self.max_pages = max(1, max_pages)
+        self.nav_timeout_ms = nav_timeout_ms
+        self.settle_timeout_ms = settle_timeout_ms
+        self.max_uses_per_context = max_uses_per_context
+        self.block_resources = block_resources
+
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self._idle: List[List[Any]] = []  # [context, uses]
+        self._closed = False
+
+    @property
+    def available(self) -> bool:
+        return async_playwright is not None and not self._closed
+
+    async def _ensure_browser(self) -> None:
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            self._playwright = await async_playwright().start()
+            try:
+                self._browser = await self._playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+            except BaseException:
+                # Leave nothing running so the next fetch can try a clean start.
+                await _quietly(self._playwright.stop())
+                self._playwright = None
+                raise
+            LOG.info("Started shared Chromium (max_pages=%d)", self.max_pages)
+
+    async def _acquire_context(self) -> List[Any]:
+        if self._idle:
+            return self._idle.pop()
+        context = await self._browser.new_context(user_agent=self.user_agent)
+        if self.block_resources:
+            try:
+                await context.route("**/*", _block_heavy_resources)
+            except BaseException:
+                await _quietly(context.close())
+                raise
+        return [context, 0]
+
+    async def _release_context(self, slot: List[Any]) -> None:
+        slot[1] += 1
+        if self._closed or slot[1] >= self.max_uses_per_context:
+            await _quietly(slot[0].close())
+        else:
+            self._idle.append(slot)
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Render ``url`` and return its HTML, or None on timeout/failure."""
+        if not self.available:
+            return None
+
+        async with self._slots:
+            try:
+                await self._ensure_browser()
+                slot = await self._acquire_context()
+            except Exception as exc:
+                LOG.warning("JS browser unavailable for %s: %s", url, exc)
+                return None
+            try:
+                page = await slot[0].new_page()
+            except Exception as exc:
+                LOG.warning("JS fetch failed for %s: %s", url, exc)
+                # A context that cannot open pages is not worth reusing.
+                await _quietly(slot[0].close())
+                return None
+            try:
+                # DOM first; then give scripts a short, bounded window to settle.
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.nav_timeout_ms)
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=self.settle_timeout_ms)
+                except PlaywrightTimeoutError:
+                    pass
+                return await page.content()
+            except PlaywrightTimeoutError:
+                LOG.warning("JS fetch timed out for %s", url)
+                return None
+            except Exception as exc:
+                LOG.warning("JS fetch failed for %s: %s", url, exc)
+                return None
+            finally:
+                await _quietly(page.close())
+                await self._release_context(slot)
+
+    async def close(self) -> None:
+        self._closed = True
+        while self._idle:
+            context, _ = self._idle.pop()
+            await _quietly(context.close())
+        if self._browser is not None:
+            await _quietly(self._browser.close())
+            self._browser = None
+        if self._playwright is not None:
+            await _quietly(self._playwright.stop())
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+
+async def _block_heavy_resources(route: Any) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _quietly(awaitable: Any) -> None:
+    try:
+        await awaitable
+    except Exception:
+        pass
+
+
+_shared_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool(user_agent: str, max_pages: int = 2) -> BrowserPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _shared_pool
+    if _shared_pool is None or _shared_pool._closed:
+        _shared_pool = BrowserPool(user_agent, max_pages=max_pages)
+    return _shared_pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the shared pool (no-op if it was never started)."""
+    global _shared_pool
+    if _shared_pool is not None:
+        await _shared_pool.close()
+        _shared_pool = None
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from .models import ArticleData
+
+LOG = logging.getLogger("python_crawler")
+
+
+@dataclass
+class FrontierState:
+    """
+    Link-discovery state that ``iter_homepage_links`` keeps current, so a
+    crawl can be checkpointed and picked up again.
+    """
+
+    # Pages queued for link extraction but not expanded yet: url -> depth.
+    pending: Dict[str, int] = field(default_factory=dict)
+    scheduled: Set[str] = field(default_factory=set)
+    collected: Set[str] = field(default_factory=set)
+    skipped: Set[str] = field(default_factory=set)
+    # Collected links in discovery order.
+    links: List[str] = field(default_factory=list)
+    complete: bool = False
+
+
+class CrawlCheckpoint:
+    """
+    On-disk crawl state under ``directory``: ``state.json`` holds the frontier
+    (rewritten atomically on each save) and ``records.jsonl`` gets one line per
+    URL once its article is in the output, so a crash loses at most the work
+    in flight and nothing is marked done that was never written.
+    """
+
+    def __init__(self, directory: str, homepage_url: str, resume: bool = False):
+        os.makedirs(directory, exist_ok=True)
+        self.state_path = os.path.join(directory, "state.json")
+        self.records_path = os.path.join(directory, "records.jsonl")
+        self.homepage_url = homepage_url
+        self.frontier = FrontierState()
+        self.done: Set[str] = set()
+
+        if resume and os.path.exists(self.state_path):
+            self._load()
+        else:
+            if resume:
+                LOG.info("No checkpoint in %s, starting fresh", directory)
+            for path in (self.state_path, self.records_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        self._records = open(self.records_path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        with open(self.state_path, encoding="utf-8") as fh:
+            state = json.load(fh)
+        if state.get("homepage_url") != self.homepage_url:
+            raise ValueError(
+                f"Checkpoint is for {state.get('homepage_url')!r}, not {self.homepage_url!r}; "
+                "use another state directory or drop --resume"
+            )
+        self.frontier = FrontierState(
+            pending={url: depth for url, depth in state.get("pending", [])},
+            scheduled=set(state.get("scheduled", [])),
+            collected=set(state.get("links", [])),
+            skipped=set(state.get("skipped", [])),
+            links=list(state.get("links", [])),
+            complete=bool(state.get("complete")),
+        )
+        self._drop_torn_record()
+        self.done = {record["url"] for record in self._iter_records()}
+        LOG.info(
+            "Resuming: %d URLs done, %d of %d collected left, %d pages pending discovery",
+            len(self.done),
+            len(self.remaining()),
+            len(self.frontier.collected),
+            len(self.frontier.pending),
+        )
+
+    def _drop_torn_record(self) -> None:
+        """Cut a last line left half-written by a crash, so new records start on a line of their own."""
+        if not os.path.exists(self.records_path):
+            return
+        with open(self.records_path, "rb+") as fh:
+            end = fh.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            fh.seek(end - 1)
+            if fh.read(1) == b"\n":
+                return
+            # Walk back to the last complete line without reading the whole file.
+            pos = end
+            while pos > 0:
+                start = max(0, pos - 65536)
+                fh.seek(start)
+                newline = fh.read(pos - start).rfind(b"\n")
+                if newline != -1:
+                    fh.truncate(start + newline + 1)
+                    return
+                pos = start
+            fh.truncate(0)
+
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self.records_path):
+            return
+        with open(self.records_path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-write.
+                    continue
+
+    def remaining(self) -> List[str]:
+        """Collected links that have not been processed yet, in discovery order."""
+        return [url for url in self.frontier.links if url not in self.done]
+
+    def record(self, url: str, article: Optional[ArticleData]) -> None:
+        self._records.write(
+            json.dumps({"url": url, "article": article.__dict__ if article else None}, ensure_ascii=False) + "\n"
+        )
+        self._records.flush()
+        self.done.add(url)
+
+    def articles(self) -> List[Dict[str, Any]]:
+        self._records.flush()
+        # Keyed by URL so a URL recorded twice (e.g. resumed mid-write) is output once.
+        latest = {record["url"]: record.get("article") for record in self._iter_records()}
+        return [article for article in latest.values() if article]
+
+    def save(self) -> None:
+        frontier = self.frontier
+        state = {
+            "homepage_url": self.homepage_url,
+            "saved_at": time.time(),
+            "complete": frontier.complete,
+            "pending": [[url, depth] for url, depth in frontier.pending.items()],
+            "scheduled": sorted(frontier.scheduled),
+            "links": frontier.links,
+            "skipped": sorted(frontier.skipped),
+        }
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp_path, self.state_path)
+
+    async def autosave(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.save()
+
+    def close(self) -> None:
+        self.save()
+        self._records.close()
@@ -2,19 +2,29 @@
 
 import argparse
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Optional
+from dataclasses import replace
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import aiohttp
 from dotenv import load_dotenv
 
-from .config import CrawlerConfig
-from .crawler import crawl_homepage, fetch_article
+from .browser import close_browser_pool
+from .checkpoint import CrawlCheckpoint
+from .config import TRACKING_PARAMS, CrawlerConfig
+from .crawler import fetch_article, iter_homepage_links, open_session
+from .dedup import CanonicalIndex, NearDuplicateIndex
+from .extractor import close_extraction_pool
+from .http_cache import close_http_caches, get_http_cache
+from .metrics import enable_metrics, get_metrics
 from .models import ArticleData
-from .summarizer import summarize_content
+from .output import FORMATS, check_output, open_writer, output_format
+from .robots import close_robots_caches
+from .seen_store import SeenStore, content_hash
+from .stream import ArticleSink, PipelineSink, stream_crawl
+from .summarizer import asummarize_content
 
 load_dotenv()
 
@@ -33,81 +43,470 @@ async def fetch_and_process(
     semaphore: asyncio.Semaphore,
     config: CrawlerConfig,
     summarize: bool,
+    seen: Optional[SeenStore] = None,
+    dedup: Optional[NearDuplicateIndex] = None,
+    keep_duplicates: bool = False,
+    canonicals: Optional[CanonicalIndex] = None,
 ) -> Optional[ArticleData]:
     async with semaphore:
         article = await fetch_article(session, url, config)
-        if not article:
+    if not article:
+        return None
+
+    article.fetched_at = _utc_now()
+
+    if seen is not None:
+        text_hash = content_hash(article.content)
+        if seen.unchanged(url, text_hash):
+            # Nothing to write, so bump the fetch time now; new or changed
+            # articles are only recorded once they are in the output.
+            seen.record(url, text_hash)
+            LOG.info("Unchanged since last crawl, skipping %s", url)
             return None
 
-        article.fetched_at = _utc_now()
+    if canonicals is not None:
+        original = canonicals.check(url, article.canonical_url)
+        if original:
+            LOG.info("Same canonical URL as %s, skipping %s", original, url)
+            if not keep_duplicates:
+                _record_dropped(seen, url, article)
+                return None
+            article.duplicate_of = original
+            return article
+
+    if dedup is not None:
+        canonical = dedup.check(url, article.content)
+        if canonical:
+            LOG.info("Near-duplicate of %s, not summarizing %s", canonical, url)
+            if not keep_duplicates:
+                _record_dropped(seen, url, article)
+                return None
+            article.duplicate_of = canonical
+            return article
+
+    # Outside the fetch semaphore: model calls have their own global limit,
+    # so fetching continues while summaries are in flight.
+    if summarize:
+        try:
+            with get_metrics().timer("summarize"):
+                article.summary = await asummarize_content(article.content)
+        except Exception as exc:
+            LOG.warning("Summarization failed for %s: %s", url, exc)
+    return article
 
-        if summarize:
-            try:
-                article.summary = summarize_content(article.content)
-            except Exception as exc:
-                LOG.warning("Summarization failed for %s: %s", url, exc)
-        return article
+
+def _record_dropped(seen: Optional[SeenStore], url: str, article: ArticleData) -> None:
+    """
+    Remember a duplicate that will not be written, so the next incremental
+    crawl skips it as unchanged instead of fetching and comparing it again.
+    """
+    if seen is not None:
+        seen.record(url, content_hash(article.content))
 
 
 async def main() -> None:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if not args.homepage_url and not args.seeds_file:
+        parser.error("a homepage_url or --seeds-file is required")
+    if args.seeds_file:
+        if args.state_dir:
+            parser.error("--state-dir cannot be combined with --seeds-file (checkpoints cover a single homepage)")
+        try:
+            args.seeds = _read_seeds(args.seeds_file)
+        except (OSError, ValueError) as exc:
+            parser.error(str(exc))
+    args.output_format = output_format(args.output, args.output_format)
+    try:
+        check_output(args.output, args.output_format)
+    except RuntimeError as exc:
+        parser.error(str(exc))
+    if (args.stream or args.pipeline) and args.resume and args.state_dir and args.output_format != "jsonl":
+        parser.error(
+            f"--resume appends to the streamed output, and {args.output_format} output cannot be appended to; "
+            "use a .jsonl output path"
+        )
+    try:
+        await _run(args)
+    finally:
+        await close_browser_pool()
+        close_extraction_pool()
+        close_http_caches()
+        close_robots_caches()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Production-ready async crawler")
-    parser.add_argument("homepage_url", help="Start URL to crawl")
+    parser.add_argument("homepage_url", nargs="?", help="Start URL to crawl")
+    parser.add_argument(
+        "--seeds-file",
+        help="Crawl every start URL in this file (one per line, optional per-seed max links after it) in one process",
+    )
+    parser.add_argument("--seed-concurrency", type=int, default=16, help="Seeds crawled at the same time")
     parser.add_argument("--max-links", type=int, default=50, help="Max links to fetch")
     parser.add_argument("--depth", type=int, default=2, help="Max crawl depth")
-    parser.add_argument("--concurrency", type=int, default=8, help="Parallel fetch slots")
+    parser.add_argument(
+        "--discovery",
+        choices=["links", "sitemap", "auto"],
+        default="links",
+        help="Find articles by following links, from sitemaps, or sitemaps with a link fallback",
+    )
+    parser.add_argument(
+        "--sitemap-max-age",
+        type=float,
+        default=None,
+        help="Only take sitemap URLs whose lastmod is within this many hours",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Parallel fetch slots and discovery workers")
     parser.add_argument("--output", default="articles.json", help="Output filepath")
-    parser.add_argument("--output-format", choices=["json", "jsonl"], default="json")
+    parser.add_argument(
+        "--output-format",
+        choices=FORMATS,
+        help="Output format; by default inferred from --output (.json, .jsonl, .parquet, plus .gz / .zst)",
+    )
     parser.add_argument("--allowed-domain", action="append", default=[], help="Allowed domain (repeatable)")
     parser.add_argument("--include", action="append", default=[], help="Include URL regex (repeatable)")
     parser.add_argument("--exclude", action="append", default=[], help="Exclude URL regex (repeatable)")
+    parser.add_argument(
+        "--strip-param",
+        action="append",
+        default=[],
+        help="Extra query parameter to drop from links, 'prefix*' allowed (repeatable; utm_* etc. always dropped)",
+    )
+    parser.add_argument("--keep-tracking-params", action="store_true", help="Do not strip tracking query parameters")
     parser.add_argument("--no-robots", action="store_true", help="Ignore robots.txt")
-    parser.add_argument("--request-delay", type=float, default=0.2, help="Delay between requests (seconds)")
+    parser.add_argument("--robots-cache", help="SQLite file caching robots.txt across runs")
+    parser.add_argument("--robots-ttl", type=float, default=24.0, help="robots.txt cache lifetime (hours)")
+    parser.add_argument(
+        "--request-delay", type=float, default=0.2, help="Min delay between requests to the same host (seconds)"
+    )
+    parser.add_argument("--per-host-concurrency", type=int, default=4, help="Max in-flight requests per host")
     parser.add_argument("--timeout", type=int, default=12, help="Request timeout (seconds)")
+    parser.add_argument(
+        "--max-response-mb", type=float, default=5.0, help="Abandon pages whose body exceeds this size (0 = no cap)"
+    )
     parser.add_argument("--max-retries", type=int, default=3, help="Max retries per request")
+    parser.add_argument(
+        "--max-retry-after",
+        type=float,
+        default=120.0,
+        help="Longest Retry-After (seconds) honoured; a longer one fails the URL instead of pausing its host",
+    )
     parser.add_argument("--no-js-fallback", action="store_true", help="Disable Playwright fallback")
+    parser.add_argument("--browser-pages", type=int, default=2, help="Max concurrent Playwright pages")
     parser.add_argument("--min-text-length", type=int, default=600, help="Minimum extracted text length")
+    parser.add_argument(
+        "--parser-backend",
+        choices=["auto", "lxml", "selectolax", "html.parser"],
+        default="auto",
+        help=(
+            "HTML parser backend (auto prefers lxml, then selectolax, then html.parser); only lxml "
+            "runs readability, the others trade extraction quality for speed"
+        ),
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=0,
+        help="Parse pages in N worker processes/threads (0 = on the event loop)",
+    )
+    parser.add_argument(
+        "--extract-executor",
+        choices=["process", "thread"],
+        default="process",
+        help="Executor type for --extract-workers",
+    )
+    parser.add_argument(
+        "--http-cache",
+        help="SQLite HTTP cache; re-fetches send If-None-Match/If-Modified-Since and 304s are served from it",
+    )
+    parser.add_argument("--seen-db", help="SQLite store of fetched URLs; known URLs are skipped")
+    parser.add_argument(
+        "--recheck-after",
+        type=float,
+        default=None,
+        help="With --seen-db, re-fetch known URLs last fetched this many hours ago",
+    )
+    parser.add_argument(
+        "--dedup", action="store_true", help="Drop near-duplicate articles (SimHash) before summarizing"
+    )
+    parser.add_argument(
+        "--dedup-db", help="SQLite fingerprint store to catch duplicates of earlier runs (implies --dedup)"
+    )
+    parser.add_argument(
+        "--dedup-distance", type=int, default=6, help="Max differing SimHash bits (of 64) for a near-duplicate"
+    )
+    parser.add_argument(
+        "--keep-duplicates",
+        action="store_true",
+        help="Write near- and canonical duplicates unsummarized with duplicate_of set instead of dropping them",
+    )
+    parser.add_argument(
+        "--state-dir",
+        help="Checkpoint the frontier and each finished article here so an interrupted crawl can be resumed",
+    )
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint in --state-dir")
+    parser.add_argument(
+        "--checkpoint-interval", type=float, default=30.0, help="Seconds between frontier checkpoints"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Log p50/p95/p99 timings per phase and per host, plus retry/fallback counts, at the end",
+    )
+    parser.add_argument("--metrics-file", help="Also write the stats as a Prometheus textfile-collector file")
     parser.add_argument("--no-summarize", action="store_true", help="Disable AI summarization")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Fetch articles while crawling and append each to JSONL output as it finishes",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="With --stream, push each article through the agentic pipeline before writing",
+    )
+    return parser
+
 
+async def _run(args: argparse.Namespace) -> None:
     config = CrawlerConfig(
         max_links=args.max_links,
         max_depth=args.depth,
+        discovery=args.discovery,
+        sitemap_max_age=args.sitemap_max_age * 3600 if args.sitemap_max_age is not None else None,
         concurrency=args.concurrency,
         request_timeout=args.timeout,
+        max_response_bytes=int(args.max_response_mb * 1024 * 1024),
         request_delay=args.request_delay,
+        per_host_concurrency=args.per_host_concurrency,
         max_retries=args.max_retries,
+        max_retry_after=args.max_retry_after,
         respect_robots=not args.no_robots,
+        robots_ttl=args.robots_ttl * 3600,
+        robots_cache_path=args.robots_cache,
         js_fallback=not args.no_js_fallback,
+        browser_pages=args.browser_pages,
         min_text_length=args.min_text_length,
+        parser_backend=args.parser_backend,
+        extract_workers=args.extract_workers,
+        extract_executor=args.extract_executor,
         allowed_domains=args.allowed_domain,
         include_patterns=args.include,
         exclude_patterns=args.exclude,
+        strip_params=([] if args.keep_tracking_params else list(TRACKING_PARAMS)) + args.strip_param,
+        http_cache_path=args.http_cache,
+    )
+
+    LOG.info(
+        "Crawling %s (depth=%s, max_links=%s)",
+        args.homepage_url or args.seeds_file,
+        args.depth,
+        args.max_links,
     )
+    metrics = enable_metrics() if args.stats or args.metrics_file else get_metrics()
+
+    seen: Optional[SeenStore] = None
+    skip: Optional[Callable[[str], bool]] = None
+    if args.seen_db:
+        recheck_after = args.recheck_after * 3600 if args.recheck_after is not None else None
+        seen = SeenStore(args.seen_db, recheck_after=recheck_after)
+        skip = seen.should_skip
+        LOG.info("Seen store %s holds %d URLs", args.seen_db, len(seen))
+
+    dedup: Optional[NearDuplicateIndex] = None
+    if args.dedup or args.dedup_db:
+        dedup = NearDuplicateIndex(args.dedup_distance, args.dedup_db)
+        if args.dedup_db:
+            LOG.info("Fingerprint store %s holds %d articles", args.dedup_db, len(dedup))
+
+    checkpoint: Optional[CrawlCheckpoint] = None
+    autosave: Optional["asyncio.Task[None]"] = None
+    if args.state_dir:
+        checkpoint = CrawlCheckpoint(args.state_dir, args.homepage_url, resume=args.resume)
+        autosave = asyncio.create_task(checkpoint.autosave(args.checkpoint_interval))
+    elif args.resume:
+        LOG.warning("--resume needs --state-dir; starting a fresh crawl")
+
+    try:
+        await _crawl(args, config, seen, skip, dedup, checkpoint)
+    finally:
+        if checkpoint is not None:
+            autosave.cancel()
+            checkpoint.close()
+        if seen is not None:
+            seen.close()
+        if dedup is not None:
+            LOG.info("Near-duplicates: %d", dedup.duplicates)
+            dedup.close()
+        if args.stats:
+            LOG.info("Crawl stats:\n%s", metrics.summary())
+        if args.metrics_file:
+            metrics.write_prometheus(args.metrics_file)
+
+    if config.http_cache_path:
+        cache = get_http_cache(config.http_cache_path)
+        LOG.info("HTTP cache: %d pages served via 304, %d stored", cache.revalidated, cache.stored)
+
+
+async def _crawl(
+    args: argparse.Namespace,
+    config: CrawlerConfig,
+    seen: Optional[SeenStore],
+    skip: Optional[Callable[[str], bool]],
+    dedup: Optional[NearDuplicateIndex] = None,
+    checkpoint: Optional[CrawlCheckpoint] = None,
+) -> None:
+    state = checkpoint.frontier if checkpoint is not None else None
+    resuming = checkpoint is not None and args.resume
+    canonicals = CanonicalIndex()
+
+    async def process(session: aiohttp.ClientSession, sem: asyncio.Semaphore, url: str) -> Optional[ArticleData]:
+        return await fetch_and_process(
+            session, url, sem, config, not args.no_summarize, seen, dedup, args.keep_duplicates, canonicals
+        )
+
+    def mark_written(url: str, article: Optional[ArticleData]) -> None:
+        """Called once ``article`` is in the output (or there was nothing to write)."""
+        if checkpoint is not None:
+            checkpoint.record(url, article)
+        if seen is not None and article is not None:
+            seen.record(url, content_hash(article.content))
+
+    if args.seeds_file:
+        await _crawl_seeds(args, config, skip, process, mark_written)
+        return
 
-    LOG.info("Crawling %s (depth=%s, max_links=%s)", args.homepage_url, args.depth, args.max_links)
-    urls = await crawl_homepage(args.homepage_url, config)
-    LOG.info("Discovered %d candidate URLs", len(urls))
+    if args.stream or args.pipeline:
+        if args.pipeline:
+            sink = PipelineSink(args.output, append=resuming, fmt=args.output_format)
+        else:
+            sink = ArticleSink(args.output, resuming, args.output_format)
+        try:
+            async with open_session(config) as session:
+                sem = asyncio.Semaphore(config.concurrency)
 
-    headers = {"User-Agent": config.user_agent, "Accept": "text/html,application/xhtml+xml"}
-    connector = aiohttp.TCPConnector(limit_per_host=config.concurrency)
+                async def process_url(url: str) -> Optional[ArticleData]:
+                    return await process(session, sem, url)
+
+                written = await stream_crawl(
+                    args.homepage_url,
+                    config,
+                    session,
+                    process_url,
+                    sink,
+                    skip=skip,
+                    state=state,
+                    resume_urls=checkpoint.remaining() if checkpoint is not None else (),
+                    on_done=mark_written,
+                )
+        finally:
+            await sink.close()
+        LOG.info("Wrote %d articles to %s", written, args.output)
+        return
+
+    # Discovery and fetching share one session, so connections and DNS lookups are reused.
+    async with open_session(config) as session:
+        urls = [link async for link in iter_homepage_links(args.homepage_url, config, session, skip, state)]
+        LOG.info("Discovered %d candidate URLs", len(urls))
+        if checkpoint is not None:
+            checkpoint.save()
+            urls = checkpoint.remaining()
 
-    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
         sem = asyncio.Semaphore(config.concurrency)
-        tasks = [fetch_and_process(session, url, sem, config, not args.no_summarize) for url in urls]
-        results = await asyncio.gather(*tasks)
 
-    articles = [article.__dict__ for article in results if article]
+        async def process_and_record(url: str) -> Optional[ArticleData]:
+            article = await process(session, sem, url)
+            # The output below is built from the checkpoint records, so they are the write here.
+            if checkpoint is not None:
+                checkpoint.record(url, article)
+            return article
 
-    if args.output_format == "jsonl":
-        with open(args.output, "w", encoding="utf-8") as f:
-            for article in articles:
-                f.write(json.dumps(article, ensure_ascii=False) + "\n")
+        results = await asyncio.gather(*(process_and_record(url) for url in urls))
+
+    if checkpoint is not None:
+        # Includes articles finished by earlier, interrupted runs.
+        articles = checkpoint.articles()
     else:
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        articles = [article.__dict__ for article in results if article]
+
+    writer = open_writer(args.output, args.output_format)
+    try:
+        for article in articles:
+            writer.write(article)
+    finally:
+        writer.close()
+    if seen is not None:
+        for article in articles:
+            seen.record(article["url"], content_hash(article["content"]))
 
     LOG.info("Wrote %d articles to %s", len(articles), args.output)
 
 
+def _read_seeds(path: str) -> List[Tuple[str, Optional[int]]]:
+    """
+    Parse ``url [max_links]`` lines; blank lines and ``#`` comments are ignored.
+    Raises ValueError naming the file and line when a budget is not a positive integer.
+    """
+    seeds: List[Tuple[str, Optional[int]]] = []
+    with open(path, encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            parts = line.split("#", 1)[0].split()
+            if not parts:
+                continue
+            if len(parts) > 2 or (len(parts) == 2 and not (parts[1].isdecimal() and int(parts[1]) > 0)):
+                raise ValueError(f"{path}:{lineno}: expected 'url [max_links]', got {line.strip()!r}")
+            seeds.append((parts[0], int(parts[1]) if len(parts) > 1 else None))
+    return seeds
+
+
+async def _crawl_seeds(
+    args: argparse.Namespace,
+    config: CrawlerConfig,
+    skip: Optional[Callable[[str], bool]],
+    process: Callable[[aiohttp.ClientSession, asyncio.Semaphore, str], Awaitable[Optional[ArticleData]]],
+    on_done: Optional[Callable[[str, Optional[ArticleData]], None]] = None,
+) -> None:
+    """
+    Crawl many seeds concurrently in one process: one session/connector (DNS
+    cache, keep-alive), one robots cache and host scheduler, a per-seed link
+    budget and fetch limit, and every article appended to one output file.
+    """
+    seeds = args.seeds
+    seed_slots = asyncio.Semaphore(max(1, args.seed_concurrency))
+    written: Dict[str, int] = {}
+    LOG.info("Crawling %d seeds, %d at a time", len(seeds), args.seed_concurrency)
+    fmt = args.output_format
+    sink = PipelineSink(args.output, fmt=fmt) if args.pipeline else ArticleSink(args.output, fmt=fmt)
+    try:
+        limit = max(100, config.concurrency * args.seed_concurrency)
+        async with open_session(config, limit=limit) as session:
+
+            async def crawl_seed(seed: str, budget: Optional[int]) -> None:
+                seed_config = replace(config, max_links=budget) if budget else config
+                sem = asyncio.Semaphore(seed_config.concurrency)
+                written[seed] = 0
+
+                async def process_url(url: str) -> Optional[ArticleData]:
+                    article = await process(session, sem, url)
+                    if article:
+                        written[seed] += 1
+                    return article
+
+                async with seed_slots:
+                    try:
+                        await stream_crawl(seed, seed_config, session, process_url, sink, skip=skip, on_done=on_done)
+                    except Exception as exc:
+                        LOG.warning("Seed %s failed: %s", seed, exc)
+                LOG.info("Seed %s: %d articles", seed, written[seed])
+
+            await asyncio.gather(*(crawl_seed(seed, budget) for seed, budget in seeds))
+    finally:
+        await sink.close()
+
+    empty = sum(1 for count in written.values() if not count)
+    LOG.info("Wrote %d articles from %d seeds to %s (%d seeds empty)", sink.written, len(seeds), args.output, empty)
+
+
 if __name__ == "__main__":
     asyncio.run(main())
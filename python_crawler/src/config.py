@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -30,21 +30,61 @@ SKIP_EXTENSIONS = {
     ".mov",
 }
 
+# Query parameters dropped when canonicalizing links; "prefix*" matches by prefix.
+TRACKING_PARAMS = (
+    "utm_*",
+    "fbclid",
+    "gclid",
+    "dclid",
+    "gbraid",
+    "wbraid",
+    "msclkid",
+    "yclid",
+    "twclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_hsenc",
+    "_hsmi",
+    "mkt_tok",
+    "_ga",
+    "_gl",
+)
+
 
 @dataclass
 class CrawlerConfig:
     max_links: int = 20
     max_depth: int = 1
+    # "links" (BFS over <a href>), "sitemap", or "auto" (sitemaps, else links).
+    discovery: str = "links"
+    max_sitemaps: int = 50
+    sitemap_max_age: Optional[float] = None
     concurrency: int = 5
     request_timeout: int = 12
+    # Larger pages are abandoned mid-download (0 disables the cap).
+    max_response_bytes: int = 5 * 1024 * 1024
     request_delay: float = 0.0
+    per_host_concurrency: int = 4
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30.0
     max_retries: int = 3
+    # Longer Retry-After waits fail the URL instead of pausing the whole host.
+    max_retry_after: float = 120.0
     backoff_base: float = 0.8
     user_agent: str = DEFAULT_USER_AGENT
+    http_cache_path: Optional[str] = None
     allow_subdomains: bool = True
     respect_robots: bool = True
+    robots_ttl: float = 86400.0
+    robots_cache_path: Optional[str] = None
     js_fallback: bool = True
+    browser_pages: int = 2
     min_text_length: int = 600
+    parser_backend: str = "auto"
+    extract_workers: int = 0
+    extract_executor: str = "process"
     allowed_domains: List[str] = field(default_factory=list)
     include_patterns: List[str] = field(default_factory=list)
     exclude_patterns: List[str] = field(default_factory=list)
+    strip_params: List[str] = field(default_factory=lambda: list(TRACKING_PARAMS))
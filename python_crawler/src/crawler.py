@@ -1,17 +1,21 @@
+import asyncio
 import logging
-from collections import deque
-from typing import Deque, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
 
+from .checkpoint import FrontierState
 from .config import CrawlerConfig
-from .extractor import extract_text_and_title
-from .fetcher import fetch_dynamic, fetch_html
+from .extractor import ParsedPage, get_extraction_pool
+from .fetcher import ACCEPT_ENCODING, fetch_dynamic, fetch_html
+from .metrics import get_metrics
 from .models import ArticleData
-from .robots import RobotsCache
-from .utils import compile_patterns, matches_patterns, normalize_url, should_skip_url
+from .politeness import get_host_scheduler
+from .robots import get_robots_cache
+from .sitemaps import iter_sitemap_entries
+from .utils import UrlFilter, canonicalize_url, normalize_url
 
 LOG = logging.getLogger("python_crawler")
 
@@ -27,94 +31,260 @@ def _normalize_allowed_domains(allowed: List[str], default_domain: str) -> Set[s
     return normalized
 
 
+def _link_filter(homepage_url: str, config: CrawlerConfig) -> Callable[[str], Optional[str]]:
+    """Build the domain/pattern filter shared by link and sitemap discovery."""
+    allowed_domains = _normalize_allowed_domains(config.allowed_domains, urlparse(homepage_url).netloc)
+    url_filter = UrlFilter(
+        allowed_domains,
+        config.allow_subdomains,
+        config.include_patterns,
+        config.exclude_patterns,
+        config.strip_params,
+    )
+
+    def accept(link: str) -> Optional[str]:
+        href = url_filter(link)
+        return href if href != homepage_url else None
+
+    return accept
+
+
+def open_session(config: CrawlerConfig, limit: int = 100) -> aiohttp.ClientSession:
+    """
+    Client session for crawling: one pooled keep-alive connector with cached
+    DNS lookups, meant to be shared by discovery and fetching (and by every
+    seed in a multi-seed run).
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=max(config.concurrency, config.per_host_concurrency),
+        ttl_dns_cache=config.dns_cache_ttl,
+        keepalive_timeout=config.keepalive_timeout,
+    )
+    headers = {
+        "User-Agent": config.user_agent,
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    }
+    return aiohttp.ClientSession(connector=connector, headers=headers, trace_configs=get_metrics().trace_configs())
+
+
+async def extract_page(
+    html: str,
+    url: str,
+    config: CrawlerConfig,
+    text: bool = True,
+    links: bool = False,
+) -> ParsedPage:
+    pool = get_extraction_pool(config.extract_workers, config.extract_executor)
+    with get_metrics().timer("extract", urlparse(url).netloc):
+        return await pool.parse(html, url, config.parser_backend, text=text, links=links)
+
+
 async def fetch_article(session: aiohttp.ClientSession, url: str, config: CrawlerConfig) -> Optional[ArticleData]:
     html = await fetch_html(session, url, config)
+    rendered = False
 
     if not html and config.js_fallback:
-        html = await fetch_dynamic(url, config.user_agent)
+        html = await fetch_dynamic(url, config)
+        rendered = True
 
     if not html:
         return None
 
-    text, title = extract_text_and_title(html)
+    page = await extract_page(html, url, config)
+    text, title = page.text, page.title
 
-    if config.js_fallback and len(text) < config.min_text_length:
-        js_html = await fetch_dynamic(url, config.user_agent)
+    # Only re-render if the short text came from the static fetch.
+    if config.js_fallback and not rendered and len(text) < config.min_text_length:
+        js_html = await fetch_dynamic(url, config)
         if js_html:
-            js_text, js_title = extract_text_and_title(js_html)
+            js_page = await extract_page(js_html, url, config)
+            js_text, js_title = js_page.text, js_page.title
             if len(js_text) > len(text):
                 text = js_text
                 title = js_title or title
 
-    return ArticleData(url=url, title=title, content=text, source=url)
+    canonical = canonicalize_url(page.canonical, config.strip_params) if page.canonical else ""
+    return ArticleData(url=url, title=title, content=text, source=url, canonical_url=canonical)
 
 
-async def crawl_homepage(homepage_url: str, config: CrawlerConfig) -> List[str]:
+async def iter_homepage_links(
+    homepage_url: str,
+    config: CrawlerConfig,
+    session: Optional[aiohttp.ClientSession] = None,
+    skip: Optional[Callable[[str], bool]] = None,
+    state: Optional[FrontierState] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield article candidate links breadth-first as soon as they are discovered.
+
+    With ``config.discovery`` set to "sitemap" or "auto", candidates come from
+    the site's sitemaps instead (one or two fetches rather than a BFS); "auto"
+    falls back to the BFS when no sitemap yields a link.
+
+    Links for which ``skip`` returns True are still followed but neither
+    yielded nor counted toward ``max_links``. With ``state``, discovery picks
+    up from its pending pages and seen sets and keeps them current; links it
+    already collected are not yielded again.
+    """
     homepage_url = normalize_url(homepage_url)
     if not homepage_url:
-        return []
+        return
 
-    parsed_home = urlparse(homepage_url)
-    domain = parsed_home.netloc
+    if session is None:
+        async with open_session(config) as own_session:
+            links = iter_homepage_links(homepage_url, config, own_session, skip, state)
+            try:
+                async for link in links:
+                    yield link
+            finally:
+                # Stop the workers before the session closes underneath them.
+                await links.aclose()
+        return
 
-    allowed_domains = _normalize_allowed_domains(config.allowed_domains, domain)
+    accept = _link_filter(homepage_url, config)
 
-    include_patterns = compile_patterns(config.include_patterns)
-    exclude_patterns = compile_patterns(config.exclude_patterns)
+    if state is None:
+        state = FrontierState()
+    elif state.complete:
+        return
+    resuming = bool(state.scheduled)
 
-    queue: Deque[Tuple[str, int]] = deque([(homepage_url, 0)])
-    visited: Set[str] = set()
-    collected: List[str] = []
+    # Frontier of (url, depth); a URL is enqueued at most once.
+    frontier: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()
+    scheduled = state.scheduled
+    scheduled.add(homepage_url)
+    collected = state.collected
+    skipped = state.skipped
+    # Holds at most max_links URLs; None marks the end.
+    discovered: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+    limit_reached = asyncio.Event()
 
-    connector = aiohttp.TCPConnector(limit_per_host=config.concurrency)
-    headers = {"User-Agent": config.user_agent, "Accept": "text/html,application/xhtml+xml"}
+    robots = get_robots_cache(config.robots_ttl, config.robots_cache_path)
+    scheduler = get_host_scheduler(config.request_delay, config.per_host_concurrency)
 
-    robots = RobotsCache()
+    def claim(link: str) -> bool:
+        """Count a filtered link toward ``max_links`` unless already seen or skipped."""
+        if link in collected or link in skipped:
+            return False
+        if skip is not None and skip(link):
+            skipped.add(link)
+            return False
+        collected.add(link)
+        state.links.append(link)
+        if len(collected) >= config.max_links:
+            limit_reached.set()
+        return True
 
-    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
-        while queue and len(collected) < config.max_links:
-            url, depth = queue.popleft()
-            if url in visited:
-                continue
-            visited.add(url)
+    if config.discovery != "links":
+        since = None
+        if config.sitemap_max_age is not None:
+            since = datetime.now(timezone.utc) - timedelta(seconds=config.sitemap_max_age)
+        entries = iter_sitemap_entries(homepage_url, config, session, robots, since)
+        try:
+            async for entry in entries:
+                link = accept(entry.url)
+                if link and claim(link):
+                    yield link
+                if limit_reached.is_set():
+                    break
+        finally:
+            await entries.aclose()
+        LOG.info("Sitemaps yielded %d candidate URLs for %s", len(collected), homepage_url)
+        # "auto" falls back to link discovery when the site has no usable sitemap.
+        if collected or config.discovery == "sitemap":
+            state.complete = True
+            return
 
-            if config.respect_robots:
-                allowed = await robots.allowed(session, url, config.user_agent, config.request_timeout)
-                if not allowed:
-                    continue
+    async def discover(url: str, depth: int) -> None:
+        if config.respect_robots:
+            allowed = await robots.allowed(session, url, config.user_agent, config.request_timeout)
+            if not allowed:
+                return
+            scheduler.set_crawl_delay(url, robots.crawl_delay(url, config.user_agent))
 
-            html = await fetch_html(session, url, config)
-            if not html:
-                continue
+        html = await fetch_html(session, url, config)
+        if not html or limit_reached.is_set():
+            return
 
-            soup = BeautifulSoup(html, "html.parser")
-            found: List[str] = []
-            for a in soup.find_all("a", href=True):
-                href = normalize_url(urljoin(url, a["href"]))
-                if not href or should_skip_url(href):
-                    continue
+        page = await extract_page(html, url, config, text=False, links=True)
+        found = [href for href in (accept(link) for link in page.links) if href]
 
-                parsed = urlparse(href)
-                if config.allow_subdomains:
-                    if not any(parsed.netloc == d or parsed.netloc.endswith("." + d) for d in allowed_domains):
-                        continue
-                else:
-                    if parsed.netloc not in allowed_domains:
-                        continue
+        canonical = accept(page.canonical) if page.canonical else None
+        if canonical and canonical != url:
+            # The same document under its canonical URL: neither expand nor yield it again.
+            scheduled.add(canonical)
+            if url in collected:
+                skipped.add(canonical)
 
-                if not matches_patterns(href, include_patterns, exclude_patterns):
-                    continue
-
-                if href != homepage_url:
-                    found.append(href)
+        for link in found:
+            # No await between the check and the put, so the cap holds across workers.
+            if limit_reached.is_set():
+                return
+            if claim(link):
+                discovered.put_nowait(link)
 
+        if depth + 1 < config.max_depth:
             for link in found:
-                if link not in collected and len(collected) < config.max_links:
-                    collected.append(link)
+                if link not in scheduled:
+                    scheduled.add(link)
+                    state.pending[link] = depth + 1
+                    frontier.put_nowait((link, depth + 1))
+
+    async def worker() -> None:
+        while True:
+            url, depth = await frontier.get()
+            try:
+                if not limit_reached.is_set():
+                    await discover(url, depth)
+                state.pending.pop(url, None)
+            except Exception as exc:
+                state.pending.pop(url, None)
+                LOG.warning("Link discovery failed for %s: %s", url, exc)
+            finally:
+                frontier.task_done()
+
+    async def coordinate() -> None:
+        exhausted = asyncio.ensure_future(frontier.join())
+        capped = asyncio.ensure_future(limit_reached.wait())
+        try:
+            await asyncio.wait({exhausted, capped}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            exhausted.cancel()
+            capped.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        discovered.put_nowait(None)
+
+    if not resuming:
+        state.pending[homepage_url] = 0
+    for url, depth in state.pending.items():
+        frontier.put_nowait((url, depth))
+    if len(collected) >= config.max_links:
+        limit_reached.set()
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, config.concurrency))]
+    coordinator = asyncio.create_task(coordinate())
+
+    try:
+        while True:
+            link = await discovered.get()
+            if link is None:
+                state.complete = True
+                break
+            yield link
+    finally:
+        coordinator.cancel()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(coordinator, *workers, return_exceptions=True)
 
-            if depth + 1 < config.max_depth:
-                for link in found:
-                    if link not in visited:
-                        queue.append((link, depth + 1))
 
-    return collected
+async def crawl_homepage(
+    homepage_url: str,
+    config: CrawlerConfig,
+    skip: Optional[Callable[[str], bool]] = None,
+    state: Optional[FrontierState] = None,
+) -> List[str]:
+    return [link async for link in iter_homepage_links(homepage_url, config, skip=skip, state=state)]
@@ -0,0 +1,180 @@
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+FINGERPRINT_BITS = 64
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_MASK = (1 << FINGERPRINT_BITS) - 1
+
+
+# Per-bit counters are packed into one big int, LANE_BITS wide each, so a
+# feature's 64 votes are added with a handful of integer ops instead of a loop.
+_LANE_BITS = 32
+_SPREAD = [sum((byte >> i & 1) << (i * _LANE_BITS) for i in range(8)) for byte in range(256)]
+
+
+def _feature_votes(feature: str) -> int:
+    # blake2b is stable across processes, unlike hash(), so stored fingerprints stay comparable.
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    votes = 0
+    for index, byte in enumerate(reversed(digest)):
+        votes |= _SPREAD[byte] << (index * 8 * _LANE_BITS)
+    return votes
+
+
+def simhash(text: str, shingle: int = 3, min_words: int = 0) -> Optional[int]:
+    """
+    64-bit SimHash over word shingles of ``text``.
+
+    Near-identical texts (a changed byline, boilerplate, tracking footer) get
+    fingerprints a few bits apart. Returns None when there is too little text.
+    """
+    words = _TOKEN_RE.findall(text.lower())
+    if len(words) < max(shingle, min_words):
+        return None
+    features = Counter(" ".join(words[i : i + shingle]) for i in range(len(words) - shingle + 1))
+
+    ones = 0
+    for feature, count in features.items():
+        ones += _feature_votes(feature) * count
+    total = sum(features.values())
+
+    lane = (1 << _LANE_BITS) - 1
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        # Majority vote: more (weighted) features have this bit set than not.
+        if (ones >> (bit * _LANE_BITS) & lane) * 2 > total:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _to_signed(value: int) -> int:
+    # SQLite integers are signed 64-bit.
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class NearDuplicateIndex:
+    """
+    SimHash fingerprints of extracted article text with a banded LSH index.
+
+    Fingerprints are split into ``max_distance + 1`` bands, so any two within
+    ``max_distance`` bits share at least one band exactly and only those
+    buckets are compared. With ``path`` the fingerprints are kept in SQLite
+    so duplicates of articles from earlier runs are caught too.
+    """
+
+    def __init__(self, max_distance: int = 6, path: Optional[str] = None, min_words: int = 50):
+        self.max_distance = min(max(0, max_distance), FINGERPRINT_BITS - 1)
+        self.min_words = min_words
+        self.duplicates = 0
+        # Spread the 64 bits as evenly as possible; a narrow band would make huge buckets.
+        bands = self.max_distance + 1
+        self._spans: List[Tuple[int, int]] = []
+        shift = 0
+        for band in range(bands):
+            width = FINGERPRINT_BITS // bands + (1 if band < FINGERPRINT_BITS % bands else 0)
+            self._spans.append((shift, (1 << width) - 1))
+            shift += width
+        self._buckets: DefaultDict[Tuple[int, int], List[str]] = defaultdict(list)
+        self._fingerprints: Dict[str, int] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints (url TEXT PRIMARY KEY, simhash INTEGER NOT NULL, "
+                "stored_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+            for url, value in self._conn.execute("SELECT url, simhash FROM fingerprints"):
+                self._index(url, value & _MASK)
+
+    def _keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [(band, fingerprint >> shift & mask) for band, (shift, mask) in enumerate(self._spans)]
+
+    def _index(self, url: str, fingerprint: int) -> None:
+        previous = self._fingerprints.get(url)
+        if previous is not None:
+            for key in self._keys(previous):
+                self._buckets[key].remove(url)
+        self._fingerprints[url] = fingerprint
+        for key in self._keys(fingerprint):
+            self._buckets[key].append(url)
+
+    def find(self, fingerprint: int, exclude: str = "") -> Optional[str]:
+        """Return the closest indexed URL within ``max_distance`` bits, if any."""
+        best: Optional[str] = None
+        best_distance = self.max_distance + 1
+        for key in self._keys(fingerprint):
+            for url in self._buckets.get(key, ()):
+                if url == exclude:
+                    continue
+                distance = hamming(fingerprint, self._fingerprints[url])
+                if distance < best_distance:
+                    best, best_distance = url, distance
+        return best
+
+    def add(self, url: str, fingerprint: int) -> None:
+        self._index(url, fingerprint)
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (url, simhash, stored_at) VALUES (?, ?, ?)",
+                (url, _to_signed(fingerprint), time.time()),
+            )
+            self._conn.commit()
+
+    def check(self, url: str, text: str) -> Optional[str]:
+        """
+        Return the canonical URL if ``text`` near-duplicates an indexed article;
+        otherwise index it under ``url`` and return None.
+        """
+        fingerprint = simhash(text, min_words=self.min_words)
+        if fingerprint is None:
+            return None
+        canonical = self.find(fingerprint, exclude=url)
+        if canonical is not None:
+            self.duplicates += 1
+            return canonical
+        self.add(url, fingerprint)
+        return None
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class CanonicalIndex:
+    """
+    First URL fetched for each canonical URL of a run. A page whose
+    ``<link rel="canonical">`` (or own URL) was already claimed by another
+    URL is an exact duplicate, e.g. a print view or a tracking variant.
+    """
+
+    def __init__(self) -> None:
+        self._owners: Dict[str, str] = {}
+        self.duplicates = 0
+
+    def check(self, url: str, canonical: str = "") -> Optional[str]:
+        """Return the URL that already holds this page's canonical URL, or claim it for ``url``."""
+        owner = None
+        for key in {url, canonical or url}:
+            holder = self._owners.setdefault(key, url)
+            if holder != url:
+                owner = holder
+        if owner is not None:
+            self.duplicates += 1
+        return owner
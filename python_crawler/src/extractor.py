@@ -1,4 +1,9 @@
-from typing import Tuple
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
@@ -7,30 +12,241 @@ try:
 except Exception:  # pragma: no cover
     Document = None
 
+try:
+    import lxml.html as lxml_html
+except Exception:  # pragma: no cover
+    lxml_html = None
 
-def _clean_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside", "form"]):
-        tag.decompose()
-    return str(soup)
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except Exception:  # pragma: no cover
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except Exception:
+        SelectolaxParser = None
+
+LOG = logging.getLogger("python_crawler")
+
+NOISE_TAGS = ["script", "style", "noscript", "header", "footer", "nav", "aside", "form"]
 
 
-def extract_text_and_title(html: str) -> Tuple[str, str]:
-    title = "Untitled"
-    cleaned_html = html
+@dataclass
+class ParsedPage:
+    title: str = "Untitled"
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    # Absolute <link rel="canonical"> target, if the page declares one.
+    canonical: str = ""
+
+
+def _join_lines(pieces: Any) -> str:
+    lines = [line.strip() for piece in pieces for line in piece.splitlines() if line.strip()]
+    return "\n".join(lines)
+
+
+def _absolute(hrefs: Any, base_url: str) -> List[str]:
+    links = []
+    for href in hrefs:
+        if not href:
+            continue
+        try:
+            links.append(urljoin(base_url, href.strip()) if base_url else href.strip())
+        except ValueError:  # e.g. "http://[broken"
+            continue
+    return links
+
 
+def _is_canonical(rel: Any) -> bool:
+    # BeautifulSoup hands multi-valued attributes over as lists.
+    values = rel if isinstance(rel, list) else (rel or "").split()
+    return any(value.lower() == "canonical" for value in values)
+
+
+def _canonical(hrefs: Any, base_url: str) -> str:
+    links = _absolute(hrefs, base_url)
+    return links[0] if links else ""
+
+
+def _parse_lxml(html: str, base_url: str, want_text: bool, want_links: bool) -> ParsedPage:
+    try:
+        tree = lxml_html.document_fromstring(html)
+    except Exception:
+        # e.g. empty documents or str input carrying an XML encoding declaration
+        return _parse_html_parser(html, base_url, want_text, want_links)
+
+    page = ParsedPage()
+    if want_links:
+        page.links = _absolute((a.get("href") for a in tree.iter("a")), base_url)
+    page.canonical = _canonical(
+        (link.get("href") for link in tree.iter("link") if _is_canonical(link.get("rel"))),
+        base_url,
+    )
+    page.title = (tree.findtext(".//title") or "").strip() or page.title
+
+    if not want_text:
+        return page
+
+    content = None
     if Document:
         try:
-            doc = Document(html)
-            title = doc.short_title() or title
-            cleaned_html = doc.summary()
+            # readability deep-copies the tree instead of re-parsing the string
+            doc = Document(tree)
+            page.title = doc.short_title() or page.title
+            content = lxml_html.fromstring(doc.summary(html_partial=True))
         except Exception:
-            cleaned_html = html
+            content = None
+    if content is None:
+        content = tree.body if tree.find("body") is not None else tree
+
+    for element in [el for el in content.iter(*NOISE_TAGS) if el is not content]:
+        element.drop_tree()
+    page.text = _join_lines(content.itertext())
+    return page
+
+
+def _parse_selectolax(html: str, base_url: str, want_text: bool, want_links: bool) -> ParsedPage:
+    tree = SelectolaxParser(html)
+    page = ParsedPage()
+    if want_links:
+        page.links = _absolute((a.attributes.get("href") for a in tree.css("a[href]")), base_url)
+    page.canonical = _canonical(
+        (link.attributes.get("href") for link in tree.css("link[rel]") if _is_canonical(link.attributes.get("rel"))),
+        base_url,
+    )
+    title_node = tree.css_first("title")
+    if title_node is not None:
+        page.title = title_node.text(strip=True) or page.title
+
+    if want_text:
+        # No readability on this backend: prefer the semantic main container.
+        tree.strip_tags(NOISE_TAGS)
+        root = tree.css_first("article") or tree.css_first("main") or tree.body
+        page.text = _join_lines([root.text(separator="\n")]) if root is not None else ""
+    return page
+
 
-    soup = BeautifulSoup(_clean_html(cleaned_html), "html.parser")
+def _parse_html_parser(html: str, base_url: str, want_text: bool, want_links: bool) -> ParsedPage:
+    soup = BeautifulSoup(html, "html.parser")
+    page = ParsedPage()
+    if want_links:
+        page.links = _absolute((a["href"] for a in soup.find_all("a", href=True)), base_url)
+    page.canonical = _canonical(
+        (link.get("href") for link in soup.find_all("link", rel=True) if _is_canonical(link.get("rel"))), base_url
+    )
     if soup.title and soup.title.string:
-        title = soup.title.string.strip() or title
+        page.title = soup.title.string.strip() or page.title
+
+    if want_text:
+        # Same container heuristic as selectolax (readability needs lxml anyway).
+        for tag in soup(NOISE_TAGS):
+            tag.decompose()
+        root = soup.find("article") or soup.find("main") or soup.body or soup
+        page.text = _join_lines([root.get_text(separator="\n")])
+    return page
+
+
+_BACKENDS: Dict[str, Tuple[Callable[[str, str, bool, bool], ParsedPage], Optional[Any]]] = {
+    "lxml": (_parse_lxml, lxml_html),
+    "selectolax": (_parse_selectolax, SelectolaxParser),
+    "html.parser": (_parse_html_parser, BeautifulSoup),
+}
+
+
+def available_backends() -> List[str]:
+    return [name for name, (_, module) in _BACKENDS.items() if module is not None]
+
+
+def resolve_backend(name: str = "auto") -> str:
+    """
+    Map a requested backend to an installed one (auto prefers lxml, then selectolax, then html.parser).
+
+    Only lxml runs readability's content scoring. selectolax and html.parser
+    trade extraction quality for speed: they keep the text of the page's
+    <article> or <main> (else <body>) minus NOISE_TAGS, so boilerplate outside
+    those tags, or inside them, can end up in the text.
+    """
+    installed = available_backends()
+    if name in installed:
+        return name
+    return installed[0]
+
+
+def parse_page(
+    html: str,
+    base_url: str = "",
+    backend: str = "auto",
+    text: bool = True,
+    links: bool = True,
+) -> ParsedPage:
+    """Parse a document once and return its title, cleaned text and absolute links."""
+    parse, _ = _BACKENDS[resolve_backend(backend)]
+    return parse(html, base_url, text, links)
+
+
+def extract_text_and_title(html: str, backend: str = "auto") -> Tuple[str, str]:
+    page = parse_page(html, backend=backend, links=False)
+    return page.text, page.title
+
+
+class ExtractionPool:
+    """
+    Runs ``parse_page`` off the event loop so sockets keep being serviced
+    while large pages parse.
+
+    ``workers=0`` parses inline. At most ``max_pending`` parses are queued or
+    running; further callers wait, which throttles the fetchers feeding them.
+    """
+
+    def __init__(self, workers: int = 0, kind: str = "process", max_pending: Optional[int] = None):
+        self.workers = max(0, workers)
+        self.kind = kind
+        self._executor: Optional[Executor] = None
+        if self.workers:
+            if kind == "thread":
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="extract")
+            else:
+                self._executor = ProcessPoolExecutor(self.workers)
+            LOG.info("Extraction pool: %d %s workers", self.workers, kind)
+        self.max_pending = max_pending or max(1, self.workers * 2)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def parse(
+        self,
+        html: str,
+        base_url: str = "",
+        backend: str = "auto",
+        text: bool = True,
+        links: bool = True,
+    ) -> ParsedPage:
+        if self._executor is None:
+            return parse_page(html, base_url, backend, text, links)
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        async with self._slots:
+            return await loop.run_in_executor(self._executor, parse_page, html, base_url, backend, text, links)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+_shared_pool: Optional[ExtractionPool] = None
+
+
+def get_extraction_pool(workers: int = 0, kind: str = "process") -> ExtractionPool:
+    """Return the process-wide extraction pool, creating it on first use."""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = ExtractionPool(workers, kind)
+    return _shared_pool
+
 
-    text = soup.get_text(separator="\n")
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    return "\n".join(lines), title
+def close_extraction_pool() -> None:
+    global _shared_pool
+    if _shared_pool is not None:
+        _shared_pool.close()
+        _shared_pool = None
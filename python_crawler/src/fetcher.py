@@ -1,40 +1,102 @@
 import asyncio
+import codecs
+import importlib.util
 import logging
 import random
+import re
+import time
 from typing import Optional
+from urllib.parse import urlparse
 
 import aiohttp
 
-from .config import CrawlerConfig
-
 try:
-    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-except Exception:  # pragma: no cover
-    async_playwright = None
-    PlaywrightTimeoutError = Exception
+    from charset_normalizer import from_bytes as detect_charset
+except Exception:  # pragma: no cover - optional dependency
+    detect_charset = None
+
+from .browser import get_browser_pool
+from .config import CrawlerConfig
+from .http_cache import HttpCache, get_http_cache
+from .metrics import get_metrics
+from .politeness import get_host_scheduler, parse_retry_after
 
 LOG = logging.getLogger("python_crawler")
 
+# aiohttp decodes brotli only when one of these packages is installed.
+HAS_BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+READ_CHUNK = 64 * 1024
+# How much of the document is searched for <meta charset> / fed to detection.
+SNIFF_BYTES = 4096
+DETECT_BYTES = 64 * 1024
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_.:-]+)""", re.IGNORECASE)
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
 
-async def fetch_dynamic(url: str, user_agent: str) -> Optional[str]:
-    if async_playwright is None:
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip()).name
+    except LookupError:
         return None
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True, args=["--no-sandbox"])
-        page = await browser.new_page(user_agent=user_agent)
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=20000)
-        except PlaywrightTimeoutError:
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=20000)
-            except PlaywrightTimeoutError:
-                await browser.close()
-                return None
 
-        html = await page.content()
-        await browser.close()
-        return html
+def decode_html(body: bytes, header_charset: Optional[str] = None) -> str:
+    """
+    Decode with the BOM, HTTP header or ``<meta>`` charset; only when none is
+    usable, try UTF-8 and then run detection on a bounded prefix.
+    """
+    for bom, encoding in _BOMS:
+        if body.startswith(bom):
+            return body.decode(encoding, errors="replace")
+
+    encoding = _known_encoding(header_charset)
+    if encoding is None:
+        match = _META_CHARSET_RE.search(body, 0, SNIFF_BYTES)
+        encoding = _known_encoding(match.group(1).decode("ascii")) if match else None
+        if encoding is not None and encoding.startswith("utf-16"):
+            # A <meta> readable as ASCII can't be UTF-16; browsers take it as UTF-8.
+            encoding = "utf-8"
+    if encoding is not None:
+        return body.decode(encoding, errors="replace")
+
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    if detect_charset is not None:
+        best = detect_charset(body[:DETECT_BYTES]).best()
+        if best is not None and _known_encoding(best.encoding):
+            return body.decode(best.encoding, errors="replace")
+    return body.decode("cp1252", errors="replace")
+
+
+async def read_body(resp: aiohttp.ClientResponse, max_bytes: int) -> Optional[bytes]:
+    """Read the (decompressed) body in chunks; None as soon as it grows past ``max_bytes``."""
+    declared = resp.content_length
+    if max_bytes and declared is not None and declared > max_bytes:
+        return None
+    chunks = []
+    size = 0
+    async for chunk in resp.content.iter_chunked(READ_CHUNK):
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def fetch_dynamic(url: str, config: CrawlerConfig) -> Optional[str]:
+    pool = get_browser_pool(config.user_agent, max_pages=config.browser_pages)
+    metrics = get_metrics()
+    host = urlparse(url).netloc
+    metrics.incr("js_fallback", host)
+    async with get_host_scheduler(config.request_delay, config.per_host_concurrency).slot(url):
+        with metrics.timer("render", host):
+            return await pool.fetch(url)
 
 
 async def fetch_html(
@@ -43,27 +105,78 @@ async def fetch_html(
     config: CrawlerConfig,
 ) -> Optional[str]:
     timeout = aiohttp.ClientTimeout(total=config.request_timeout)
+    cache = get_http_cache(config.http_cache_path) if config.http_cache_path else None
+    cached = cache.get(url) if cache else None
+    headers = HttpCache.validators(cached) if cached else None
+
+    scheduler = get_host_scheduler(config.request_delay, config.per_host_concurrency)
+    metrics = get_metrics()
+    host = urlparse(url).netloc
 
     for attempt in range(config.max_retries + 1):
-        if config.request_delay > 0:
-            await asyncio.sleep(config.request_delay)
+        retry_after: Optional[float] = None
         try:
-            async with session.get(url, timeout=timeout) as resp:
-                if resp.status in {403, 429, 500, 502, 503, 504}:
-                    raise aiohttp.ClientResponseError(
-                        status=resp.status,
-                        request_info=resp.request_info,
-                        history=resp.history,
-                    )
-                content_type = resp.headers.get("Content-Type", "")
-                if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
-                    return None
-                return await resp.text()
+            async with scheduler.slot(url):
+                started = time.perf_counter()
+                async with session.get(url, timeout=timeout, headers=headers) as resp:
+                    if resp.status == 304 and cached is not None:
+                        cache.mark_revalidated(url)
+                        metrics.incr("not_modified", host)
+                        return cached.body
+                    if resp.status in {429, 503}:
+                        retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                        if retry_after is not None and retry_after > config.max_retry_after:
+                            # Deferring would stall every request to the host; give up on this URL.
+                            LOG.warning(
+                                "Giving up on %s: Retry-After %.0fs exceeds %.0fs",
+                                url,
+                                retry_after,
+                                config.max_retry_after,
+                            )
+                            metrics.incr("retry_after_exceeded", host)
+                            return None
+                        if retry_after is not None:
+                            # Everyone waits on this host, not just this request.
+                            scheduler.defer(url, retry_after)
+                    if resp.status in {403, 429, 500, 502, 503, 504}:
+                        metrics.incr(f"http_{resp.status}", host)
+                        raise aiohttp.ClientResponseError(
+                            status=resp.status,
+                            request_info=resp.request_info,
+                            history=resp.history,
+                        )
+                    content_type = resp.headers.get("Content-Type", "")
+                    if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
+                        return None
+                    headers_at = time.perf_counter()
+                    raw = await read_body(resp, config.max_response_bytes)
+                    if raw is None:
+                        LOG.info("Skipping %s: body larger than %d bytes", url, config.max_response_bytes)
+                        metrics.incr("too_large", host)
+                        return None
+                    body = decode_html(raw, resp.charset)
+                    finished = time.perf_counter()
+                    metrics.observe("download", finished - headers_at, host)
+                    metrics.observe("request", finished - started, host)
+                    metrics.incr("bytes", host, resp.content.total_bytes)
+                    metrics.incr("pages", host)
+                    if cache is not None:
+                        cache.put(
+                            url,
+                            body,
+                            content_type,
+                            etag=resp.headers.get("ETag"),
+                            last_modified=resp.headers.get("Last-Modified"),
+                        )
+                    return body
         except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
             if attempt >= config.max_retries:
                 LOG.warning("Fetch failed for %s: %s", url, exc)
+                metrics.incr("fetch_failed", host)
                 return None
-            backoff = config.backoff_base * (2 ** attempt) + random.uniform(0, 0.3)
-            await asyncio.sleep(backoff)
+            metrics.incr("retry", host)
+            if retry_after is None:
+                backoff = config.backoff_base * (2 ** attempt) + random.uniform(0, 0.3)
+                await asyncio.sleep(backoff)
 
     return None
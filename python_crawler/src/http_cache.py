@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: str
+    body: str
+    stored_at: float
+
+
+class HttpCache:
+    """
+    On-disk store of page bodies (zlib-compressed) and their HTTP validators,
+    used to revalidate with If-None-Match / If-Modified-Since and serve 304s.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.revalidated = 0
+        self.stored = 0
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_type TEXT NOT NULL, "
+            "body BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        row = self._conn.execute(
+            "SELECT url, etag, last_modified, content_type, body, stored_at FROM http_cache WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            body = zlib.decompress(row[4]).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            return None
+        return CachedResponse(row[0], row[1], row[2], row[3], body, row[5])
+
+    @staticmethod
+    def validators(entry: CachedResponse) -> Dict[str, str]:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        content_type: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        # Without a validator the entry could never be revalidated, and an older
+        # entry's validators no longer describe this body: forget the URL.
+        if not etag and not last_modified:
+            self._conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            self._conn.commit()
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, content_type, body, stored_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, content_type, zlib.compress(body.encode("utf-8")), time.time()),
+        )
+        self._conn.commit()
+        self.stored += 1
+
+    def mark_revalidated(self, url: str) -> None:
+        self._conn.execute("UPDATE http_cache SET stored_at = ? WHERE url = ?", (time.time(), url))
+        self._conn.commit()
+        self.revalidated += 1
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_shared_caches: Dict[str, HttpCache] = {}
+
+
+def get_http_cache(path: str) -> HttpCache:
+    """Return the process-wide cache for ``path``, opening it on first use."""
+    if path not in _shared_caches:
+        _shared_caches[path] = HttpCache(path)
+    return _shared_caches[path]
+
+
+def close_http_caches() -> None:
+    while _shared_caches:
+        _, cache = _shared_caches.popitem()
+        cache.close()
@@ -0,0 +1,187 @@
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import DefaultDict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+QUANTILES = (0.5, 0.95, 0.99)
+# Phases broken down per host in the --stats summary.
+HOST_PHASES = ("request", "ttfb", "download")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(q * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+class CrawlMetrics:
+    """
+    Phase timings (seconds), byte counts and event counters for one crawl.
+
+    Every call is a no-op until ``enabled`` is set, so instrumented code
+    paths cost nothing when ``--stats`` / ``--metrics-file`` are off.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.started = time.monotonic()
+        self._phases: DefaultDict[str, List[float]] = defaultdict(list)
+        self._host_phases: DefaultDict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.counters: Counter = Counter()
+        self.host_counters: Counter = Counter()
+
+    def observe(self, phase: str, seconds: float, host: Optional[str] = None) -> None:
+        if not self.enabled:
+            return
+        self._phases[phase].append(seconds)
+        if host:
+            self._host_phases[(host, phase)].append(seconds)
+
+    def incr(self, event: str, host: Optional[str] = None, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        self.counters[event] += amount
+        if host:
+            self.host_counters[(host, event)] += amount
+
+    @contextmanager
+    def timer(self, phase: str, host: Optional[str] = None) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start, host)
+
+    def trace_configs(self) -> List[aiohttp.TraceConfig]:
+        """aiohttp hooks for DNS, connect and time-to-first-byte; pass to ClientSession."""
+        if not self.enabled:
+            return []
+        trace = aiohttp.TraceConfig(trace_config_ctx_factory=lambda trace_request_ctx: SimpleNamespace())
+
+        async def on_request_start(session, ctx, params) -> None:
+            ctx.start = time.perf_counter()
+
+        async def on_request_end(session, ctx, params) -> None:
+            self.observe("ttfb", time.perf_counter() - ctx.start, urlparse(str(params.url)).netloc)
+
+        async def on_dns_start(session, ctx, params) -> None:
+            ctx.dns_start = time.perf_counter()
+
+        async def on_dns_end(session, ctx, params) -> None:
+            self.observe("dns", time.perf_counter() - ctx.dns_start, params.host)
+
+        async def on_connect_start(session, ctx, params) -> None:
+            ctx.connect_start = time.perf_counter()
+
+        async def on_connect_end(session, ctx, params) -> None:
+            self.observe("connect", time.perf_counter() - ctx.connect_start)
+
+        async def on_reuse(session, ctx, params) -> None:
+            self.incr("connection_reused")
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        trace.on_connection_reuseconn.append(on_reuse)
+        return [trace]
+
+    def _rows(self) -> List[Tuple[str, List[float]]]:
+        return [(phase, sorted(values)) for phase, values in sorted(self._phases.items())]
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        lines = [f"{'phase':<16}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'total':>10}"]
+        for phase, values in self._rows():
+            lines.append(
+                f"{phase:<16}{len(values):>7}"
+                + "".join(f"{percentile(values, q):>9.3f}" for q in QUANTILES)
+                + f"{values[-1]:>9.3f}{sum(values):>10.2f}"
+            )
+
+        hosts = sorted({host for host, _ in self._host_phases})
+        if hosts:
+            lines.append("")
+            lines.append(f"{'host':<32}{'phase':<10}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+            for host in hosts:
+                for phase in HOST_PHASES:
+                    values = sorted(self._host_phases.get((host, phase), []))
+                    if values:
+                        lines.append(
+                            f"{host:<32}{phase:<10}{len(values):>7}"
+                            + "".join(f"{percentile(values, q):>9.3f}" for q in QUANTILES)
+                        )
+
+        pages = self.counters.get("pages", 0)
+        events = ", ".join(f"{name}={count}" for name, count in sorted(self.counters.items()))
+        lines.append("")
+        rate = pages / elapsed if elapsed else 0.0
+        lines.append(f"elapsed {elapsed:.1f}s, {rate:.2f} pages/s; {events or 'no events'}")
+        return "\n".join(lines)
+
+    def write_prometheus(self, path: str) -> None:
+        """Write a node_exporter textfile-collector file (atomically)."""
+        out: List[str] = [
+            "# HELP crawler_phase_seconds Crawl phase durations.",
+            "# TYPE crawler_phase_seconds summary",
+        ]
+        for phase, values in self._rows():
+            for q in QUANTILES:
+                out.append(f'crawler_phase_seconds{{phase="{phase}",quantile="{q}"}} {percentile(values, q):.6f}')
+            out.append(f'crawler_phase_seconds_sum{{phase="{phase}"}} {sum(values):.6f}')
+            out.append(f'crawler_phase_seconds_count{{phase="{phase}"}} {len(values)}')
+
+        out += [
+            "# HELP crawler_host_phase_seconds Crawl phase durations per host.",
+            "# TYPE crawler_host_phase_seconds summary",
+        ]
+        for (host, phase), values in sorted(self._host_phases.items()):
+            values = sorted(values)
+            labels = f'host="{_escape(host)}",phase="{phase}"'
+            for q in QUANTILES:
+                out.append(f'crawler_host_phase_seconds{{{labels},quantile="{q}"}} {percentile(values, q):.6f}')
+            out.append(f"crawler_host_phase_seconds_sum{{{labels}}} {sum(values):.6f}")
+            out.append(f"crawler_host_phase_seconds_count{{{labels}}} {len(values)}")
+
+        out += ["# HELP crawler_events_total Crawl event counters.", "# TYPE crawler_events_total counter"]
+        for event, count in sorted(self.counters.items()):
+            out.append(f'crawler_events_total{{event="{event}"}} {count}')
+        out.append("# TYPE crawler_host_events_total counter")
+        for (host, event), count in sorted(self.host_counters.items()):
+            out.append(f'crawler_host_events_total{{host="{_escape(host)}",event="{event}"}} {count}')
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write("\n".join(out) + "\n")
+        os.replace(tmp_path, path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+_shared_metrics = CrawlMetrics()
+
+
+def get_metrics() -> CrawlMetrics:
+    """Return the process-wide metrics registry (disabled unless enabled by the CLI)."""
+    return _shared_metrics
+
+
+def enable_metrics() -> CrawlMetrics:
+    global _shared_metrics
+    _shared_metrics = CrawlMetrics(enabled=True)
+    return _shared_metrics
@@ -9,3 +9,7 @@ class ArticleData:
     source: str
     summary: str = ""
     fetched_at: str = ""
+    # URL of the earlier article this one near-duplicates (not summarized again).
+    duplicate_of: str = ""
+    # <link rel="canonical"> of the page, tracking parameters stripped.
+    canonical_url: str = ""
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+from .metrics import get_metrics
+
+LOG = logging.getLogger("python_crawler")
+
+
+@dataclass
+class _HostState:
+    slots: asyncio.Semaphore
+    delay: float
+    next_allowed: float = 0.0
+    crawl_delay: Optional[float] = None
+    waited: float = 0.0
+
+
+class HostScheduler:
+    """
+    Per-host politeness: requests to one netloc are spaced ``delay`` seconds
+    apart (or by the robots Crawl-delay, whichever is larger) with at most
+    ``max_per_host`` in flight, while different hosts proceed independently.
+    """
+
+    def __init__(self, delay: float = 0.0, max_per_host: int = 4, max_crawl_delay: float = 60.0):
+        self.delay = max(0.0, delay)
+        self.max_per_host = max(1, max_per_host)
+        self.max_crawl_delay = max_crawl_delay
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(slots=asyncio.Semaphore(self.max_per_host), delay=self.delay)
+            self._hosts[host] = state
+        return state
+
+    def set_crawl_delay(self, url: str, crawl_delay: Optional[float]) -> None:
+        if crawl_delay is None:
+            return
+        state = self._state(urlparse(url).netloc)
+        if state.crawl_delay == crawl_delay:
+            return
+        state.crawl_delay = crawl_delay
+        state.delay = max(self.delay, min(float(crawl_delay), self.max_crawl_delay))
+        LOG.info("Crawl-delay %.2fs for %s", state.delay, urlparse(url).netloc)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold back every request to this host for ``seconds`` (e.g. Retry-After)."""
+        state = self._state(urlparse(url).netloc)
+        state.next_allowed = max(state.next_allowed, time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        host = urlparse(url).netloc
+        state = self._state(host)
+        queued = time.monotonic()
+        async with state.slots:
+            # Reserve the next send time without awaiting, so concurrent
+            # callers for the same host queue up one delay apart.
+            now = time.monotonic()
+            start = max(now, state.next_allowed)
+            state.next_allowed = start + state.delay
+            if start > now:
+                state.waited += start - now
+                await asyncio.sleep(start - now)
+            get_metrics().observe("host_wait", max(now, start) - queued, host)
+            yield
+
+    def stats(self) -> Dict[str, float]:
+        return {host: round(state.waited, 3) for host, state in self._hosts.items()}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+_shared_scheduler: Optional[HostScheduler] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_host_scheduler(delay: float = 0.0, max_per_host: int = 4) -> HostScheduler:
+    """Return the scheduler shared by every fetch on the running event loop."""
+    global _shared_scheduler, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_scheduler is None or _shared_loop is not loop:
+        _shared_scheduler = HostScheduler(delay, max_per_host)
+        _shared_loop = loop
+    return _shared_scheduler
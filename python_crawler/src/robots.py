@@ -1,28 +1,196 @@
-from typing import Dict
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from urllib import robotparser
 
 import aiohttp
 
+LOG = logging.getLogger("python_crawler")
+
+# Failed robots fetches are retried sooner than the normal TTL and never persisted.
+FAILURE_TTL_SECONDS = 300.0
+
+
+@dataclass
+class _RobotsEntry:
+    parser: robotparser.RobotFileParser
+    expires_at: float
+    crawl_delays: Dict[str, float] = field(default_factory=dict)
+
+
+def _crawl_delays(lines: List[str]) -> Dict[str, float]:
+    # urllib.robotparser only keeps integer Crawl-delay values; "0.5" is common.
+    delays: Dict[str, float] = {}
+    agents: List[str] = []
+    in_rules = False
+    for raw in lines:
+        key, _, value = raw.split("#", 1)[0].partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if key == "user-agent":
+            if in_rules:
+                agents, in_rules = [], False
+            agents.append(value.lower())
+        elif key:
+            in_rules = True
+            if key == "crawl-delay":
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in agents:
+                    delays.setdefault(agent, delay)
+    return delays
+
+
+def _parse(body: str) -> _RobotsEntry:
+    lines = body.splitlines()
+    parser = robotparser.RobotFileParser()
+    parser.parse(lines)
+    return _RobotsEntry(parser, 0.0, _crawl_delays(lines))
+
 
 class RobotsCache:
-    def __init__(self) -> None:
-        self._cache: Dict[str, robotparser.RobotFileParser] = {}
+    """
+    robots.txt rules per scheme://host.
 
-    async def allowed(self, session: aiohttp.ClientSession, url: str, user_agent: str, timeout: int) -> bool:
+    Concurrent lookups for a new host share one in-flight fetch, entries
+    expire after ``ttl_seconds``, and with ``path`` the raw robots bodies are
+    kept in SQLite so later runs skip the fetch.
+    """
+
+    def __init__(self, ttl_seconds: float = 86400.0, path: Optional[str] = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.fetches = 0
+        self._cache: Dict[str, _RobotsEntry] = {}
+        self._inflight: Dict[str, "asyncio.Future[_RobotsEntry]"] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS robots ("
+                "base TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _base(url: str) -> str:
         parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        if base not in self._cache:
-            parser = robotparser.RobotFileParser()
-            robots_url = f"{base}/robots.txt"
-            try:
-                async with session.get(robots_url, timeout=timeout) as resp:
-                    if resp.status < 400:
-                        content = await resp.text()
-                        parser.parse(content.splitlines())
-                    else:
-                        parser.parse([])
-            except Exception:
-                parser.parse([])
-            self._cache[base] = parser
-        return self._cache[base].can_fetch(user_agent, url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    async def _get(self, session: aiohttp.ClientSession, url: str, timeout: int) -> robotparser.RobotFileParser:
+        base = self._base(url)
+        entry = self._cache.get(base)
+        if entry is not None and entry.expires_at > time.time():
+            return entry.parser
+
+        future = self._inflight.get(base)
+        if future is None:
+            future = asyncio.ensure_future(self._load(session, base, timeout))
+            self._inflight[base] = future
+            future.add_done_callback(lambda _: self._inflight.pop(base, None))
+        # Shielded so one cancelled caller doesn't abort the fetch for the others.
+        entry = await asyncio.shield(future)
+        return entry.parser
+
+    async def _load(self, session: aiohttp.ClientSession, base: str, timeout: int) -> _RobotsEntry:
+        stored = self._load_stored(base)
+        if stored is not None:
+            self._cache[base] = stored
+            return stored
+
+        self.fetches += 1
+        body: Optional[str]
+        try:
+            async with session.get(f"{base}/robots.txt", timeout=timeout) as resp:
+                # 4xx means no rules; 5xx is treated as a transient failure.
+                if resp.status < 400:
+                    body = await resp.text()
+                elif resp.status < 500:
+                    body = ""
+                else:
+                    body = None
+        except Exception as exc:
+            LOG.debug("robots.txt fetch failed for %s: %s", base, exc)
+            body = None
+
+        now = time.time()
+        if body is None:
+            entry = _parse("")
+            entry.expires_at = now + min(self.ttl_seconds, FAILURE_TTL_SECONDS)
+        else:
+            entry = _parse(body)
+            entry.expires_at = now + self.ttl_seconds
+            self._store(base, body, now)
+        self._cache[base] = entry
+        return entry
+
+    def _load_stored(self, base: str) -> Optional[_RobotsEntry]:
+        if self._conn is None:
+            return None
+        row = self._conn.execute("SELECT body, fetched_at FROM robots WHERE base = ?", (base,)).fetchone()
+        if row is None or row[1] + self.ttl_seconds <= time.time():
+            return None
+        entry = _parse(row[0])
+        entry.expires_at = row[1] + self.ttl_seconds
+        return entry
+
+    def _store(self, base: str, body: str, fetched_at: float) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO robots (base, body, fetched_at) VALUES (?, ?, ?)",
+            (base, body, fetched_at),
+        )
+        self._conn.commit()
+
+    async def allowed(self, session: aiohttp.ClientSession, url: str, user_agent: str, timeout: int) -> bool:
+        parser = await self._get(session, url, timeout)
+        return parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, url: str, user_agent: str) -> Optional[float]:
+        entry = self._cache.get(self._base(url))
+        if entry is None:
+            return None
+        delay = entry.parser.crawl_delay(user_agent)
+        if delay is not None:
+            return float(delay)
+        token = user_agent.split("/")[0].lower()
+        for agent, value in entry.crawl_delays.items():
+            if agent != "*" and agent in token:
+                return value
+        return entry.crawl_delays.get("*")
+
+    async def sitemaps(self, session: aiohttp.ClientSession, url: str, timeout: int) -> List[str]:
+        """Sitemap URLs declared in the host's robots.txt."""
+        parser = await self._get(session, url, timeout)
+        return list(parser.site_maps() or [])
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_shared_caches: Dict[Tuple[float, Optional[str]], RobotsCache] = {}
+
+
+def get_robots_cache(ttl_seconds: float = 86400.0, path: Optional[str] = None) -> RobotsCache:
+    """Return the process-wide cache for these settings, so every seed shares robots lookups."""
+    key = (ttl_seconds, path)
+    if key not in _shared_caches:
+        _shared_caches[key] = RobotsCache(ttl_seconds, path)
+    return _shared_caches[key]
+
+
+def close_robots_caches() -> None:
+    while _shared_caches:
+        _, cache = _shared_caches.popitem()
+        cache.close()
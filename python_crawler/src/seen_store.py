@@ -0,0 +1,90 @@
+import hashlib
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SeenRecord:
+    url: str
+    content_hash: str
+    first_seen: float
+    last_fetched: float
+    fetch_count: int
+
+
+class SeenStore:
+    """
+    On-disk record of article URLs fetched by earlier runs, keyed by
+    normalized URL, with the last fetch time and a hash of the extracted text.
+    """
+
+    def __init__(self, path: str, recheck_after: Optional[float] = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # Seconds after which a known URL is fetched again; None = never.
+        self.recheck_after = recheck_after
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_urls ("
+            "url TEXT PRIMARY KEY, content_hash TEXT NOT NULL, first_seen REAL NOT NULL, "
+            "last_fetched REAL NOT NULL, fetch_count INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[SeenRecord]:
+        row = self._conn.execute(
+            "SELECT url, content_hash, first_seen, last_fetched, fetch_count FROM seen_urls WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return SeenRecord(*row) if row else None
+
+    def should_fetch(self, url: str, now: Optional[float] = None) -> bool:
+        row = self._conn.execute("SELECT last_fetched FROM seen_urls WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return True
+        if self.recheck_after is None:
+            return False
+        return (now or time.time()) - row[0] >= self.recheck_after
+
+    def should_skip(self, url: str) -> bool:
+        return not self.should_fetch(url)
+
+    def unchanged(self, url: str, text_hash: str) -> bool:
+        """True if ``url`` was stored before with this content hash."""
+        previous = self.get(url)
+        return previous is not None and previous.content_hash == text_hash
+
+    def record(self, url: str, text_hash: str, now: Optional[float] = None) -> bool:
+        """Store a fetch; returns True if the URL is new or its content changed."""
+        now = now or time.time()
+        previous = self.get(url)
+        if previous is None:
+            self._conn.execute(
+                "INSERT INTO seen_urls (url, content_hash, first_seen, last_fetched, fetch_count) "
+                "VALUES (?, ?, ?, ?, 1)",
+                (url, text_hash, now, now),
+            )
+        else:
+            self._conn.execute(
+                "UPDATE seen_urls SET content_hash = ?, last_fetched = ?, fetch_count = fetch_count + 1 "
+                "WHERE url = ?",
+                (text_hash, now, url),
+            )
+        self._conn.commit()
+        return previous is None or previous.content_hash != text_hash
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, Deque, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import aiohttp
+
+from .config import CrawlerConfig
+from .politeness import get_host_scheduler
+from .robots import RobotsCache
+from .utils import normalize_url
+
+LOG = logging.getLogger("python_crawler")
+
+# sitemaps.org caps a single sitemap at 50 MB uncompressed.
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+FALLBACK_PATHS = ("/sitemap.xml", "/sitemap_index.xml", "/news-sitemap.xml")
+
+
+@dataclass
+class SitemapEntry:
+    url: str
+    lastmod: Optional[datetime] = None
+    # True for <sitemap> entries of an index, False for <url> entries.
+    is_sitemap: bool = False
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime (``2024-05-01``, ``2024-05-01T10:00Z``, ...) as UTC-aware."""
+    if not value:
+        return None
+    value = value.strip()
+    if len(value) == 4:
+        value += "-01-01"
+    elif len(value) == 7:
+        value += "-01"
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+class SitemapParser:
+    """
+    Incremental parser for sitemap, sitemap index and Google News sitemap XML.
+
+    Bytes are fed as they arrive (gzip is detected from the magic bytes), and
+    finished ``<url>`` / ``<sitemap>`` elements are dropped from the tree right
+    away, so memory stays flat however large the document is.
+    """
+
+    def __init__(self) -> None:
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._root: Optional[Element] = None
+        self._inflate: Optional["zlib._Decompress"] = None
+        self._sniffed = False
+        self.bytes_read = 0
+
+    def feed(self, chunk: bytes) -> Iterator[SitemapEntry]:
+        if not self._sniffed:
+            self._sniffed = True
+            if chunk[:2] == b"\x1f\x8b":
+                self._inflate = zlib.decompressobj(wbits=31)
+        if self._inflate is None:
+            yield from self._feed_xml(chunk)
+            return
+        # Inflate in bounded pieces: sitemap XML compresses 20-50x.
+        while chunk:
+            yield from self._feed_xml(self._inflate.decompress(chunk, CHUNK_SIZE))
+            chunk = self._inflate.unconsumed_tail
+
+    def _feed_xml(self, data: bytes) -> List[SitemapEntry]:
+        self.bytes_read += len(data)
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> List[SitemapEntry]:
+        if self._inflate is not None:
+            self._parser.feed(self._inflate.flush())
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[SitemapEntry]:
+        entries: List[SitemapEntry] = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+            tag = _local(elem.tag)
+            if tag not in ("url", "sitemap"):
+                continue
+            loc = lastmod = published = None
+            for child in elem.iter():
+                name = _local(child.tag)
+                if name == "loc":
+                    loc = (child.text or "").strip()
+                elif name == "lastmod":
+                    lastmod = child.text
+                elif name == "publication_date":
+                    published = child.text
+            if loc:
+                entries.append(
+                    SitemapEntry(loc, parse_lastmod(lastmod) or parse_lastmod(published), tag == "sitemap")
+                )
+            elem.clear()
+            if self._root is not None and elem is not self._root:
+                try:
+                    self._root.remove(elem)
+                except ValueError:
+                    pass
+        return entries
+
+
+async def _read_sitemap(
+    session: aiohttp.ClientSession,
+    url: str,
+    config: CrawlerConfig,
+) -> List[SitemapEntry]:
+    """
+    Fetch and parse one sitemap. The host slot is held only for the request
+    and body read and released before any entry reaches the caller, which
+    goes on to fetch pages on the same host.
+    """
+    timeout = aiohttp.ClientTimeout(total=config.request_timeout * 5, sock_read=config.request_timeout)
+    scheduler = get_host_scheduler(config.request_delay, config.per_host_concurrency)
+    parser = SitemapParser()
+    entries: List[SitemapEntry] = []
+    async with scheduler.slot(url), session.get(url, timeout=timeout) as resp:
+        if resp.status >= 400:
+            LOG.debug("Sitemap %s returned %s", url, resp.status)
+            return entries
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            entries.extend(parser.feed(chunk))
+            if parser.bytes_read > MAX_SITEMAP_BYTES:
+                LOG.warning("Sitemap %s exceeds %d bytes, truncating", url, MAX_SITEMAP_BYTES)
+                return entries
+    entries.extend(parser.close())
+    return entries
+
+
+async def iter_sitemap_entries(
+    homepage_url: str,
+    config: CrawlerConfig,
+    session: aiohttp.ClientSession,
+    robots: RobotsCache,
+    since: Optional[datetime] = None,
+) -> AsyncIterator[SitemapEntry]:
+    """
+    Yield page entries from the site's sitemaps, following sitemap indexes.
+
+    Sitemaps come from robots.txt ``Sitemap:`` lines, falling back to the
+    usual ``/sitemap.xml`` locations. With ``since``, pages and child
+    sitemaps whose ``lastmod`` is older are skipped; undated ones are kept.
+    """
+    parsed = urlparse(homepage_url)
+    base = f"{parsed.scheme}://{parsed.netloc}"
+
+    roots = await robots.sitemaps(session, homepage_url, config.request_timeout)
+    if config.respect_robots:
+        get_host_scheduler(config.request_delay, config.per_host_concurrency).set_crawl_delay(
+            homepage_url, robots.crawl_delay(homepage_url, config.user_agent)
+        )
+    explicit = bool(roots)
+    if not roots:
+        roots = [base + path for path in FALLBACK_PATHS]
+
+    pending: Deque[Tuple[str, bool]] = deque((normalize_url(url), explicit) for url in roots)
+    visited: Set[str] = set()
+    while pending and len(visited) < config.max_sitemaps:
+        url, declared = pending.popleft()
+        if not url or url in visited:
+            continue
+        visited.add(url)
+        if config.respect_robots and not declared:
+            if not await robots.allowed(session, url, config.user_agent, config.request_timeout):
+                continue
+
+        pages = 0
+        try:
+            for entry in await _read_sitemap(session, url, config):
+                if since is not None and entry.lastmod is not None and entry.lastmod < since:
+                    continue
+                if entry.is_sitemap:
+                    pending.append((normalize_url(entry.url), True))
+                else:
+                    pages += 1
+                    yield entry
+        except (asyncio.TimeoutError, aiohttp.ClientError, ParseError, zlib.error) as exc:
+            # Guessed locations often serve an HTML soft-404; only declared ones are worth a warning.
+            if declared:
+                LOG.warning("Sitemap %s failed: %s", url, exc)
+            else:
+                LOG.debug("Sitemap %s failed: %s", url, exc)
+        LOG.debug("Sitemap %s yielded %d pages", url, pages)
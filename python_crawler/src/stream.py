@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+import aiohttp
+
+from .checkpoint import FrontierState
+from .config import CrawlerConfig
+from .crawler import iter_homepage_links
+from .models import ArticleData
+from .output import open_writer
+
+LOG = logging.getLogger("python_crawler")
+
+ProcessUrl = Callable[[str], Awaitable[Optional[ArticleData]]]
+
+
+class ArticleSink:
+    """
+    Append each finished article to the output as soon as it is ready: JSONL
+    by default (gzip / zstd by the path's extension), a JSON array, or
+    Parquet row groups. Only JSONL can be appended to on resume.
+    """
+
+    def __init__(self, path: str, append: bool = False, fmt: str = "jsonl"):
+        self.path = path
+        self.written = 0
+        self._writer = open_writer(path, fmt, append)
+
+    async def write(self, article: ArticleData) -> None:
+        self._write_record(article.__dict__)
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        self._writer.write(record)
+        self.written += 1
+
+    async def close(self) -> None:
+        self._writer.close()
+
+
+class PipelineSink(ArticleSink):
+    """Run each article through the agentic pipeline, then append article + result."""
+
+    def __init__(self, path: str, pipeline: Any = None, append: bool = False, fmt: str = "jsonl"):
+        super().__init__(path, append, fmt)
+        if pipeline is None:
+            # Optional dependency: only needed when streaming into the pipeline.
+            from agentic_ai.core.pipeline import AgenticPipeline
+
+            pipeline = AgenticPipeline()
+        self._pipeline = pipeline
+
+    async def write(self, article: ArticleData) -> None:
+        result = await self._pipeline.process_article(
+            {
+                "id": article.url,
+                "content": article.content,
+                "url": article.url,
+                "source": article.source,
+                "title": article.title,
+            }
+        )
+        self._write_record({**article.__dict__, "pipeline": result})
+
+
+async def stream_crawl(
+    homepage_url: str,
+    config: CrawlerConfig,
+    session: aiohttp.ClientSession,
+    process_url: ProcessUrl,
+    sink: ArticleSink,
+    workers: Optional[int] = None,
+    skip: Optional[Callable[[str], bool]] = None,
+    state: Optional[FrontierState] = None,
+    resume_urls: Sequence[str] = (),
+    on_done: Optional[Callable[[str, Optional[ArticleData]], None]] = None,
+) -> int:
+    """
+    Crawl and process concurrently: discovered links feed a bounded queue that
+    fetch/extract workers drain, and every finished article goes straight to
+    the sink. ``resume_urls`` (left over from a checkpoint) are queued before
+    newly discovered links. ``on_done(url, article)`` runs once the article
+    is written (article None when there was nothing to write), never for a
+    URL whose processing or write failed. Returns the number of articles
+    written.
+    """
+    workers = max(1, workers or config.concurrency)
+    # Bounded so discovery pauses when workers fall behind (memory stays flat).
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=workers * 2)
+
+    async def produce() -> None:
+        try:
+            for url in resume_urls:
+                await queue.put(url)
+            async for url in iter_homepage_links(homepage_url, config, session, skip, state):
+                await queue.put(url)
+        finally:
+            for _ in range(workers):
+                await queue.put(None)
+
+    async def work() -> None:
+        while True:
+            url = await queue.get()
+            if url is None:
+                return
+            try:
+                article = await process_url(url)
+                if article:
+                    await sink.write(article)
+                    LOG.info("Streamed %s (%d written)", url, sink.written)
+                if on_done is not None:
+                    on_done(url, article)
+            except Exception as exc:
+                LOG.warning("Streaming failed for %s: %s", url, exc)
+
+    results = await asyncio.gather(produce(), *(work() for _ in range(workers)), return_exceptions=True)
+    # Surface a discovery failure only once every worker has drained the queue.
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return sink.written
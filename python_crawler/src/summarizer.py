@@ -1,12 +1,16 @@
+import asyncio
+import logging
 import os
+import random
 import re
-import time
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+LOG = logging.getLogger("python_crawler")
+
 API_KEY = os.getenv("GOOGLE_AI_API_KEY")
 MODEL_NAME = os.getenv("GOOGLE_AI_MODEL", "models/gemini-1.5-flash")
 SYSTEM_INSTRUCTION = os.getenv("AI_INSTRUCTIONS", "")
@@ -14,6 +18,8 @@ SYSTEM_INSTRUCTION = os.getenv("AI_INSTRUCTIONS", "")
 MAX_RETRIES = int(os.getenv("AI_MAX_RETRIES", "3"))
 RETRY_DELAY = float(os.getenv("AI_RETRY_DELAY", "2"))
 MAX_INPUT_CHARS = int(os.getenv("AI_MAX_INPUT_CHARS", "12000"))
+# Model calls in flight across all articles and chunks.
+MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "4"))
 
 try:
     import google.generativeai as genai
@@ -22,31 +28,79 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     genai = None
 
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+_model: Any = None
+_limit: Optional[asyncio.Semaphore] = None
+_limit_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _pack(pieces: List[str], max_chars: int, sep: str) -> List[str]:
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(sep) + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}{sep}{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 def _chunk_text(text: str, max_chars: int) -> List[str]:
+    """Split on paragraph, then sentence boundaries; hard-cut only oversized sentences."""
     if len(text) <= max_chars:
         return [text]
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = min(start + max_chars, len(text))
-        chunks.append(text[start:end])
-        start = end
-    return chunks
+    pieces: List[str] = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        sentences: List[str] = []
+        for sentence in _SENTENCE_RE.split(paragraph):
+            while len(sentence) > max_chars:
+                sentences.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence:
+                sentences.append(sentence)
+        pieces.extend(_pack(sentences, max_chars, " "))
+    return _pack(pieces, max_chars, "\n\n")
 
 
 def _extractive_summary(text: str, max_sentences: int = 6) -> str:
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
+    sentences = _SENTENCE_RE.split(text.strip())
     return " ".join(sentences[:max_sentences]).strip()
 
 
+def _get_model() -> Any:
+    global _model
+    if _model is None:
+        _model = genai.GenerativeModel(MODEL_NAME)
+    return _model
+
+
+def _get_limit() -> asyncio.Semaphore:
+    # One semaphore per event loop (a semaphore can't be shared across loops).
+    global _limit, _limit_loop
+    loop = asyncio.get_running_loop()
+    if _limit is None or _limit_loop is not loop:
+        _limit = asyncio.Semaphore(max(1, MAX_CONCURRENCY))
+        _limit_loop = loop
+    return _limit
+
+
 def _summarize_with_genai(prompt: str) -> str:
     if genai is None:
         raise RuntimeError("Google Generative AI SDK is unavailable")
 
     if hasattr(genai, "GenerativeModel"):
-        model = genai.GenerativeModel(MODEL_NAME)
-        response = model.generate_content(prompt)
+        response = _get_model().generate_content(prompt)
         return (response.text or "").strip()
 
     if hasattr(genai, "chat"):
@@ -67,7 +121,37 @@ def _summarize_with_genai(prompt: str) -> str:
     raise RuntimeError("Unsupported Google Generative AI SDK version")
 
 
-def summarize_content(content: str) -> str:
+async def _asummarize_with_genai(prompt: str) -> str:
+    if genai is not None and hasattr(genai, "GenerativeModel"):
+        model = _get_model()
+        if hasattr(model, "generate_content_async"):
+            response = await model.generate_content_async(prompt)
+            return (response.text or "").strip()
+    # Older SDKs are sync-only; keep them off the event loop.
+    return await asyncio.to_thread(_summarize_with_genai, prompt)
+
+
+async def _generate(prompt: str, fallback: str) -> str:
+    """One model call under the global limit, with non-blocking retry backoff."""
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            async with _get_limit():
+                summary = await _asummarize_with_genai(prompt)
+            if summary:
+                return summary
+        except Exception as exc:
+            if attempt >= MAX_RETRIES:
+                LOG.debug("Summarization failed after %d attempts: %s", attempt, exc)
+                break
+            await asyncio.sleep(RETRY_DELAY * (2 ** (attempt - 1)) + random.uniform(0, 0.3))
+    return _extractive_summary(fallback)
+
+
+async def asummarize_content(content: str) -> str:
+    """
+    Map-reduce summary: chunks are summarized concurrently, then combined.
+    Falls back to an extractive summary without an API key or on failure.
+    """
     if not content:
         return ""
 
@@ -75,32 +159,22 @@ def summarize_content(content: str) -> str:
     if not API_KEY or genai is None:
         return _extractive_summary(trimmed)
 
+    instruction = f"{SYSTEM_INSTRUCTION}\n\n" if SYSTEM_INSTRUCTION else ""
     chunks = _chunk_text(trimmed, MAX_INPUT_CHARS)
-    summaries: List[str] = []
-
-    for chunk in chunks:
-        instruction = f"{SYSTEM_INSTRUCTION}\n\n" if SYSTEM_INSTRUCTION else ""
-        prompt = f"{instruction}Summarize the following article for a professional audience:\n\n{chunk}"
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                summary = _summarize_with_genai(prompt)
-                if summary:
-                    summaries.append(summary)
-                    break
-            except Exception as exc:
-                if attempt >= MAX_RETRIES:
-                    summaries.append(_extractive_summary(chunk))
-                    break
-                time.sleep(RETRY_DELAY)
-                continue
+    summaries = await asyncio.gather(
+        *(
+            _generate(f"{instruction}Summarize the following article for a professional audience:\n\n{chunk}", chunk)
+            for chunk in chunks
+        )
+    )
 
     if len(summaries) == 1:
         return summaries[0]
 
     combined = "\n".join(summaries)
-    try:
-        return _summarize_with_genai(
-            f"Combine the following summaries into a concise final summary:\n\n{combined}"
-        )
-    except Exception:
-        return _extractive_summary(combined)
+    return await _generate(f"Combine the following summaries into a concise final summary:\n\n{combined}", combined)
+
+
+def summarize_content(content: str) -> str:
+    """Blocking wrapper around :func:`asummarize_content` for callers outside an event loop."""
+    return asyncio.run(asummarize_content(content))
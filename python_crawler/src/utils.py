@@ -1,33 +1,96 @@
 import re
-from typing import Iterable, List
-from urllib.parse import urlparse, urlsplit, urlunsplit, urldefrag
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse, urlsplit, urlunsplit
 
 from .config import SKIP_EXTENSIONS
 
+_SLASHES_RE = re.compile(r"/+")
+# Marks the end of an allowed domain in a DomainTrie node (labels are never empty).
+_END = ""
+
 
 def compile_patterns(patterns: Iterable[str]) -> List[re.Pattern]:
     return [re.compile(p, re.IGNORECASE) for p in patterns]
 
 
-def normalize_url(raw_url: str) -> str:
-    raw_url = raw_url.strip()
-    if not raw_url:
-        return ""
+class _AnyPattern:
+    """Fallback for pattern sets that cannot be joined into one regex (e.g. global inline flags)."""
 
-    raw_url, _ = urldefrag(raw_url)
-    parts = urlsplit(raw_url)
-    if parts.scheme and parts.scheme.lower() not in ("http", "https"):
-        return ""
+    def __init__(self, patterns: List[re.Pattern]):
+        self.patterns = patterns
+
+    def search(self, url: str) -> bool:
+        return any(p.search(url) for p in self.patterns)
+
+
+def combine_patterns(patterns: Iterable[str]) -> Optional[Any]:
+    """Join ``patterns`` into one case-insensitive alternation, so a URL is scanned once per set."""
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        return _AnyPattern(compile_patterns(patterns))
 
+
+@lru_cache(maxsize=32)
+def _param_pattern(params: Tuple[str, ...]) -> Optional[re.Pattern]:
+    # "utm_*" strips every parameter with that prefix; other names match exactly.
+    alternatives = [re.escape(p[:-1]) + ".*" if p.endswith("*") else re.escape(p) for p in params if p]
+    return re.compile("(?:" + "|".join(alternatives) + ")", re.IGNORECASE) if alternatives else None
+
+
+def strip_query_params(query: str, params: Iterable[str]) -> str:
+    """Drop ``params`` (names or ``prefix*``) from a raw query string, keeping the rest byte for byte."""
+    pattern = _param_pattern(tuple(params))
+    if not query or pattern is None:
+        return query
+    kept = [pair for pair in query.split("&") if pair and not pattern.fullmatch(pair.split("=", 1)[0])]
+    return "&".join(kept)
+
+
+def _split_url(raw_url: str) -> Optional[Tuple[str, str, str, str]]:
+    """Lower-cased scheme/netloc without default ports, collapsed path and raw query; None if not http(s)."""
+    raw_url = raw_url.strip()
+    if not raw_url:
+        return None
+    try:
+        parts = urlsplit(raw_url)
+    except ValueError:
+        return None
     scheme = parts.scheme.lower() if parts.scheme else "http"
+    if scheme not in ("http", "https"):
+        return None
+
     netloc = parts.netloc.lower()
     if netloc.endswith(":80") and scheme == "http":
         netloc = netloc[:-3]
     if netloc.endswith(":443") and scheme == "https":
         netloc = netloc[:-4]
 
-    path = re.sub(r"/+", "/", parts.path or "/")
-    return urlunsplit((scheme, netloc, path, parts.query, ""))
+    path = parts.path or "/"
+    if "//" in path:
+        path = _SLASHES_RE.sub("/", path)
+    return scheme, netloc, path, parts.query
+
+
+def normalize_url(raw_url: str) -> str:
+    parts = _split_url(raw_url)
+    if parts is None:
+        return ""
+    scheme, netloc, path, query = parts
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def canonicalize_url(raw_url: str, strip_params: Iterable[str] = ()) -> str:
+    """``normalize_url`` plus removal of tracking parameters such as ``utm_*``."""
+    parts = _split_url(raw_url)
+    if parts is None:
+        return ""
+    scheme, netloc, path, query = parts
+    return urlunsplit((scheme, netloc, path, strip_query_params(query, strip_params), ""))
 
 
 def should_skip_url(url: str) -> bool:
@@ -44,3 +107,78 @@ def matches_patterns(url: str, includes: List[re.Pattern], excludes: List[re.Pat
     if not includes:
         return True
     return any(p.search(url) for p in includes)
+
+
+class DomainTrie:
+    """
+    Allowed domains stored label by label from the right (``gov`` ->
+    ``example`` -> ``news``), so a host is matched against all of them in one
+    walk over its own labels instead of one comparison per domain.
+    """
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {}
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str) -> None:
+        node = self._root
+        for label in reversed(domain.lower().strip(".").split(".")):
+            node = node.setdefault(label, {})
+        node[_END] = True
+
+    def match(self, host: str, subdomains: bool = True) -> bool:
+        node = self._root
+        labels = host.split(".")
+        for index in range(len(labels) - 1, -1, -1):
+            node = node.get(labels[index])
+            if node is None:
+                return False
+            if _END in node and (subdomains or index == 0):
+                return True
+        return False
+
+
+class UrlFilter:
+    """
+    Compiled link filter: each URL is parsed once, canonicalized (tracking
+    parameters stripped), and checked against skipped extensions, the allowed
+    domains and one combined include / exclude regex. Calling it returns the
+    canonical URL, or None when the link is rejected.
+    """
+
+    def __init__(
+        self,
+        allowed_domains: Iterable[str],
+        allow_subdomains: bool = True,
+        include_patterns: Iterable[str] = (),
+        exclude_patterns: Iterable[str] = (),
+        strip_params: Iterable[str] = (),
+        skip_extensions: Iterable[str] = SKIP_EXTENSIONS,
+    ):
+        self.domains = DomainTrie(allowed_domains)
+        self.allow_subdomains = allow_subdomains
+        self.include = combine_patterns(include_patterns)
+        self.exclude = combine_patterns(exclude_patterns)
+        self.strip_params = tuple(strip_params)
+        self.skip_extensions = frozenset(ext.lower() for ext in skip_extensions)
+
+    def __call__(self, raw_url: str) -> Optional[str]:
+        parts = _split_url(raw_url)
+        if parts is None:
+            return None
+        scheme, netloc, path, query = parts
+
+        name = path[path.rfind("/") + 1 :]
+        dot = name.rfind(".")
+        if dot != -1 and name[dot:].lower() in self.skip_extensions:
+            return None
+        if not self.domains.match(netloc, self.allow_subdomains):
+            return None
+
+        url = urlunsplit((scheme, netloc, path, strip_query_params(query, self.strip_params), ""))
+        if self.exclude is not None and self.exclude.search(url):
+            return None
+        if self.include is not None and not self.include.search(url):
+            return None
+        return url
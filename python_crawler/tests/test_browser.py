@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+
+from python_crawler.src import browser
+from python_crawler.src.browser import BrowserPool
+
+
+class FakeContext:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def route(self, pattern, handler) -> None:
+        pass
+
+    async def new_page(self):
+        raise RuntimeError("target closed")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[FakeContext] = []
+
+    async def new_context(self, user_agent: str) -> FakeContext:
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+    async def close(self) -> None:
+        pass
+
+
+class FakePlaywright:
+    def __init__(self, launch_error: Exception | None) -> None:
+        self.launch_error = launch_error
+        self.stopped = False
+        self.browser = FakeBrowser()
+        self.chromium = self
+
+    async def start(self) -> "FakePlaywright":
+        return self
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        if self.launch_error is not None:
+            raise self.launch_error
+        return self.browser
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+async def test_fetch_returns_none_and_stops_playwright_when_launch_fails(monkeypatch) -> None:
+    started: list[FakePlaywright] = []
+
+    def fake_async_playwright() -> FakePlaywright:
+        started.append(FakePlaywright(OSError("chromium missing")))
+        return started[-1]
+
+    monkeypatch.setattr(browser, "async_playwright", fake_async_playwright)
+    pool = BrowserPool("test-agent", max_pages=1)
+
+    assert await pool.fetch("https://example.com/a") is None
+    assert started[0].stopped and pool._playwright is None
+    # The semaphore slot was given back, so the next fetch retries the start.
+    assert await pool.fetch("https://example.com/b") is None
+    assert len(started) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_releases_the_context_when_new_page_fails(monkeypatch) -> None:
+    playwright = FakePlaywright(None)
+    monkeypatch.setattr(browser, "async_playwright", lambda: playwright)
+    pool = BrowserPool("test-agent", max_pages=1)
+
+    assert await pool.fetch("https://example.com/a") is None
+    assert await pool.fetch("https://example.com/b") is None
+
+    assert [context.closed for context in playwright.browser.contexts] == [True, True]
+    assert pool._idle == []
+    await pool.close()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from python_crawler.src import checkpoint as checkpoint_module
+from python_crawler.src.checkpoint import CrawlCheckpoint
+from python_crawler.src.models import ArticleData
+
+HOME = "http://example.com/"
+
+
+def _article(url: str) -> ArticleData:
+    return ArticleData(url=url, title="Title", content="Body of " + url, source="example.com")
+
+
+def test_save_replaces_state_atomically(tmp_path, monkeypatch) -> None:
+    checkpoint = CrawlCheckpoint(str(tmp_path), HOME)
+    checkpoint.frontier.links = [HOME + "a"]
+    checkpoint.save()
+
+    def torn_dump(state, fh) -> None:
+        fh.write('{"homepage_url": ')
+        raise OSError("disk full")
+
+    # A save that dies mid-write must leave the previous state.json intact.
+    checkpoint.frontier.links.append(HOME + "b")
+    monkeypatch.setattr(checkpoint_module.json, "dump", torn_dump)
+    with pytest.raises(OSError):
+        checkpoint.save()
+    monkeypatch.undo()
+
+    with open(checkpoint.state_path, encoding="utf-8") as fh:
+        state = json.load(fh)
+    assert state["homepage_url"] == HOME
+    assert state["links"] == [HOME + "a"]
+
+    checkpoint.save()
+    assert not os.path.exists(checkpoint.state_path + ".tmp")
+    checkpoint.close()
+
+
+def test_resume_after_interrupted_run(tmp_path) -> None:
+    links = [HOME + "a", HOME + "b", HOME + "c"]
+    first = CrawlCheckpoint(str(tmp_path), HOME)
+    first.frontier.links = list(links)
+    first.frontier.collected = set(links)
+    first.save()
+    first.record(links[0], _article(links[0]))
+    first.record(links[1], None)
+    # The process dies mid-write: a torn record line and no close().
+    with open(first.records_path, "a", encoding="utf-8") as fh:
+        fh.write('{"url": "' + links[2] + '", "arti')
+
+    resumed = CrawlCheckpoint(str(tmp_path), HOME, resume=True)
+
+    assert resumed.done == {links[0], links[1]}
+    assert resumed.remaining() == [links[2]]
+    assert [article["url"] for article in resumed.articles()] == [links[0]]
+
+    resumed.record(links[2], _article(links[2]))
+    assert resumed.remaining() == []
+    assert [article["url"] for article in resumed.articles()] == [links[0], links[2]]
+    resumed.close()
+
+
+def test_fresh_run_discards_old_state_and_resume_checks_homepage(tmp_path) -> None:
+    first = CrawlCheckpoint(str(tmp_path), HOME)
+    first.frontier.links = [HOME + "a"]
+    first.record(HOME + "a", _article(HOME + "a"))
+    first.close()
+
+    with pytest.raises(ValueError, match="Checkpoint is for"):
+        CrawlCheckpoint(str(tmp_path), "http://other.example/", resume=True)
+
+    fresh = CrawlCheckpoint(str(tmp_path), HOME)
+    assert fresh.done == set()
+    assert fresh.articles() == []
+    fresh.close()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+
+from python_crawler.src import cli
+from python_crawler.src.config import CrawlerConfig
+from python_crawler.src.dedup import CanonicalIndex, NearDuplicateIndex
+from python_crawler.src.models import ArticleData
+from python_crawler.src.seen_store import SeenStore, content_hash
+
+BODY = " ".join(f"word{i % 97} token{i % 13} item{i}" for i in range(120))
+
+
+def _run_main(monkeypatch, argv: list[str]) -> None:
+    monkeypatch.setattr(sys, "argv", ["crawler", *argv])
+    monkeypatch.setattr(cli, "check_output", lambda path, fmt: None)
+    asyncio.run(cli.main())
+
+
+def test_read_seeds_parses_budgets_and_comments(tmp_path) -> None:
+    path = tmp_path / "seeds.txt"
+    path.write_text("# news sites\nhttps://a.example/ 10\n\nhttps://b.example/  # no budget\n", encoding="utf-8")
+
+    assert cli._read_seeds(str(path)) == [("https://a.example/", 10), ("https://b.example/", None)]
+
+
+@pytest.mark.parametrize("line", ["https://a.example/ ten", "https://a.example/ -5", "https://a.example/ 5 extra"])
+def test_malformed_seed_line_is_reported_with_file_and_line(tmp_path, monkeypatch, capsys, line: str) -> None:
+    path = tmp_path / "seeds.txt"
+    path.write_text(f"https://ok.example/\n{line}\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        _run_main(monkeypatch, ["--seeds-file", str(path)])
+    assert f"{path}:2: expected 'url [max_links]'" in capsys.readouterr().err
+
+
+def test_state_dir_is_rejected_with_seeds_file(tmp_path, monkeypatch, capsys) -> None:
+    path = tmp_path / "seeds.txt"
+    path.write_text("https://a.example/\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        _run_main(monkeypatch, ["--seeds-file", str(path), "--state-dir", str(tmp_path / "state")])
+    assert "--state-dir cannot be combined with --seeds-file" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+async def test_dropped_duplicates_are_recorded_as_seen(tmp_path, monkeypatch) -> None:
+    async def fake_fetch(session, url: str, config) -> ArticleData:
+        canonical = "https://example.com/a" if "?ref=" in url else ""
+        return ArticleData(url=url, title="T", content=BODY, source="example.com", canonical_url=canonical)
+
+    monkeypatch.setattr(cli, "fetch_article", fake_fetch)
+    seen = SeenStore(str(tmp_path / "seen.db"))
+    canonicals, dedup = CanonicalIndex(), NearDuplicateIndex()
+    semaphore, config = asyncio.Semaphore(1), CrawlerConfig()
+
+    async def process(url: str):
+        return await cli.fetch_and_process(
+            None, url, semaphore, config, False, seen, dedup, canonicals=canonicals
+        )
+
+    assert await process("https://example.com/a") is not None
+    assert await process("https://example.com/a?ref=rss") is None  # same canonical URL
+    assert await process("https://example.com/copy") is None  # same text elsewhere
+
+    assert seen.get("https://example.com/a") is None  # recorded only once written
+    for url in ("https://example.com/a?ref=rss", "https://example.com/copy"):
+        assert seen.unchanged(url, content_hash(BODY))
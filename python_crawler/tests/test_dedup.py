@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from python_crawler.src.dedup import FINGERPRINT_BITS, CanonicalIndex, NearDuplicateIndex, hamming, simhash
+
+ARTICLE = " ".join(f"word{i % 97} token{i % 13} item{i}" for i in range(120))
+
+
+def _flip(fingerprint: int, bits: list[int]) -> int:
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def test_simhash_is_stable_and_close_for_small_edits() -> None:
+    edited = ARTICLE.replace("item7 ", "item7 updated byline ", 1)
+
+    assert simhash(ARTICLE) == simhash(ARTICLE)
+    assert 0 < hamming(simhash(ARTICLE), simhash(edited)) <= 6
+    assert hamming(simhash(ARTICLE), simhash("an unrelated story " * 40 + ARTICLE[:50])) > 6
+    assert simhash("too few words", min_words=50) is None
+
+
+@pytest.mark.parametrize("max_distance", [0, 3, 6, 10])
+def test_bands_cover_every_bit_once(max_distance: int) -> None:
+    index = NearDuplicateIndex(max_distance=max_distance)
+    spans = index._spans
+
+    assert len(spans) == max_distance + 1
+    covered = 0
+    for shift, mask in spans:
+        assert covered & (mask << shift) == 0
+        covered |= mask << shift
+    assert covered == (1 << FINGERPRINT_BITS) - 1
+
+
+@pytest.mark.parametrize("max_distance", [3, 6])
+def test_lsh_finds_exactly_what_a_linear_scan_finds(max_distance: int) -> None:
+    rng = random.Random(max_distance)
+    index = NearDuplicateIndex(max_distance=max_distance)
+    stored = {}
+    for i in range(300):
+        fingerprint = rng.getrandbits(FINGERPRINT_BITS)
+        stored[f"https://example.com/{i}"] = fingerprint
+        index.add(f"https://example.com/{i}", fingerprint)
+
+    for url, fingerprint in list(stored.items())[:50]:
+        for distance in range(FINGERPRINT_BITS // 4):
+            probe = _flip(fingerprint, rng.sample(range(FINGERPRINT_BITS), distance))
+            found = index.find(probe)
+            nearest = min(stored, key=lambda other: hamming(probe, stored[other]))
+            if hamming(probe, stored[nearest]) <= max_distance:
+                assert found is not None and hamming(probe, stored[found]) == hamming(probe, stored[nearest])
+            else:
+                assert found is None
+
+
+def test_check_reports_near_duplicates_but_not_a_url_against_itself() -> None:
+    index = NearDuplicateIndex(max_distance=6, min_words=50)
+    edited = ARTICLE.replace("item7 ", "item7 updated byline ", 1)
+
+    assert index.check("https://example.com/a", ARTICLE) is None
+    assert index.check("https://example.com/a?print=1", edited) == "https://example.com/a"
+    assert index.duplicates == 1
+    # The same URL coming back with its own text is not its own duplicate.
+    assert index.check("https://example.com/a", ARTICLE) is None
+    assert index.check("https://example.com/short", "too short") is None
+    assert len(index) == 1
+
+
+def test_fingerprints_persist_across_runs(tmp_path) -> None:
+    path = str(tmp_path / "dedup.db")
+    high = (1 << 63) | 0x1234  # stored as a negative SQLite integer
+    first = NearDuplicateIndex(path=path)
+    first.add("https://example.com/high", high)
+    first.close()
+
+    second = NearDuplicateIndex(path=path)
+    assert second.find(_flip(high, [1, 40])) == "https://example.com/high"
+    second.close()
+
+
+def test_canonical_index_claims_first_url_per_canonical() -> None:
+    index = CanonicalIndex()
+
+    assert index.check("https://example.com/a", "https://example.com/a") is None
+    assert index.check("https://example.com/a?ref=rss", "https://example.com/a") == "https://example.com/a"
+    assert index.check("https://example.com/b") is None
+    assert index.duplicates == 1
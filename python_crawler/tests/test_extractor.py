@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from python_crawler.src.extractor import available_backends, parse_page
+
+STORY = [f"Paragraph {i} of the council budget story, with enough words to read as body text." for i in range(6)]
+PAGE = f"""<html><head><title>Council budget</title>
+<link rel="canonical" href="/news/budget"></head>
+<body>
+<nav><a href="/">Home</a> <a href="/news">News</a></nav>
+<article><h1>Council budget</h1>{"".join(f"<p>{line}</p>" for line in STORY)}</article>
+<aside><a href="/related">Related story</a></aside>
+<footer>Copyright notice</footer>
+<script>var tracking = 1;</script>
+</body></html>"""
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_agree_on_the_same_page(backend: str) -> None:
+    reference = parse_page(PAGE, "https://example.com/news/budget?ref=rss", backend="lxml")
+    page = parse_page(PAGE, "https://example.com/news/budget?ref=rss", backend=backend)
+
+    assert page.title == reference.title == "Council budget"
+    assert page.canonical == reference.canonical == "https://example.com/news/budget"
+    assert page.links == reference.links
+    for line in STORY:
+        assert line in page.text
+    for noise in ("Home", "Related story", "Copyright notice", "tracking"):
+        assert noise not in page.text
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict
+
+import pytest
+from aiohttp import web
+
+from python_crawler.src import fetcher
+from python_crawler.src.config import CrawlerConfig
+from python_crawler.src.crawler import open_session
+from python_crawler.src.fetcher import decode_html, fetch_html, read_body
+from python_crawler.src.http_cache import HttpCache
+from python_crawler.src.politeness import get_host_scheduler, parse_retry_after
+
+PAGE = "<html><head><title>Ok</title></head><body><p>Hello</p></body></html>"
+
+
+async def _serve(routes: Dict[str, web.Response]):
+    hits: Dict[str, int] = {}
+
+    async def handler(request: web.Request) -> web.Response:
+        hits[request.path] = hits.get(request.path, 0) + 1
+        return routes[request.path](hits[request.path])
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}", hits
+
+
+def _unavailable(retry_after: str):
+    return lambda hit: web.Response(status=503, headers={"Retry-After": retry_after})
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    assert parse_retry_after("120") == 120.0
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(hours=1), usegmt=True)
+    assert 3500 < parse_retry_after(future) <= 3600
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "retry_after",
+    ["86400", format_datetime(datetime.now(timezone.utc) + timedelta(days=1), usegmt=True)],
+    ids=["seconds", "http-date"],
+)
+async def test_long_retry_after_fails_url_without_pausing_host(retry_after: str) -> None:
+    runner, base, hits = await _serve({"/busy": _unavailable(retry_after)})
+    config = CrawlerConfig(max_retries=3, max_retry_after=60, request_delay=0.0)
+    try:
+        async with open_session(config) as session:
+            started = time.monotonic()
+            assert await fetch_html(session, base + "/busy", config) is None
+            assert time.monotonic() - started < 5
+    finally:
+        await runner.cleanup()
+
+    assert hits["/busy"] == 1
+    # The host was not deferred, so its next request could go out right away.
+    state = get_host_scheduler()._hosts[base.split("//")[1]]
+    assert state.next_allowed <= time.monotonic() + 1
+
+
+@pytest.mark.asyncio
+async def test_short_retry_after_is_honoured_then_retried() -> None:
+    def flaky(hit: int) -> web.Response:
+        if hit == 1:
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        return web.Response(text=PAGE, content_type="text/html")
+
+    runner, base, hits = await _serve({"/flaky": flaky})
+    config = CrawlerConfig(max_retries=2, max_retry_after=5, request_delay=0.0)
+    try:
+        async with open_session(config) as session:
+            started = time.monotonic()
+            assert await fetch_html(session, base + "/flaky", config) == PAGE
+            assert time.monotonic() - started >= 0.9
+    finally:
+        await runner.cleanup()
+    assert hits["/flaky"] == 2
+
+
+def _chunked(body: bytes):
+    def respond(hit: int) -> web.Response:
+        resp = web.Response(body=body, content_type="text/html")
+        resp.enable_chunked_encoding()
+        return resp
+
+    return respond
+
+
+@pytest.mark.asyncio
+async def test_read_body_stops_at_the_size_cap() -> None:
+    big = b"<p>" + b"x" * 300_000 + b"</p>"
+    runner, base, _ = await _serve({
+        "/declared": lambda hit: web.Response(body=big, content_type="text/html"),
+        "/chunked": _chunked(big),
+        "/small": _chunked(b"<p>small</p>"),
+    })
+    config = CrawlerConfig(request_delay=0.0, max_response_bytes=100_000)
+    try:
+        async with open_session(config) as session:
+            for path in ("/declared", "/chunked"):
+                async with session.get(base + path) as resp:
+                    assert await read_body(resp, 100_000) is None
+            async with session.get(base + "/chunked") as resp:
+                assert await read_body(resp, 0) == big  # 0 = no cap
+            async with session.get(base + "/small") as resp:
+                assert await read_body(resp, 100_000) == b"<p>small</p>"
+            assert await fetch_html(session, base + "/chunked", config) is None
+    finally:
+        await runner.cleanup()
+
+
+def test_decode_html_prefers_bom_then_header_then_meta() -> None:
+    text = "<p>café – naïve</p>"
+
+    assert decode_html(b"\xef\xbb\xbf" + text.encode("utf-8"), "iso-8859-1") == text
+    assert decode_html(b"\xff\xfe" + text.encode("utf-16-le"), "utf-8") == text
+    assert decode_html(text.encode("cp1252"), "windows-1252") == text
+    meta = '<meta charset="windows-1252">' + text
+    assert decode_html(meta.encode("cp1252"), None) == meta
+    # An unknown header label is ignored in favour of the <meta> declaration.
+    assert decode_html(meta.encode("cp1252"), "x-made-up") == meta
+
+
+def test_decode_html_recovers_from_mislabelled_charsets(monkeypatch) -> None:
+    text = "<p>café – naïve</p>"
+
+    # A <meta> readable as ASCII cannot be UTF-16; it is read as UTF-8.
+    utf16_meta = '<meta charset="utf-16">' + text
+    assert decode_html(utf16_meta.encode("utf-8"), None) == utf16_meta
+    # Undeclared UTF-8 is tried before detection.
+    assert decode_html(text.encode("utf-8"), None) == text
+    # Undeclared legacy bytes go to detection when it is installed, else cp1252.
+    russian = "<p>Городской совет утвердил бюджет на следующий год. Расходы пойдут на ремонт дорог.</p>"
+    if fetcher.detect_charset is not None:
+        assert decode_html(russian.encode("cp1251"), None) == russian
+    monkeypatch.setattr(fetcher, "detect_charset", None)
+    assert decode_html(text.encode("cp1252"), None) == text
+    # A header that lies about UTF-8 keeps the page, with replacement characters.
+    assert decode_html(text.encode("cp1252"), "utf-8") == "<p>caf\ufffd \ufffd na\ufffdve</p>"
+
+
+def test_http_cache_forgets_a_url_that_loses_its_validators(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "http.db"))
+    cache.put("https://example.com/a", "old body", "text/html", etag='"v1"')
+    assert cache.validators(cache.get("https://example.com/a")) == {"If-None-Match": '"v1"'}
+
+    # A later 200 without ETag/Last-Modified must not leave the old body to be revalidated.
+    cache.put("https://example.com/a", "new body", "text/html")
+    assert cache.get("https://example.com/a") is None
+    assert cache.stored == 1
+    cache.close()
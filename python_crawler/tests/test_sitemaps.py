@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from python_crawler.benchmarks.site import SiteSpec, start_site
+from python_crawler.src.config import CrawlerConfig
+from python_crawler.src.crawler import fetch_article, open_session
+from python_crawler.src.stream import ArticleSink, stream_crawl
+
+
+@pytest.mark.asyncio
+async def test_sitemap_stream_with_one_slot_per_host_does_not_deadlock(tmp_path) -> None:
+    # More pages than the stream queue holds, so discovery must release the host slot to make progress.
+    site, runner, base_url = await start_site(SiteSpec(pages=30, fanout=5, page_bytes=2000, latency_ms=0))
+    config = CrawlerConfig(
+        max_links=30,
+        discovery="sitemap",
+        concurrency=2,
+        per_host_concurrency=1,
+        request_delay=0.0,
+        js_fallback=False,
+    )
+    sink = ArticleSink(str(tmp_path / "articles.jsonl"))
+    try:
+        async with open_session(config) as session:
+
+            async def process_url(url: str):
+                return await fetch_article(session, url, config)
+
+            written = await asyncio.wait_for(stream_crawl(base_url, config, session, process_url, sink), 30)
+    finally:
+        await sink.close()
+        await runner.cleanup()
+
+    assert written == 30
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from python_crawler.benchmarks.site import SiteSpec, start_site
+from python_crawler.src import cli, stream
+from python_crawler.src.checkpoint import CrawlCheckpoint
+from python_crawler.src.config import CrawlerConfig
+from python_crawler.src.crawler import fetch_article, open_session
+from python_crawler.src.models import ArticleData
+from python_crawler.src.output import iter_articles
+from python_crawler.src.seen_store import SeenStore, content_hash
+from python_crawler.src.stream import ArticleSink, stream_crawl
+
+
+class FailingSink(ArticleSink):
+    """Refuses to write one URL, as a full disk or a failed pipeline call would."""
+
+    def __init__(self, path: str, fail_url: str):
+        super().__init__(path)
+        self.fail_url = fail_url
+
+    async def write(self, article: ArticleData) -> None:
+        if article.url == self.fail_url:
+            raise OSError("write failed")
+        await super().write(article)
+
+
+def test_seen_store_unchanged_does_not_record(tmp_path) -> None:
+    seen = SeenStore(str(tmp_path / "seen.db"))
+    text_hash = content_hash("body")
+
+    assert not seen.unchanged("http://example.com/a", text_hash)
+    assert seen.get("http://example.com/a") is None
+
+    seen.record("http://example.com/a", text_hash)
+    assert seen.unchanged("http://example.com/a", text_hash)
+    assert not seen.unchanged("http://example.com/a", content_hash("edited body"))
+
+
+@pytest.mark.asyncio
+async def test_on_done_only_runs_after_a_successful_write(tmp_path) -> None:
+    site, runner, base_url = await start_site(SiteSpec(pages=5, fanout=5, page_bytes=2000, latency_ms=0))
+    config = CrawlerConfig(max_links=5, concurrency=2, request_delay=0.0, js_fallback=False)
+    fail_url = base_url + "page/2"
+    seen = SeenStore(str(tmp_path / "seen.db"))
+    sink = FailingSink(str(tmp_path / "articles.jsonl"), fail_url)
+
+    def mark_written(url: str, article) -> None:
+        if article is not None:
+            seen.record(url, content_hash(article.content))
+
+    try:
+        async with open_session(config) as session:
+
+            async def process_url(url: str):
+                return await fetch_article(session, url, config)
+
+            written = await asyncio.wait_for(
+                stream_crawl(base_url, config, session, process_url, sink, on_done=mark_written), 30
+            )
+    finally:
+        await sink.close()
+        await runner.cleanup()
+
+    urls = [record["url"] for record in iter_articles(str(tmp_path / "articles.jsonl"))]
+    assert written == len(urls) > 0
+    assert fail_url not in urls
+    assert seen.get(fail_url) is None
+    assert all(seen.get(url) is not None for url in urls)
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_keeps_urls_whose_write_failed(tmp_path) -> None:
+    site, runner, base_url = await start_site(SiteSpec(pages=5, fanout=5, page_bytes=2000, latency_ms=0))
+    config = CrawlerConfig(max_links=5, concurrency=2, request_delay=0.0, js_fallback=False)
+    fail_url = base_url + "page/2"
+    checkpoint = CrawlCheckpoint(str(tmp_path / "state"), base_url)
+    sink = FailingSink(str(tmp_path / "articles.jsonl"), fail_url)
+    try:
+        async with open_session(config) as session:
+
+            async def process_url(url: str):
+                return await fetch_article(session, url, config)
+
+            await asyncio.wait_for(
+                stream_crawl(
+                    base_url, config, session, process_url, sink, state=checkpoint.frontier, on_done=checkpoint.record
+                ),
+                30,
+            )
+    finally:
+        await sink.close()
+        await runner.cleanup()
+        checkpoint.close()
+
+    resumed = CrawlCheckpoint(str(tmp_path / "state"), base_url, resume=True)
+    assert resumed.remaining() == [fail_url]
+    resumed.close()
+
+
+@pytest.mark.asyncio
+async def test_discovery_failure_surfaces_after_workers_finish(tmp_path, monkeypatch) -> None:
+    urls = [f"https://example.com/{i}" for i in range(3)]
+
+    async def failing_discovery(*args, **kwargs):
+        for url in urls:
+            yield url
+        raise RuntimeError("homepage vanished")
+
+    async def slow_process(url: str) -> ArticleData:
+        await asyncio.sleep(0.05)
+        return ArticleData(url=url, title="T", content="Body", source="example.com")
+
+    monkeypatch.setattr(stream, "iter_homepage_links", failing_discovery)
+    config = CrawlerConfig(concurrency=2, js_fallback=False)
+    sink = ArticleSink(str(tmp_path / "articles.jsonl"))
+
+    with pytest.raises(RuntimeError, match="homepage vanished"):
+        await stream_crawl("https://example.com/", config, None, slow_process, sink)
+    # Every queued URL was processed and written before the error reached us.
+    assert sink.written == len(urls)
+    await sink.close()
+
+
+@pytest.mark.asyncio
+async def test_json_output_is_streamed_as_one_array(tmp_path) -> None:
+    path = str(tmp_path / "articles.json")
+    sink = ArticleSink(path, fmt="json")
+    for i in range(3):
+        await sink.write(ArticleData(url=f"https://example.com/{i}", title="T", content="Body", source="example.com"))
+    await sink.close()
+
+    with open(path, encoding="utf-8") as fh:
+        records = json.load(fh)
+    assert [record["url"] for record in records] == [f"https://example.com/{i}" for i in range(3)]
+
+
+@pytest.mark.parametrize("output", ["articles.json", "articles.parquet"])
+def test_resuming_a_stream_rejects_outputs_that_cannot_be_appended(tmp_path, monkeypatch, capsys, output) -> None:
+    argv = ["crawler", "https://example.com/", "--stream", "--resume", "--state-dir", str(tmp_path)]
+    monkeypatch.setattr(sys, "argv", argv + ["--output", str(tmp_path / output)])
+    monkeypatch.setattr(cli, "check_output", lambda path, fmt: None)
+
+    with pytest.raises(SystemExit):
+        asyncio.run(cli.main())
+    assert "use a .jsonl output path" in capsys.readouterr().err
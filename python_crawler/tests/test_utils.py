@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+
+from python_crawler.src.utils import (
+    DomainTrie,
+    UrlFilter,
+    canonicalize_url,
+    combine_patterns,
+    compile_patterns,
+    matches_patterns,
+    strip_query_params,
+)
+
+
+def test_domain_trie_matches_domains_and_subdomains() -> None:
+    trie = DomainTrie(["example.gov", "News.Example.com.", "co.uk"])
+
+    assert trie.match("example.gov")
+    assert trie.match("www.example.gov")
+    assert trie.match("news.example.com")
+    assert trie.match("eu.news.example.com")
+    assert trie.match("bbc.co.uk")
+    assert not trie.match("example.com")
+    assert not trie.match("badexample.gov")
+    assert not trie.match("example.gov.evil.net")
+
+    assert trie.match("news.example.com", subdomains=False)
+    assert not trie.match("eu.news.example.com", subdomains=False)
+    assert not DomainTrie().match("example.gov")
+
+
+def test_strip_query_params_keeps_other_pairs_verbatim() -> None:
+    params = ("utm_*", "fbclid")
+
+    assert strip_query_params("utm_source=x&id=7&UTM_Medium=y&fbclid=z&b=%20", params) == "id=7&b=%20"
+    assert strip_query_params("fbclid2=1", params) == "fbclid2=1"
+    assert strip_query_params("", params) == ""
+    assert canonicalize_url("HTTP://Example.com:80//a//b?utm_source=x#frag", params) == "http://example.com/a/b"
+
+
+@pytest.mark.parametrize(
+    "include, exclude",
+    [
+        ([r"/news/", r"/politics/\d+"], [r"/news/live", r"\?page="]),
+        ([], [r"(?i)/tag/"]),  # a global inline flag cannot be joined into one alternation
+    ],
+)
+def test_combined_patterns_agree_with_separate_ones(include, exclude) -> None:
+    urls = [
+        "https://example.com/news/a",
+        "https://example.com/NEWS/live/today",
+        "https://example.com/politics/12",
+        "https://example.com/tag/x",
+        "https://example.com/news/a?page=2",
+        "https://example.com/sport",
+    ]
+    combined_include, combined_exclude = combine_patterns(include), combine_patterns(exclude)
+
+    for url in urls:
+        expected = matches_patterns(url, compile_patterns(include), compile_patterns(exclude))
+        accepted = not (combined_exclude and combined_exclude.search(url)) and (
+            combined_include is None or bool(combined_include.search(url))
+        )
+        assert accepted == expected, url
+
+
+def test_url_filter_canonicalizes_and_filters() -> None:
+    url_filter = UrlFilter(
+        ["example.com"],
+        include_patterns=[r"/news/"],
+        exclude_patterns=[r"/news/live"],
+        strip_params=["utm_*"],
+    )
+
+    assert url_filter("HTTPS://www.Example.com:443/news//a?utm_source=rss&id=3#top") == (
+        "https://www.example.com/news/a?id=3"
+    )
+    assert url_filter("https://example.com/news/live/feed") is None
+    assert url_filter("https://example.com/sport/a") is None
+    assert url_filter("https://example.com/news/report.PDF") is None
+    assert url_filter("https://example.com/news/v1.2/story") == "https://example.com/news/v1.2/story"
+    assert url_filter("https://other.org/news/a") is None
+    assert url_filter("mailto:desk@example.com") is None
+    assert url_filter("   ") is None
+
+
+def test_url_filter_without_subdomains() -> None:
+    url_filter = UrlFilter(["example.com"], allow_subdomains=False)
+
+    assert url_filter("https://example.com/a") == "https://example.com/a"
+    assert url_filter("https://www.example.com/a") is None